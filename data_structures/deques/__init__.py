@@ -1,2 +1,4 @@
-from deque import Empty
+from async_deque import AsyncDeque
+from circular_array_deque import CircularArrayDeque
+from deque import Closed, Empty
 from list_deque import ListDeque
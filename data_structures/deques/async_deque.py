@@ -0,0 +1,311 @@
+import asyncio
+import collections
+from typing import Any, Union
+
+from circular_array_deque import CircularArrayDeque
+from deque import Closed, Deque, Empty
+
+
+class _Waiters:
+    """Helper class holding the coroutines that are suspended until the deque may have changed, which are resumed in the
+    order in which they started waiting. A resumed coroutine has to check the deque again, and one that's cancelled
+    after being resumed passes its turn on to the next one.
+    """
+
+    def __init__(self):
+        self.__futures = collections.deque()
+
+    def wake_next(self) -> None:
+        """Resume the coroutine that has been waiting the longest, if any"""
+        while len(self.__futures) > 0:
+            future = self.__futures.popleft()
+            if not future.done():
+                future.set_result(None)
+                break
+
+    def wake_all(self) -> None:
+        """Resume all the waiting coroutines"""
+        while len(self.__futures) > 0:
+            future = self.__futures.popleft()
+            if not future.done():
+                future.set_result(None)
+
+    async def wait(self) -> None:
+        """Suspend the calling coroutine until it's resumed"""
+        future = asyncio.get_event_loop().create_future()
+        self.__futures.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.wake_next()
+            else:
+                future.cancel()
+                try:
+                    self.__futures.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+
+class AsyncDeque(Deque):
+    """
+    An async deque is a deque for coroutines running on an asyncio event loop. Enqueueing to a full deque or
+    dequeueing from an empty one suspends the calling coroutine until the operation can proceed. Suspended
+    coroutines are woken in the order in which they started waiting, but a woken coroutine doesn't reserve the
+    element or the space it was woken for, so it may be overtaken by another coroutine and have to wait again. The
+    elements are stored in a circular array deque.
+
+    Instantiate an async deque object that holds at most two elements
+
+        >>> loop = asyncio.new_event_loop()
+        >>> a_deque = AsyncDeque(capacity=2)
+
+    Enqueue and dequeue elements concurrently at either end
+
+        >>> async def produce(n):
+        ...     for i in range(n):
+        ...         await a_deque.enqueue_last(i)
+        >>> async def consume(n):
+        ...     return [await a_deque.dequeue_first() for _ in range(n)]
+        >>> async def produce_and_consume(n):
+        ...     _, elements = await asyncio.gather(produce(n), consume(n))
+        ...     return elements
+        >>> loop.run_until_complete(produce_and_consume(5))
+        [0, 1, 2, 3, 4]
+
+    Close the deque, waiting for the remaining elements to be dequeued
+
+        >>> async def close_and_consume():
+        ...     _, elements = await asyncio.gather(a_deque.aclose(), consume(1))
+        ...     return elements
+        >>> loop.run_until_complete(a_deque.enqueue_first(5))
+        >>> loop.run_until_complete(close_and_consume())
+        [5]
+        >>> loop.run_until_complete(a_deque.dequeue_last())
+        Traceback (most recent call last):
+        ...
+        deque.Closed: Deque is closed
+        >>> loop.close()
+    """
+
+    def __init__(self, capacity: Union[int, None] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+
+        self.__capacity = capacity
+        self.__data_store = CircularArrayDeque()
+        self.__closed = False
+        self.__getters = _Waiters()
+        self.__putters = _Waiters()
+        self.__drainers = _Waiters()
+
+    def __is_full(self) -> bool:
+        """Helper function to check if the deque holds as many elements as its capacity
+
+        :returns: True if deque is full, else False
+        """
+        return self.__capacity is not None and len(self.__data_store) >= self.__capacity
+
+    async def __wait_until_not_full(self) -> None:
+        """Helper function to suspend the calling coroutine until the deque has space for another element
+
+        :raises Closed: if the deque is closed
+        """
+        while True:
+            if self.__closed:
+                raise Closed("Deque is closed")
+            if not self.__is_full():
+                break
+            await self.__putters.wait()
+
+    async def __wait_until_not_empty(self) -> None:
+        """Helper function to suspend the calling coroutine until the deque contains an element
+
+        :raises Closed: if the deque is closed and empty
+        """
+        while self.__data_store.is_empty():
+            if self.__closed:
+                raise Closed("Deque is closed")
+            await self.__getters.wait()
+
+    def __notify_dequeued(self) -> None:
+        """Helper function to resume the coroutines waiting on an element being removed from the deque"""
+        self.__putters.wake_next()
+
+        if self.__data_store.is_empty():
+            self.__drainers.wake_all()
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the deque
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> len(a_deque)
+            1
+            >>> loop.close()
+
+        :returns: count of elements in deque
+        """
+        return len(self.__data_store)
+
+    def get_capacity(self) -> Union[int, None]:
+        """Return the maximum number of elements the deque can hold, None if the deque is unbounded
+
+            >>> AsyncDeque(capacity=2).get_capacity()
+            2
+
+        :returns: capacity of the deque
+        """
+        return self.__capacity
+
+    def is_closed(self) -> bool:
+        """Check if the deque has been closed
+
+            >>> AsyncDeque().is_closed()
+            False
+
+        :returns: True if deque is closed, else False
+        """
+        return self.__closed
+
+    def is_empty(self) -> bool:
+        """Check if deque contains no elements
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> a_deque.is_empty()
+            True
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> a_deque.is_empty()
+            False
+            >>> loop.close()
+
+        :return: True if deque is empty, else False
+        """
+        return self.__data_store.is_empty()
+
+    async def enqueue_first(self, x: Any) -> None:
+        """Insert an element to the front of the deque, waiting for space to become available if the deque is full
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_first(1))
+            >>> loop.close()
+
+        :param x: element to add to the deque
+        :raises Closed: if the deque is closed
+        """
+        await self.__wait_until_not_full()
+        self.__data_store.enqueue_first(x)
+        self.__getters.wake_next()
+
+    async def enqueue_last(self, x: Any) -> None:
+        """Insert an element to the end of the deque, waiting for space to become available if the deque is full
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> loop.close()
+
+        :param x: element to add to the deque
+        :raises Closed: if the deque is closed
+        """
+        await self.__wait_until_not_full()
+        self.__data_store.enqueue_last(x)
+        self.__getters.wake_next()
+
+    async def dequeue_first(self) -> Any:
+        """Remove first element of the deque and return it, waiting for an element to become available if the deque is
+        empty
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> loop.run_until_complete(a_deque.dequeue_first())
+            1
+            >>> loop.close()
+
+        :return: first element of deque
+        :raises Closed: if the deque is closed and empty
+        """
+        await self.__wait_until_not_empty()
+        x = self.__data_store.dequeue_first()
+        self.__notify_dequeued()
+
+        return x
+
+    async def dequeue_last(self) -> Any:
+        """Remove last element of the deque and return it, waiting for an element to become available if the deque is
+        empty
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> loop.run_until_complete(a_deque.dequeue_last())
+            1
+            >>> loop.close()
+
+        :return: last element of deque
+        :raises Closed: if the deque is closed and empty
+        """
+        await self.__wait_until_not_empty()
+        x = self.__data_store.dequeue_last()
+        self.__notify_dequeued()
+
+        return x
+
+    def get_first(self) -> Any:
+        """Return first element of the deque without removing it
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> a_deque.get_first()
+            1
+            >>> loop.close()
+
+        :return: first element of deque
+        """
+        if self.is_empty():
+            raise Empty("Deque is empty")
+        return self.__data_store.get_first()
+
+    def get_last(self) -> Any:
+        """Return last element of the deque without removing it
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.enqueue_last(1))
+            >>> a_deque.get_last()
+            1
+            >>> loop.close()
+
+        :return: last element of deque
+        """
+        if self.is_empty():
+            raise Empty("Deque is empty")
+        return self.__data_store.get_last()
+
+    async def aclose(self) -> None:
+        """Close the deque and wait until all its elements have been dequeued. Coroutines waiting to enqueue, and
+        coroutines that wait to dequeue once the deque is drained, raise Closed.
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_deque = AsyncDeque()
+            >>> loop.run_until_complete(a_deque.aclose())
+            >>> loop.run_until_complete(a_deque.enqueue_first(1))
+            Traceback (most recent call last):
+            ...
+            deque.Closed: Deque is closed
+            >>> loop.close()
+        """
+        self.__closed = True
+        self.__putters.wake_all()
+
+        while not self.__data_store.is_empty():
+            await self.__drainers.wait()
+
+        self.__getters.wake_all()
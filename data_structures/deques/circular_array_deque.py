@@ -0,0 +1,232 @@
+from typing import Any, Union
+
+from deque import Deque, Empty
+
+
+class CircularArrayDeque(Deque):
+    """
+    A deque implemented using a python list as a circular array. The front of the deque is tracked using an index that
+    wraps around the end of the list, so that elements can be added or removed at either end without shifting the
+    other elements. The underlying list doubles in size when it's full, and halves in size when it's a quarter full.
+
+    If a maximum length is set, the deque never grows past it. Adding an element to a full deque discards an element
+    from the opposite end.
+    """
+
+    MINIMUM_CAPACITY = 8
+
+    def __init__(self, maxlen: Union[int, None] = None):
+        if maxlen is not None and maxlen < 1:
+            raise ValueError("Maximum length must be a positive integer")
+
+        self.__maxlen = maxlen
+        self.__data_store = [None] * CircularArrayDeque.MINIMUM_CAPACITY
+        self.__front = 0
+        self.__length = 0
+
+    def __resize(self, capacity: int) -> None:
+        """Helper function to move the elements of the deque into a list of the passed capacity. Time complexity: O(n).
+
+        :param capacity: size of the new list
+        """
+        old_data_store = self.__data_store
+        old_capacity = len(old_data_store)
+        front = self.__front
+        data_store = [None] * capacity
+
+        for i in range(self.__length):
+            data_store[i] = old_data_store[(front + i) % old_capacity]
+
+        self.__data_store = data_store
+        self.__front = 0
+
+    def __grow(self) -> None:
+        """Helper function to double the capacity of the underlying list when it's full"""
+        capacity = len(self.__data_store)
+        if self.__length == capacity:
+            if self.__maxlen is not None:
+                capacity = min(2 * capacity, self.__maxlen)
+            else:
+                capacity = 2 * capacity
+            self.__resize(capacity)
+
+    def __shrink(self) -> None:
+        """Helper function to halve the capacity of the underlying list when it's a quarter full"""
+        capacity = len(self.__data_store)
+        if (
+            capacity > CircularArrayDeque.MINIMUM_CAPACITY
+            and self.__length <= capacity // 4
+        ):
+            self.__resize(max(capacity // 2, CircularArrayDeque.MINIMUM_CAPACITY))
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the deque
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.enqueue_last(1)
+            >>> len(a_deque)
+            1
+
+        :returns: count of elements in deque
+        """
+        return self.__length
+
+    def __getitem__(self, idx: int) -> Any:
+        """Get the element at the passed index, counting from the front of the deque. Time complexity: O(1).
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.enqueue_last(2)
+            >>> a_deque.enqueue_first(0)
+            >>> a_deque[0], a_deque[2], a_deque[-1]
+            (0, 2, 2)
+
+        :param idx: index of the element, negative indices count from the end of the deque
+        :returns: the element at the index
+        """
+        if idx < 0:
+            idx += self.__length
+        if not 0 <= idx < self.__length:
+            raise IndexError("Deque index out of range")
+
+        return self.__data_store[(self.__front + idx) % len(self.__data_store)]
+
+    def get_maxlen(self) -> Union[int, None]:
+        """Return the maximum length of the deque, None if the deque is unbounded
+
+            >>> CircularArrayDeque(maxlen=3).get_maxlen()
+            3
+            >>> CircularArrayDeque().get_maxlen() is None
+            True
+
+        :returns: maximum number of elements the deque can hold
+        """
+        return self.__maxlen
+
+    def is_empty(self) -> bool:
+        """Check if deque contains no elements
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.is_empty()
+            True
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.is_empty()
+            False
+
+        :return: True if deque is empty, else False
+        """
+        return self.__length == 0
+
+    def enqueue_first(self, x: Any) -> None:
+        """Insert an element to the front of the deque. If the deque is at its maximum length, the last element is
+        discarded. Time complexity: amortized O(1).
+
+            >>> a_deque = CircularArrayDeque(maxlen=2)
+            >>> a_deque.enqueue_first(1)
+            >>> a_deque.enqueue_first(2)
+            >>> a_deque.enqueue_first(3)
+            >>> a_deque.get_first(), a_deque.get_last()
+            (3, 2)
+
+        :param x: element to add to the deque
+        """
+        if self.__length == self.__maxlen:
+            self.dequeue_last()
+
+        self.__grow()
+        self.__front = (self.__front - 1) % len(self.__data_store)
+        self.__data_store[self.__front] = x
+        self.__length += 1
+
+    def enqueue_last(self, x: Any) -> None:
+        """Insert an element to the end of the deque. If the deque is at its maximum length, the first element is
+        discarded. Time complexity: amortized O(1).
+
+            >>> a_deque = CircularArrayDeque(maxlen=2)
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.enqueue_last(2)
+            >>> a_deque.enqueue_last(3)
+            >>> a_deque.get_first(), a_deque.get_last()
+            (2, 3)
+
+        :param x: element to add to the deque
+        """
+        if self.__length == self.__maxlen:
+            self.dequeue_first()
+
+        self.__grow()
+        idx = (self.__front + self.__length) % len(self.__data_store)
+        self.__data_store[idx] = x
+        self.__length += 1
+
+    def dequeue_first(self) -> Any:
+        """Remove first element of the deque and return it. Time complexity: amortized O(1).
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.dequeue_first()
+            1
+
+        :return: first element of deque
+        """
+        if self.is_empty():
+            raise Empty("Deque is empty")
+
+        x = self.__data_store[self.__front]
+        self.__data_store[self.__front] = None
+        self.__front = (self.__front + 1) % len(self.__data_store)
+        self.__length -= 1
+        self.__shrink()
+
+        return x
+
+    def dequeue_last(self) -> Any:
+        """Remove last element of the deque and return it. Time complexity: amortized O(1).
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.dequeue_last()
+            1
+
+        :return: last element of deque
+        """
+        if self.is_empty():
+            raise Empty("Deque is empty")
+
+        idx = (self.__front + self.__length - 1) % len(self.__data_store)
+        x = self.__data_store[idx]
+        self.__data_store[idx] = None
+        self.__length -= 1
+        self.__shrink()
+
+        return x
+
+    def get_first(self) -> Any:
+        """Return first element of the deque without removing it. Time complexity: O(1).
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.get_first()
+            1
+
+        :return: first element of deque
+        """
+        if self.is_empty():
+            raise Empty("Deque is empty")
+        return self.__data_store[self.__front]
+
+    def get_last(self) -> Any:
+        """Return last element of the deque without removing it. Time complexity: O(1).
+
+            >>> a_deque = CircularArrayDeque()
+            >>> a_deque.enqueue_last(1)
+            >>> a_deque.get_last()
+            1
+
+        :return: last element of deque
+        """
+        if self.is_empty():
+            raise Empty("Deque is empty")
+        return self.__data_store[
+            (self.__front + self.__length - 1) % len(self.__data_store)
+        ]
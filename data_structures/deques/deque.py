@@ -6,6 +6,10 @@ class Empty(Exception):
     pass
 
 
+class Closed(Exception):
+    pass
+
+
 class Deque(ABC):
     """A deque is an ADT that supports insertion and removal of elements from either end. It's also referred to
     as a double-ended queue.
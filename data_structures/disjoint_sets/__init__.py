@@ -0,0 +1,2 @@
+from array_disjoint_set import ArrayDisjointSet
+from dict_disjoint_set import DictDisjointSet
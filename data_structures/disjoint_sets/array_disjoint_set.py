@@ -0,0 +1,173 @@
+from disjoint_set import DisjointSet
+
+
+class ArrayDisjointSet(DisjointSet):
+    """An array disjoint set is a disjoint set whose elements are the integers 0 to n - 1, stored as indices into
+    arrays. Each element's slot holds the element that's its parent within a tree, and the root of each tree is the
+    representative of a set. Finding a representative compresses the path to the root, such that every element on the
+    path becomes a child of the root, and a union attaches the root of the tree of lower rank to the other root. Both
+    operations take O(α(n)) amortized time, where α is the inverse Ackermann function, which is at most 4 for any
+    practical n.
+
+    Instantiate a disjoint set of the elements 0 to 4
+
+        >>> a_disjoint_set = ArrayDisjointSet(5)
+
+    Merge sets
+
+        >>> a_disjoint_set.union(0, 1)
+        True
+        >>> a_disjoint_set.union(3, 4)
+        True
+        >>> a_disjoint_set.union(1, 0)
+        False
+
+    Check if elements are in the same set
+
+        >>> a_disjoint_set.is_connected(0, 1)
+        True
+        >>> a_disjoint_set.is_connected(1, 3)
+        False
+
+    Get the number of sets and the size of some set
+
+        >>> a_disjoint_set.get_set_count()
+        3
+        >>> a_disjoint_set.get_set_size(4)
+        2
+    """
+
+    def __init__(self, size: int = 0):
+        """
+        :param size: the number of elements, which are the integers 0 to size - 1
+        """
+        if size < 0:
+            raise ValueError("Size must be a non-negative integer")
+
+        self.__parents = list(range(size))
+        self.__ranks = bytearray(size)
+        self.__sizes = [1] * size
+        self.__set_count = size
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the disjoint set
+
+            >>> len(ArrayDisjointSet(3))
+            3
+
+        :returns: count of elements in the disjoint set
+        """
+        return len(self.__parents)
+
+    def __contains__(self, x: int) -> bool:
+        """Check if an element is stored in the disjoint set
+
+            >>> a_disjoint_set = ArrayDisjointSet(3)
+            >>> 2 in a_disjoint_set
+            True
+            >>> 3 in a_disjoint_set
+            False
+
+        :param x: the element to check
+        :returns: True if the element is in the disjoint set, else False
+        """
+        return isinstance(x, int) and 0 <= x < len(self.__parents)
+
+    def __check_element(self, x: int) -> None:
+        """Helper function to raise a KeyError if an element isn't stored in the disjoint set
+
+        :param x: the element to check
+        """
+        if x not in self:
+            raise KeyError(f"{x} is absent from the disjoint set")
+
+    def make_set(self, x: int) -> None:
+        """Add the next integer to the disjoint set, in a new set that only contains it. Time complexity: O(1).
+
+            >>> a_disjoint_set = ArrayDisjointSet(2)
+            >>> a_disjoint_set.make_set(2)
+            >>> a_disjoint_set.get_set_count()
+            3
+
+        :param x: the element to add, which must be equal to the number of elements in the disjoint set
+        """
+        if x != len(self.__parents):
+            raise ValueError(f"Expected element {len(self.__parents)}, got {x}")
+
+        self.__parents.append(x)
+        self.__ranks.append(0)
+        self.__sizes.append(1)
+        self.__set_count += 1
+
+    def find(self, x: int) -> int:
+        """Return the representative of the set containing an element. Time complexity: O(α(n)) amortized.
+
+            >>> a_disjoint_set = ArrayDisjointSet(2)
+            >>> a_disjoint_set.find(1)
+            1
+
+        :param x: the element whose set's representative is being sought
+        :returns: the representative of the set
+        """
+        self.__check_element(x)
+
+        parents = self.__parents
+        root = x
+        while parents[root] != root:
+            root = parents[root]
+
+        while parents[x] != root:
+            parents[x], x = root, parents[x]
+
+        return root
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets containing two elements. Time complexity: O(α(n)) amortized.
+
+            >>> a_disjoint_set = ArrayDisjointSet(2)
+            >>> a_disjoint_set.union(0, 1)
+            True
+
+        :param x: an element of the first set
+        :param y: an element of the second set
+        :returns: True if the sets were merged, False if the elements were already in the same set
+        """
+        x = self.find(x)
+        y = self.find(y)
+
+        if x == y:
+            return False
+
+        if self.__ranks[x] < self.__ranks[y]:
+            x, y = y, x
+
+        self.__parents[y] = x
+        self.__sizes[x] += self.__sizes[y]
+        if self.__ranks[x] == self.__ranks[y]:
+            self.__ranks[x] += 1
+        self.__set_count -= 1
+
+        return True
+
+    def get_set_size(self, x: int) -> int:
+        """Return the number of elements in the set containing an element. Time complexity: O(α(n)) amortized.
+
+            >>> a_disjoint_set = ArrayDisjointSet(3)
+            >>> _ = a_disjoint_set.union(0, 2)
+            >>> a_disjoint_set.get_set_size(2)
+            2
+
+        :param x: an element of the set
+        :returns: count of elements in the set
+        """
+        return self.__sizes[self.find(x)]
+
+    def get_set_count(self) -> int:
+        """Return the number of sets in the disjoint set. Time complexity: O(1).
+
+            >>> ArrayDisjointSet(3).get_set_count()
+            3
+
+        :returns: count of sets
+        """
+        return self.__set_count
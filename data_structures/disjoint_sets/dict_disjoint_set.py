@@ -0,0 +1,163 @@
+from typing import Any, Iterable
+
+from disjoint_set import DisjointSet
+
+
+class DictDisjointSet(DisjointSet):
+    """A dict disjoint set is a disjoint set whose elements can be any hashable objects. Each element is mapped to the
+    element that's its parent within a tree, and the root of each tree is the representative of a set. Finding a
+    representative compresses the path to the root, such that every element on the path becomes a child of the root,
+    and a union attaches the root of the tree of lower rank to the other root. Both operations take O(α(n)) amortized
+    time, where α is the inverse Ackermann function, which is at most 4 for any practical n.
+
+    Instantiate a disjoint set of some elements
+
+        >>> a_disjoint_set = DictDisjointSet(["a", "b", "c"])
+
+    Add an element
+
+        >>> a_disjoint_set.make_set("d")
+
+    Merge sets
+
+        >>> a_disjoint_set.union("a", "b")
+        True
+        >>> a_disjoint_set.union("c", "d")
+        True
+        >>> a_disjoint_set.union("b", "a")
+        False
+
+    Check if elements are in the same set
+
+        >>> a_disjoint_set.is_connected("a", "b")
+        True
+        >>> a_disjoint_set.is_connected("b", "c")
+        False
+
+    Get the number of sets and the size of some set
+
+        >>> a_disjoint_set.get_set_count()
+        2
+        >>> a_disjoint_set.get_set_size("d")
+        2
+    """
+
+    def __init__(self, elements: Iterable = ()):
+        """
+        :param elements: the initial elements, each in a set of its own
+        """
+        self.__parents = {}
+        self.__ranks = {}
+        self.__sizes = {}
+
+        for x in elements:
+            self.make_set(x)
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the disjoint set
+
+            >>> len(DictDisjointSet(["a", "b"]))
+            2
+
+        :returns: count of elements in the disjoint set
+        """
+        return len(self.__parents)
+
+    def __contains__(self, x: Any) -> bool:
+        """Check if an element is stored in the disjoint set
+
+            >>> "a" in DictDisjointSet(["a", "b"])
+            True
+
+        :param x: the element to check
+        :returns: True if the element is in the disjoint set, else False
+        """
+        return x in self.__parents
+
+    def make_set(self, x: Any) -> None:
+        """Add an element to the disjoint set, in a new set that only contains the element. Time complexity: O(1).
+
+            >>> a_disjoint_set = DictDisjointSet()
+            >>> a_disjoint_set.make_set("a")
+            >>> a_disjoint_set.get_set_count()
+            1
+
+        :param x: the element to add
+        """
+        if x in self.__parents:
+            raise KeyError(f"{x} already exists in the disjoint set")
+
+        self.__parents[x] = x
+        self.__ranks[x] = 0
+        self.__sizes[x] = 1
+
+    def find(self, x: Any) -> Any:
+        """Return the representative of the set containing an element. Time complexity: O(α(n)) amortized.
+
+            >>> DictDisjointSet(["a", "b"]).find("b")
+            'b'
+
+        :param x: the element whose set's representative is being sought
+        :returns: the representative of the set
+        """
+        if x not in self.__parents:
+            raise KeyError(f"{x} is absent from the disjoint set")
+
+        parents = self.__parents
+        root = x
+        while parents[root] != root:
+            root = parents[root]
+
+        while parents[x] != root:
+            parents[x], x = root, parents[x]
+
+        return root
+
+    def union(self, x: Any, y: Any) -> bool:
+        """Merge the sets containing two elements. Time complexity: O(α(n)) amortized.
+
+            >>> DictDisjointSet(["a", "b"]).union("a", "b")
+            True
+
+        :param x: an element of the first set
+        :param y: an element of the second set
+        :returns: True if the sets were merged, False if the elements were already in the same set
+        """
+        x = self.find(x)
+        y = self.find(y)
+
+        if x == y:
+            return False
+
+        if self.__ranks[x] < self.__ranks[y]:
+            x, y = y, x
+
+        self.__parents[y] = x
+        self.__sizes[x] += self.__sizes.pop(y)
+        if self.__ranks[x] == self.__ranks[y]:
+            self.__ranks[x] += 1
+
+        return True
+
+    def get_set_size(self, x: Any) -> int:
+        """Return the number of elements in the set containing an element. Time complexity: O(α(n)) amortized.
+
+            >>> a_disjoint_set = DictDisjointSet(["a", "b", "c"])
+            >>> _ = a_disjoint_set.union("a", "c")
+            >>> a_disjoint_set.get_set_size("c")
+            2
+
+        :param x: an element of the set
+        :returns: count of elements in the set
+        """
+        return self.__sizes[self.find(x)]
+
+    def get_set_count(self) -> int:
+        """Return the number of sets in the disjoint set. Time complexity: O(1).
+
+            >>> DictDisjointSet(["a", "b"]).get_set_count()
+            2
+
+        :returns: count of sets
+        """
+        return len(self.__sizes)
@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class DisjointSet(ABC):
+    """A disjoint set, also known as union-find, is an ADT that keeps track of elements partitioned into sets that
+    don't overlap. Each set is identified by one of its elements, its representative. Sets can be merged, and the sets
+    containing any two elements can be compared by comparing their representatives.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the disjoint set
+
+        :returns: count of elements in the disjoint set
+        """
+        pass
+
+    @abstractmethod
+    def __contains__(self, x: Any) -> bool:
+        """Check if an element is stored in the disjoint set
+
+        :param x: the element to check
+        :returns: True if the element is in the disjoint set, else False
+        """
+        pass
+
+    @abstractmethod
+    def make_set(self, x: Any) -> None:
+        """Add an element to the disjoint set, in a new set that only contains the element
+
+        :param x: the element to add
+        """
+        pass
+
+    @abstractmethod
+    def find(self, x: Any) -> Any:
+        """Return the representative of the set containing an element
+
+        :param x: the element whose set's representative is being sought
+        :returns: the representative of the set
+        """
+        pass
+
+    @abstractmethod
+    def union(self, x: Any, y: Any) -> bool:
+        """Merge the sets containing two elements
+
+        :param x: an element of the first set
+        :param y: an element of the second set
+        :returns: True if the sets were merged, False if the elements were already in the same set
+        """
+        pass
+
+    @abstractmethod
+    def get_set_size(self, x: Any) -> int:
+        """Return the number of elements in the set containing an element
+
+        :param x: an element of the set
+        :returns: count of elements in the set
+        """
+        pass
+
+    @abstractmethod
+    def get_set_count(self) -> int:
+        """Return the number of sets in the disjoint set
+
+        :returns: count of sets
+        """
+        pass
+
+    def is_connected(self, x: Any, y: Any) -> bool:
+        """Check if two elements are in the same set
+
+        :param x: the first element
+        :param y: the second element
+        :returns: True if the elements are in the same set, else False
+        """
+        return self.find(x) == self.find(y)
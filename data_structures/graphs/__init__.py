@@ -1,2 +1,30 @@
 from adjacency_list_graph import AdjacencyListGraph
 from adjacency_matrix_graph import AdjacencyMatrixGraph
+from centrality import degree_centrality, get_sparse_arrays, hits, pagerank
+from compressed_sparse_row_graph import CompressedSparseRowGraph
+from connectivity import ConnectivityIndex
+from directed_graph_algorithms import (
+    CycleError,
+    condensation,
+    find_cycle,
+    strongly_connected_components,
+    topological_sort,
+)
+from edge_lists import (
+    read_binary_edge_list,
+    read_edge_list,
+    write_binary_edge_list,
+    write_edge_list,
+)
+from memory_mapped_graph import MemoryMappedGraph, write_memory_mapped_graph
+from minimum_spanning_trees import kruskal, prim
+from numpy_adjacency_matrix_graph import NumpyAdjacencyMatrixGraph
+from parallel_graph_analytics import ParallelGraphAnalytics
+from shortest_paths import (
+    NegativeCycle,
+    ShortestPaths,
+    a_star,
+    bellman_ford,
+    bidirectional_dijkstra,
+    dijkstra,
+)
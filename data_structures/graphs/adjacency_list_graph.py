@@ -1,4 +1,4 @@
-from typing import Any, Generator
+from typing import Any, Generator, Union
 
 from graph import Graph
 
@@ -7,11 +7,22 @@ class AdjacencyListGraph(Graph):
     """ An adjacency list graph is a graph implemented based on a mapping of each vertex to a list of all vertices that
     are adjacent to it.
 
+    Optionally, the graph can also maintain a mapping of each vertex to a list of the vertices whose edges enter it.
+    Incoming and adjacent vertices are then found in time proportional to the degree of the vertex, instead of by
+    scanning every edge in the graph, at the cost of storing each edge twice. Removing a vertex from such a graph also
+    removes the edges that enter it.
+
     Instantiate an adjacency list graph object
 
         >>> directed_graph = AdjacencyListGraph(directed=True)
         >>> undirected_graph = AdjacencyListGraph(directed=False)
 
+    Instantiate an adjacency list graph object from an iterable of edges
+
+        >>> edges = [(1, 2, 100), (2, 3, 200), (3, 1, None)]
+        >>> AdjacencyListGraph.from_edges(edges, directed=True, vertices=[(4, 4000)]).get_edges()
+        [(1, 2, 100), (2, 3, 200), (3, 1, None)]
+
     Check if a graph is directed
 
         >>> directed_graph.is_directed()
@@ -169,6 +180,12 @@ class AdjacencyListGraph(Graph):
         >>> [i for i in undirected_graph.depth_first_traversal(1)]
         [(1, 1), (2, 2), (3, 3), (5, 4), (4, 8)]
 
+    Discovery and finish events of a depth-first traversal of a graph
+
+        >>> [i for i in directed_graph.depth_first_events(2)]
+        [('discover', 2, 1), ('discover', 3, 2), ('discover', 5, 3), ('finish', 5, 4), ('finish', 3, 5), \
+('finish', 2, 6)]
+
     Breadth-first traversal of a graph
 
         >>> [i for i in directed_graph.breadth_first_traversal(1)]
@@ -177,6 +194,31 @@ class AdjacencyListGraph(Graph):
         >>> [i for i in undirected_graph.breadth_first_traversal(1)]
         [(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)]
 
+    Breadth-first traversal of a graph a level at a time, from several vertices and up to some depth
+
+        >>> [i for i in directed_graph.breadth_first_levels([2, 4])]
+        [[2, 4], [3, 5]]
+        >>> [i for i in directed_graph.breadth_first_levels([1], max_depth=1)]
+        [[1], [2, 3, 4]]
+
+    Index the incoming edges of each vertex
+
+        >>> indexed_graph = AdjacencyListGraph(directed=True, index_incoming_edges=True)
+        >>> indexed_graph.is_incoming_edges_indexed()
+        True
+        >>> for key in [1, 2, 3]:
+        ...     indexed_graph.add_vertex(key)
+        >>> indexed_graph.add_edge(1, 2, 100)
+        >>> indexed_graph.add_edge(3, 2, 200)
+        >>> indexed_graph.add_edge(2, 3, 300)
+        >>> indexed_graph.get_incoming_adjacent_vertices(2)
+        [(1, 100), (3, 200)]
+        >>> indexed_graph.get_adjacent_vertices(2)
+        [(1, 100), (3, 300), (3, 200)]
+        >>> indexed_graph.remove_vertex(1)
+        >>> indexed_graph.get_incoming_adjacent_vertices(2)
+        [(3, 200)]
+
     Delete an edge
 
         >>> directed_graph.remove_edge(1, 2)
@@ -190,9 +232,10 @@ class AdjacencyListGraph(Graph):
         >>> undirected_graph.remove_vertex(1)
     """
 
-    def __init__(self, directed):
+    def __init__(self, directed, index_incoming_edges: bool = False):
         super().__init__(directed)
         self.__adjacency_list = {}
+        self.__incoming_list = {} if index_incoming_edges else None
 
     def __repr__(self) -> str:
         s = "{\n"
@@ -202,15 +245,82 @@ class AdjacencyListGraph(Graph):
 
         return s
 
+    def __get_indexed_incoming(self, key: Any, before: Union[bool, None]) -> list:
+        """Helper function to get the (key, weight) pairs of the edges entering the vertex of the passed key from the
+        incoming edges index, ordered by the position of their source vertices in the graph and excluding self-loops.
+        Time complexity: O(d log d), where d is the degree of the vertex.
+
+        :param key: the key of the vertex
+        :param before: True to only include source vertices added before the vertex, False to only include source
+            vertices added after it, None to include both
+        :returns: list of (key, weight) pairs
+        """
+        idx = self._indices[key]
+        vertices = []
+
+        for k, weight in sorted(
+            self.__incoming_list[key], key=lambda i: self._indices[i[0]]
+        ):
+            k_idx = self._indices[k]
+            if (
+                k_idx == idx
+                or (before is True and k_idx > idx)
+                or (before is False and k_idx < idx)
+            ):
+                continue
+            vertices.append((k, weight))
+
+        return vertices
+
+    def is_incoming_edges_indexed(self) -> bool:
+        """Check if the graph maintains an index of the incoming edges of each vertex
+
+        :returns: True if incoming edges are indexed, else False
+        """
+        return self.__incoming_list is not None
+
     def _get_next_vertices(self, key):
         super()._get_next_vertices(key)
         return self.__adjacency_list[key]
 
+    def _load_edges(self, vertices, edges):
+        for key, value in vertices:
+            self.add_vertex(key, value)
+
+        adjacency_list = self.__adjacency_list
+        incoming_list = self.__incoming_list
+
+        for key1, key2, weight in edges:
+            if key1 not in adjacency_list:
+                self.add_vertex(key1)
+            if key2 not in adjacency_list:
+                self.add_vertex(key2)
+
+            adjacency_list[key1].append((key2, weight))
+            if incoming_list is not None:
+                incoming_list[key2].append((key1, weight))
+
     def add_vertex(self, key: Any, value: Any = None) -> None:
         super().add_vertex(key, value)
         self.__adjacency_list[key] = []
 
+        if self.__incoming_list is not None:
+            self.__incoming_list[key] = []
+
     def remove_vertex(self, key: Any) -> None:
+        if self.__incoming_list is not None and key in self:
+            for k, _ in self.__adjacency_list[key]:
+                if k != key:
+                    self.__incoming_list[k] = [
+                        i for i in self.__incoming_list[k] if i[0] != key
+                    ]
+            for k, _ in self.__incoming_list[key]:
+                if k != key:
+                    self.__adjacency_list[k] = [
+                        i for i in self.__adjacency_list[k] if i[0] != key
+                    ]
+            del self.__incoming_list[key]
+
         super().remove_vertex(key)
         del self.__adjacency_list[key]
 
@@ -218,18 +328,25 @@ class AdjacencyListGraph(Graph):
         super().add_edge(key1, key2, weight)
         self.__adjacency_list[key1].append((key2, weight))
 
+        if self.__incoming_list is not None:
+            self.__incoming_list[key2].append((key1, weight))
+
     def remove_edge(self, key1: Any, key2: Any) -> None:
         super().remove_edge(key1, key2)
 
-        for i in self.get_adjacent_vertices(key1):
+        for i in self.__adjacency_list[key1]:
             if key2 == i[0]:
                 self.__adjacency_list[key1].remove(i)
+                if self.__incoming_list is not None:
+                    self.__incoming_list[key2].remove((key1, i[1]))
                 return
 
         if not self.is_directed():
-            for i in self.get_adjacent_vertices(key2):
+            for i in self.__adjacency_list[key2]:
                 if key1 == i[0]:
                     self.__adjacency_list[key2].remove(i)
+                    if self.__incoming_list is not None:
+                        self.__incoming_list[key1].remove((key2, i[1]))
                     return
 
         raise ValueError(f"Edge ({key1}, {key2}) is absent from the graph")
@@ -240,6 +357,13 @@ class AdjacencyListGraph(Graph):
     def get_adjacent_vertices(self, key: Any) -> list:
         super().get_adjacent_vertices(key)
 
+        if self.__incoming_list is not None:
+            return (
+                self.__get_indexed_incoming(key, True)
+                + self.__adjacency_list[key]
+                + self.__get_indexed_incoming(key, False)
+            )
+
         vertices = []
 
         for k, adjacent in self.__adjacency_list.items():
@@ -255,6 +379,12 @@ class AdjacencyListGraph(Graph):
     def get_incoming_adjacent_vertices(self, key: Any) -> list:
         super().get_incoming_adjacent_vertices(key)
 
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        if self.__incoming_list is not None:
+            return self.__get_indexed_incoming(key, None)
+
         vertices = []
 
         for k, adjacent in self.__adjacency_list.items():
@@ -262,27 +392,16 @@ class AdjacencyListGraph(Graph):
                 for i in adjacent:
                     if i[0] == key:
                         vertices.append((k, i[1]))
-            else:
-                if not self.is_directed():
-                    vertices.extend(adjacent)
 
         return vertices
 
     def get_outgoing_adjacent_vertices(self, key: Any) -> list:
         super().get_outgoing_adjacent_vertices(key)
 
-        vertices = []
-
-        for k, adjacent in self.__adjacency_list.items():
-            if k != key:
-                if not self.is_directed():
-                    for i in adjacent:
-                        if i[0] == key:
-                            vertices.append((k, i[1]))
-            else:
-                vertices.extend(adjacent)
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
 
-        return vertices
+        return list(self.__adjacency_list[key])
 
     def get_edge_weight(self, key1: Any, key2: Any) -> float:
         return super().get_edge_weight(key1, key2)
@@ -210,7 +210,7 @@ class AdjacencyMatrixGraph(Graph):
     def _get_next_vertices(self, key):
         super()._get_next_vertices(key)
 
-        idx = self._keys.index(key)
+        idx = self._indices[key]
         row = self.__adjacency_matrix[idx]
 
         return [
@@ -219,6 +219,31 @@ class AdjacencyMatrixGraph(Graph):
             if not isinstance(weight, AdjacencyMatrixGraph._Empty)
         ]
 
+    def _load_edges(self, vertices, edges):
+        for key, value in vertices:
+            super().add_vertex(key, value)
+
+        cells = []
+
+        for key1, key2, weight in edges:
+            if key1 not in self:
+                super().add_vertex(key1)
+            if key2 not in self:
+                super().add_vertex(key2)
+
+            cells.append((self._indices[key1], self._indices[key2], weight))
+
+        n = len(self._keys)
+        empty = AdjacencyMatrixGraph._Empty()
+
+        for row in self.__adjacency_matrix:
+            row.extend([empty] * (n - len(row)))
+        for _ in range(n - len(self.__adjacency_matrix)):
+            self.__adjacency_matrix.append([empty] * n)
+
+        for idx1, idx2, weight in cells:
+            self.__adjacency_matrix[idx1][idx2] = weight
+
     def add_vertex(self, key: Any, value: Any = None) -> None:
         super().add_vertex(key, value)
         self.__adjacency_matrix.append(
@@ -229,9 +254,7 @@ class AdjacencyMatrixGraph(Graph):
             row.append(AdjacencyMatrixGraph._Empty())
 
     def remove_vertex(self, key: Any) -> None:
-        idx = None
-        if key in self:
-            idx = self._keys.index(key)
+        idx = self._indices.get(key)
 
         super().remove_vertex(key)
         del self.__adjacency_matrix[idx]
@@ -242,28 +265,28 @@ class AdjacencyMatrixGraph(Graph):
     def add_edge(self, key1: Any, key2: Any, weight: float = None) -> None:
         super().add_edge(key1, key2, weight)
 
-        idx1 = self._keys.index(key1)
-        idx2 = self._keys.index(key2)
+        idx1 = self._indices[key1]
+        idx2 = self._indices[key2]
 
         self.__adjacency_matrix[idx1][idx2] = weight
 
     def remove_edge(self, key1: Any, key2: Any) -> None:
         super().remove_edge(key1, key2)
 
-        for i in self.get_adjacent_vertices(key1):
-            if key2 == i[0]:
-                idx1 = self._keys.index(key1)
-                idx2 = self._keys.index(key2)
-                self.__adjacency_matrix[idx1][idx2] = AdjacencyMatrixGraph._Empty()
-                return
-
-        if not self.is_directed():
-            for i in self.get_adjacent_vertices(key2):
-                if key1 == i[0]:
-                    idx1 = self._keys.index(key1)
-                    idx2 = self._keys.index(key2)
-                    self.__adjacency_matrix[idx2][idx1] = AdjacencyMatrixGraph._Empty()
-                    return
+        idx1 = self._indices[key1]
+        idx2 = self._indices[key2]
+
+        if not isinstance(
+            self.__adjacency_matrix[idx1][idx2], AdjacencyMatrixGraph._Empty
+        ):
+            self.__adjacency_matrix[idx1][idx2] = AdjacencyMatrixGraph._Empty()
+            return
+
+        if not self.is_directed() and not isinstance(
+            self.__adjacency_matrix[idx2][idx1], AdjacencyMatrixGraph._Empty
+        ):
+            self.__adjacency_matrix[idx2][idx1] = AdjacencyMatrixGraph._Empty()
+            return
 
         raise ValueError(f"Edge ({key1}, {key2}) is absent from the graph")
 
@@ -273,14 +296,14 @@ class AdjacencyMatrixGraph(Graph):
     def get_adjacent_vertices(self, key: Any) -> list:
         super().get_adjacent_vertices(key)
 
-        idx = self._keys.index(key)
+        idx = self._indices[key]
         vertices = []
 
         for i, row in enumerate(self.__adjacency_matrix):
             if i != idx:
-                for j, weight in enumerate(row):
-                    if j == idx and not isinstance(weight, AdjacencyMatrixGraph._Empty):
-                        vertices.append((self._keys[i], weight))
+                weight = row[idx]
+                if not isinstance(weight, AdjacencyMatrixGraph._Empty):
+                    vertices.append((self._keys[i], weight))
             else:
                 vertices.extend(
                     [
@@ -295,14 +318,14 @@ class AdjacencyMatrixGraph(Graph):
     def get_incoming_adjacent_vertices(self, key: Any) -> list:
         super().get_incoming_adjacent_vertices(key)
 
-        idx = self._keys.index(key)
+        idx = self._indices[key]
         vertices = []
 
         for i, row in enumerate(self.__adjacency_matrix):
             if i != idx:
-                for j, weight in enumerate(row):
-                    if j == idx and not isinstance(weight, AdjacencyMatrixGraph._Empty):
-                        vertices.append((self._keys[i], weight))
+                weight = row[idx]
+                if not isinstance(weight, AdjacencyMatrixGraph._Empty):
+                    vertices.append((self._keys[i], weight))
             else:
                 if not self.is_directed():
                     vertices.extend(
@@ -318,17 +341,15 @@ class AdjacencyMatrixGraph(Graph):
     def get_outgoing_adjacent_vertices(self, key: Any) -> list:
         super().get_outgoing_adjacent_vertices(key)
 
-        idx = self._keys.index(key)
+        idx = self._indices[key]
         vertices = []
 
         for i, row in enumerate(self.__adjacency_matrix):
             if i != idx:
                 if not self.is_directed():
-                    for j, weight in enumerate(row):
-                        if j == idx and not isinstance(
-                            weight, AdjacencyMatrixGraph._Empty
-                        ):
-                            vertices.append((self._keys[i], weight))
+                    weight = row[idx]
+                    if not isinstance(weight, AdjacencyMatrixGraph._Empty):
+                        vertices.append((self._keys[i], weight))
             else:
                 vertices.extend(
                     [
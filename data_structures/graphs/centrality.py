@@ -0,0 +1,243 @@
+from typing import Callable, Tuple, Union
+
+from graph import Graph
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:  # pragma: no cover - scipy is optional
+    sparse = None
+
+
+def get_sparse_arrays(graph: Graph) -> Tuple[list, "np.ndarray", "np.ndarray"]:
+    """Export the edges of a graph to NumPy arrays of integer vertex ids, such that the edges lead from sources[i] to
+    targets[i]. Vertex ids are positions within get_vertices(). Edges are exported in the direction of
+    get_outgoing_adjacent_vertices(), so both ways in an undirected graph, and each pair of vertices is connected at
+    most once. Time complexity: O(V + ElogE).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=False)
+    >>> for key in ["a", "b", "c"]:
+    ...     a_graph.add_vertex(key)
+    >>> a_graph.add_edge("a", "b")
+    >>> keys, sources, targets = get_sparse_arrays(a_graph)
+    >>> keys, sources.tolist(), targets.tolist()
+    (['a', 'b', 'c'], [0, 1], [1, 0])
+
+    :param graph: the graph to export
+    :returns: the keys of the vertices indexed by id, and the arrays of source and target ids of the edges
+    """
+    if np is None:
+        raise ImportError("Centrality measures require numpy")
+
+    keys = list(graph.get_vertices())
+    indices = {key: i for i, key in enumerate(keys)}
+    sources = []
+    targets = []
+
+    for key1 in keys:
+        i = indices[key1]
+        for key2, _ in graph._get_next_vertices(key1):
+            sources.append(i)
+            targets.append(indices[key2])
+
+    sources = np.array(sources, dtype=np.int64)
+    targets = np.array(targets, dtype=np.int64)
+
+    if not graph.is_directed():
+        sources, targets = (
+            np.concatenate((sources, targets)),
+            np.concatenate((targets, sources)),
+        )
+
+    edge_ids = np.unique(sources * len(keys) + targets)
+
+    return keys, edge_ids // max(len(keys), 1), edge_ids % max(len(keys), 1)
+
+
+def _get_propagator(
+    n: int, sources: "np.ndarray", targets: "np.ndarray"
+) -> Callable[["np.ndarray"], "np.ndarray"]:
+    """Helper function to get a function that sums, for every vertex, the values of the vertices with edges leading to
+    it, i.e. that multiplies a vector by the transposed adjacency matrix. The matrix is a SciPy CSR matrix if SciPy is
+    installed, else the sum is computed with NumPy.
+
+    :param n: the number of vertices
+    :param sources: the source ids of the edges
+    :param targets: the target ids of the edges
+    :returns: the function
+    """
+    if sparse is not None:
+        matrix = sparse.csr_matrix(
+            (np.ones(len(sources)), (targets, sources)), shape=(n, n)
+        )
+        return matrix.dot
+
+    return lambda x: np.bincount(targets, weights=x[sources], minlength=n)
+
+
+def _get_initial_vector(keys: list, initial: Union[dict, None]) -> "np.ndarray":
+    """Helper function to get the starting vector of an iterative method, normalized to sum to 1
+
+    :param keys: the keys of the vertices indexed by id
+    :param initial: mapping of vertex keys to starting values, such as the result of a previous computation, or None
+        to start with equal values
+    :returns: the starting vector
+    """
+    if initial is not None:
+        x = np.array([initial.get(key, 0.0) for key in keys], dtype=np.float64)
+        if x.sum() > 0:
+            return x / x.sum()
+
+    return np.full(len(keys), 1.0 / len(keys))
+
+
+def pagerank(
+    graph: Graph,
+    damping: float = 0.85,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+    initial: Union[dict, None] = None,
+) -> dict:
+    """PageRank scores each vertex of a graph by the probability of being at the vertex during a random walk that
+    follows a random outgoing edge with probability damping, and otherwise jumps to a random vertex. Walks that reach a
+    vertex without outgoing edges jump to a random vertex. The scores are computed by power iteration, using sparse
+    matrix-vector products. Passing the scores of a previous computation as the initial scores, such as after the graph
+    has changed slightly, reduces the number of iterations needed. Requires NumPy, and uses SciPy if it's installed.
+    Time complexity: O(V + E) per iteration.
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2 in [(1, 2), (2, 3), (3, 1), (4, 3)]:
+    ...     a_graph.add_edge(key1, key2)
+    >>> scores = pagerank(a_graph)
+    >>> {key: round(score, 3) for key, score in scores.items()}
+    {1: 0.32, 2: 0.31, 3: 0.333, 4: 0.038}
+    >>> a_graph.add_edge(4, 1)
+    >>> {key: round(score, 3) for key, score in pagerank(a_graph, initial=scores).items()}
+    {1: 0.326, 2: 0.315, 3: 0.321, 4: 0.038}
+
+    :param graph: the graph to score
+    :param damping: the probability of following an edge rather than jumping to a random vertex
+    :param tolerance: the total change in scores below which the scores are considered converged
+    :param max_iterations: the maximum number of iterations
+    :param initial: mapping of vertex keys to starting scores, or None to start with equal scores
+    :returns: mapping of vertex keys to scores, which sum to 1
+    """
+    keys, sources, targets = get_sparse_arrays(graph)
+    n = len(keys)
+    if n == 0:
+        return {}
+
+    propagate = _get_propagator(n, sources, targets)
+    out_degrees = np.bincount(sources, minlength=n).astype(np.float64)
+    dangling = out_degrees == 0
+    out_degrees[dangling] = 1
+    x = _get_initial_vector(keys, initial)
+
+    for _ in range(max_iterations):
+        next_x = damping * propagate(x / out_degrees)
+        next_x += (damping * x[dangling].sum() + 1 - damping) / n
+        change = np.abs(next_x - x).sum()
+        x = next_x
+
+        if change < tolerance:
+            break
+
+    return dict(zip(keys, x.tolist()))
+
+
+def degree_centrality(graph: Graph, incoming: bool = False) -> dict:
+    """Degree centrality scores each vertex of a graph by the fraction of the other vertices it's connected to. In a
+    directed graph, either the outgoing or the incoming edges are counted. Requires NumPy. Time complexity:
+    O(V + ElogE).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3]:
+    ...     a_graph.add_vertex(key)
+    >>> a_graph.add_edge(1, 2)
+    >>> a_graph.add_edge(1, 3)
+    >>> degree_centrality(a_graph)
+    {1: 1.0, 2: 0.0, 3: 0.0}
+    >>> degree_centrality(a_graph, incoming=True)
+    {1: 0.0, 2: 0.5, 3: 0.5}
+
+    :param graph: the graph to score
+    :param incoming: True to count incoming edges in a directed graph, else False
+    :returns: mapping of vertex keys to scores
+    """
+    keys, sources, targets = get_sparse_arrays(graph)
+    n = len(keys)
+    if n <= 1:
+        return {key: 1.0 for key in keys}
+
+    degrees = np.bincount(targets if incoming else sources, minlength=n)
+
+    return dict(zip(keys, (degrees / (n - 1)).tolist()))
+
+
+def hits(
+    graph: Graph,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+    initial: Union[dict, None] = None,
+) -> Tuple[dict, dict]:
+    """HITS scores each vertex of a graph twice: its authority score is the sum of the hub scores of the vertices with
+    edges leading to it, and its hub score is the sum of the authority scores of the vertices its edges lead to. The
+    scores are computed by power iteration, using sparse matrix-vector products, and are normalized to sum to 1.
+    Passing the hub scores of a previous computation as the initial hub scores reduces the number of iterations needed.
+    Requires NumPy, and uses SciPy if it's installed. Time complexity: O(V + E) per iteration.
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2 in [(1, 3), (1, 4), (2, 3)]:
+    ...     a_graph.add_edge(key1, key2)
+    >>> hubs, authorities = hits(a_graph)
+    >>> {key: round(score, 3) for key, score in hubs.items()}
+    {1: 0.618, 2: 0.382, 3: 0.0, 4: 0.0}
+    >>> {key: round(score, 3) for key, score in authorities.items()}
+    {1: 0.0, 2: 0.0, 3: 0.618, 4: 0.382}
+
+    :param graph: the graph to score
+    :param tolerance: the total change in hub scores below which the scores are considered converged
+    :param max_iterations: the maximum number of iterations
+    :param initial: mapping of vertex keys to starting hub scores, or None to start with equal scores
+    :returns: mappings of vertex keys to hub scores and to authority scores
+    """
+    keys, sources, targets = get_sparse_arrays(graph)
+    n = len(keys)
+    if n == 0:
+        return {}, {}
+
+    propagate_forwards = _get_propagator(n, sources, targets)
+    propagate_backwards = _get_propagator(n, targets, sources)
+    hub_scores = _get_initial_vector(keys, initial)
+    authority_scores = np.zeros(n)
+
+    for _ in range(max_iterations):
+        authority_scores = propagate_forwards(hub_scores)
+        if authority_scores.sum() > 0:
+            authority_scores /= authority_scores.sum()
+
+        next_hub_scores = propagate_backwards(authority_scores)
+        if next_hub_scores.sum() > 0:
+            next_hub_scores /= next_hub_scores.sum()
+
+        change = np.abs(next_hub_scores - hub_scores).sum()
+        hub_scores = next_hub_scores
+
+        if change < tolerance:
+            break
+
+    return dict(zip(keys, hub_scores.tolist())), dict(
+        zip(keys, authority_scores.tolist())
+    )
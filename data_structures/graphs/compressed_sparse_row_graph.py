@@ -0,0 +1,468 @@
+import collections
+import math
+from array import array
+from typing import Any, Generator, Iterable, Tuple, Union
+
+from graph import Graph
+
+
+class CompressedSparseRowGraph(Graph):
+    """A compressed sparse row (CSR) graph is an immutable graph whose vertices are mapped to dense integer ids, and
+    whose edges are stored in flat arrays. The edges leaving the vertex with id i are stored at indices offsets[i] up
+    to offsets[i + 1] of the targets and weights arrays, so the neighbours of a vertex are a contiguous slice. A second
+    set of arrays holds the edges entering each vertex, so incoming edges are found without scanning the whole graph.
+
+    The weights are stored as floats, with NaN for edges without a weight, which are returned with a weight of None.
+    The other weights are returned as integers if every weight was added as an integer, else as floats.
+
+    Instantiate a CSR graph object from a list of edges
+
+        >>> edges = [(1, 2, 100), (1, 3, 200), (1, 4, 300), (2, 3, 400), (2, 5, 500), (3, 5, 600), (4, 5, 700)]
+        >>> directed_graph = CompressedSparseRowGraph.from_edges(edges, directed=True)
+
+    Instantiate a CSR graph object from another graph
+
+        >>> from adjacency_list_graph import AdjacencyListGraph
+        >>> adjacency_list_graph = AdjacencyListGraph(directed=False)
+        >>> for key in [1, 2, 3, 4, 5]:
+        ...     adjacency_list_graph.add_vertex(key, key * 1000)
+        >>> for key1, key2, weight in edges:
+        ...     adjacency_list_graph.add_edge(key1, key2, weight)
+        >>> undirected_graph = CompressedSparseRowGraph.from_graph(adjacency_list_graph)
+
+    Check if a graph is directed
+
+        >>> directed_graph.is_directed()
+        True
+        >>> undirected_graph.is_directed()
+        False
+
+    Get keys of all the vertices in a graph
+
+        >>> directed_graph.get_vertices()
+        [1, 2, 3, 4, 5]
+
+    Get the dense integer id of a vertex, and the ids of the vertices it has edges to
+
+        >>> directed_graph.get_vertex_id(2)
+        1
+        >>> list(directed_graph.get_neighbour_ids(1))
+        [2, 4]
+
+    Get all the edges in a graph
+
+        >>> directed_graph.get_edges()
+        [(1, 2, 100), (1, 3, 200), (1, 4, 300), (2, 3, 400), (2, 5, 500), (3, 5, 600), (4, 5, 700)]
+
+    Check if a pair of vertices form an edge
+
+        >>> directed_graph.is_edge(1, 2)
+        True
+        >>> directed_graph.is_edge(2, 1)
+        False
+        >>> undirected_graph.is_edge(2, 1)
+        True
+
+    Get incoming and outgoing edges of a vertex
+
+        >>> directed_graph.get_incoming_edges(3)
+        [(1, 3, 200), (2, 3, 400)]
+        >>> undirected_graph.get_outgoing_edges(3)
+        [(3, 1, 200), (3, 2, 400), (3, 5, 600)]
+
+    Get the weight of some edge
+
+        >>> undirected_graph.get_edge_weight(2, 1)
+        100
+
+    Get adjacent vertices relative to some vertex
+
+        >>> directed_graph.get_adjacent_vertices(2)
+        [(1, 100), (3, 400), (5, 500)]
+        >>> directed_graph.get_incoming_adjacent_vertices(2)
+        [(1, 100)]
+        >>> directed_graph.get_outgoing_adjacent_vertices(2)
+        [(3, 400), (5, 500)]
+
+    Get value stored in a vertex
+
+        >>> undirected_graph.get_vertex_value(1)
+        1000
+        >>> directed_graph.get_vertex_value(1) is None
+        True
+
+    String representation of a graph
+
+        >>> str(directed_graph)
+        '{\\n\\t1: [(2, 100), (3, 200), (4, 300)]\\n\\t2: [(3, 400), (5, 500)]\\n\\t3: [(5, 600)]\\n\\t\
+4: [(5, 700)]\\n\\t5: []\\n}'
+
+    Check if a vertex corresponding to some key is contained in the graph
+
+        >>> 1 in directed_graph
+        True
+        >>> 100 in directed_graph
+        False
+
+    Depth-first traversal of a graph
+
+        >>> [i for i in directed_graph.depth_first_traversal(1)]
+        [(1, 1), (2, 2), (3, 3), (5, 4), (4, 8)]
+
+    Breadth-first traversal of a graph
+
+        >>> [i for i in undirected_graph.breadth_first_traversal(1)]
+        [(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)]
+
+    Edges without a weight are returned without a weight, and the weights keep the type they were added with
+
+        >>> unweighted_graph = CompressedSparseRowGraph.from_edges([(1, 2, None), (2, 3, 0.5)], directed=True)
+        >>> unweighted_graph.get_edges()
+        [(1, 2, None), (2, 3, 0.5)]
+        >>> unweighted_graph.get_edge_weight(1, 2) is None
+        True
+
+    The graph can't be modified
+
+        >>> directed_graph.add_vertex(6)
+        Traceback (most recent call last):
+        ...
+        TypeError: Compressed sparse row graphs are immutable
+    """
+
+    def __init__(
+        self,
+        directed: bool,
+        vertices: Iterable[Tuple[Any, Any]],
+        edges: Iterable[Tuple[Any, Any, Union[float, None]]],
+    ):
+        """Build the graph from its vertices and edges. Vertices that only appear in the edges are added with a value
+        of None. Time complexity: O(V + E).
+
+        :param directed: True if the graph is directed, else False
+        :param vertices: iterable of (key, value) pairs
+        :param edges: iterable of (key1, key2, weight) triples
+        """
+        super().__init__(directed)
+
+        for key, value in vertices:
+            self.__add_vertex(key, value)
+
+        sources = array("q")
+        targets = array("q")
+        weights = array("d")
+        integer_weights = True
+
+        for key1, key2, weight in edges:
+            sources.append(self.__add_vertex(key1))
+            targets.append(self.__add_vertex(key2))
+            if weight is None:
+                weights.append(math.nan)
+            else:
+                weights.append(weight)
+                integer_weights = integer_weights and type(weight) is int
+
+        self.__weight_type = int if integer_weights else float
+
+        self.__offsets, self.__targets, self.__weights = self.__compress(
+            sources, targets, weights
+        )
+
+        sources = array("q")
+        for i in range(len(self._keys)):
+            sources.extend([i] * (self.__offsets[i + 1] - self.__offsets[i]))
+
+        (
+            self.__incoming_offsets,
+            self.__sources,
+            self.__incoming_weights,
+        ) = self.__compress(self.__targets, sources, self.__weights)
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Any, Any, Union[float, None]]],
+        directed: bool,
+        vertices: Iterable[Tuple[Any, Any]] = (),
+    ) -> "CompressedSparseRowGraph":
+        """Create a graph from an iterable of edges. Time complexity: O(V + E).
+
+        :param edges: iterable of (key1, key2, weight) triples
+        :param directed: True if the graph is directed, else False
+        :param vertices: iterable of (key, value) pairs, for vertices with values or without edges
+        :returns: the graph
+        """
+        return cls(directed, vertices, edges)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CompressedSparseRowGraph":
+        """Create a graph with the same vertices and edges as another graph. Time complexity: O(V + E).
+
+        :param graph: the graph to copy
+        :returns: the graph
+        """
+        vertices = [(vertex.key, vertex.value) for vertex in graph._vertices]
+        edges = (
+            (key1, key2, weight)
+            for key1 in graph.get_vertices()
+            for key2, weight in graph._get_next_vertices(key1)
+        )
+
+        return cls(graph.is_directed(), vertices, edges)
+
+    def __add_vertex(self, key: Any, value: Any = None) -> int:
+        """Helper function to get the id of a vertex, adding the vertex if it doesn't exist yet
+
+        :param key: the key of the vertex
+        :param value: the value to store in the vertex if it's added
+        :returns: the id of the vertex
+        """
+        idx = self._indices.get(key)
+
+        if idx is None:
+            idx = len(self._keys)
+            self._indices[key] = idx
+            self._keys.append(key)
+            self._vertices.append(Graph._Vertex(key, value))
+
+        return idx
+
+    def __compress(self, sources: array, targets: array, weights: array) -> tuple:
+        """Helper function to group edges by their source vertex using a counting sort. Edges with the same source
+        vertex keep their relative order.
+
+        :param sources: ids of the source vertices of the edges
+        :param targets: ids of the target vertices of the edges
+        :param weights: weights of the edges
+        :returns: a tuple of the offsets, targets and weights arrays
+        """
+        offsets = array("q", bytes(8 * (len(self._keys) + 1)))
+
+        for i in sources:
+            offsets[i + 1] += 1
+        for i in range(len(self._keys)):
+            offsets[i + 1] += offsets[i]
+
+        positions = offsets[:-1]
+        sorted_targets = array("q", bytes(8 * len(targets)))
+        sorted_weights = array("d", bytes(8 * len(weights)))
+
+        for i, j, weight in zip(sources, targets, weights):
+            position = positions[i]
+            sorted_targets[position] = j
+            sorted_weights[position] = weight
+            positions[i] = position + 1
+
+        return offsets, sorted_targets, sorted_weights
+
+    def __get_id(self, key: Any) -> int:
+        """Helper function to get the id of a vertex, raising a KeyError if the vertex doesn't exist
+
+        :param key: the key of the vertex
+        :returns: the id of the vertex
+        """
+        idx = self._indices.get(key)
+        if idx is None:
+            raise KeyError(f"{key} is absent from the graph")
+        return idx
+
+    def __get_weight(self, weight: float) -> Union[int, float, None]:
+        """Helper function to convert a stored weight to the weight of the edge, as it was added
+
+        :param weight: the stored weight
+        :returns: the weight of the edge, None if the edge has no weight
+        """
+        return None if weight != weight else self.__weight_type(weight)
+
+    def __get_outgoing(self, idx: int) -> list:
+        """Helper function to get the (key, weight) pairs of the edges leaving the vertex of the passed id
+
+        :param idx: the id of the vertex
+        :returns: list of (key, weight) pairs
+        """
+        keys = self._keys
+        start, end = self.__offsets[idx], self.__offsets[idx + 1]
+
+        return [
+            (keys[j], self.__get_weight(weight))
+            for j, weight in zip(self.__targets[start:end], self.__weights[start:end])
+        ]
+
+    def __get_incoming(self, idx: int, before: Union[bool, None]) -> list:
+        """Helper function to get the (key, weight) pairs of the edges entering the vertex of the passed id, ordered by
+        the ids of their source vertices and excluding self-loops
+
+        :param idx: the id of the vertex
+        :param before: True to only include sources with smaller ids than the vertex, False to only include sources
+            with larger ids, None to include both
+        :returns: list of (key, weight) pairs
+        """
+        keys = self._keys
+        start, end = self.__incoming_offsets[idx], self.__incoming_offsets[idx + 1]
+        vertices = []
+
+        for j, weight in zip(
+            self.__sources[start:end], self.__incoming_weights[start:end]
+        ):
+            if (
+                j == idx
+                or (before is True and j > idx)
+                or (before is False and j < idx)
+            ):
+                continue
+            vertices.append((keys[j], self.__get_weight(weight)))
+
+        return vertices
+
+    def __repr__(self) -> str:
+        s = "{\n"
+        for i, k in enumerate(self._keys):
+            s += f"\t{k}: {self.__get_outgoing(i)}\n"
+        s += "}"
+
+        return s
+
+    def get_vertex_id(self, key: Any) -> int:
+        """Return the dense integer id of the vertex associated with the passed key. Ids range from 0 to V - 1, in the
+        order of get_vertices(). Time complexity: O(1).
+
+        :param key: the key of the vertex
+        :returns: the id of the vertex
+        """
+        return self.__get_id(key)
+
+    def get_neighbour_ids(self, vertex_id: int) -> memoryview:
+        """Return the ids of the vertices that the vertex with the passed id has stored edges to, as a view into the
+        targets array. The view must not be modified. Time complexity: O(1).
+
+        :param vertex_id: the id of the vertex
+        :returns: a memoryview of vertex ids
+        """
+        start, end = self.__offsets[vertex_id], self.__offsets[vertex_id + 1]
+        return memoryview(self.__targets)[start:end]
+
+    def get_arrays(self) -> Tuple[array, array, array]:
+        """Return the offsets, targets and weights arrays of the stored edges. The edges stored for the vertex with id
+        i are at indices offsets[i] up to offsets[i + 1] of the targets and weights arrays. The arrays must not be
+        modified.
+
+        :returns: a tuple of the offsets, targets and weights arrays
+        """
+        return self.__offsets, self.__targets, self.__weights
+
+    def _get_next_vertices(self, key):
+        return self.__get_outgoing(self.__get_id(key))
+
+    def add_vertex(self, key: Any, value: Any = None) -> None:
+        raise TypeError("Compressed sparse row graphs are immutable")
+
+    def remove_vertex(self, key: Any) -> None:
+        raise TypeError("Compressed sparse row graphs are immutable")
+
+    def add_edge(self, key1: Any, key2: Any, weight: float = None) -> None:
+        raise TypeError("Compressed sparse row graphs are immutable")
+
+    def remove_edge(self, key1: Any, key2: Any) -> None:
+        raise TypeError("Compressed sparse row graphs are immutable")
+
+    def get_edges(self) -> list:
+        return super().get_edges()
+
+    def get_adjacent_vertices(self, key: Any) -> list:
+        idx = self.__get_id(key)
+
+        return (
+            self.__get_incoming(idx, True)
+            + self.__get_outgoing(idx)
+            + self.__get_incoming(idx, False)
+        )
+
+    def get_incoming_adjacent_vertices(self, key: Any) -> list:
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        return self.__get_incoming(self.__get_id(key), None)
+
+    def get_outgoing_adjacent_vertices(self, key: Any) -> list:
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        return self.__get_outgoing(self.__get_id(key))
+
+    def get_edge_weight(self, key1: Any, key2: Any) -> float:
+        idx1 = self.__get_id(key1)
+        idx2 = self.__get_id(key2)
+
+        for i in range(self.__offsets[idx1], self.__offsets[idx1 + 1]):
+            if self.__targets[i] == idx2:
+                return self.__get_weight(self.__weights[i])
+
+        if not self.is_directed():
+            for i in range(self.__offsets[idx2], self.__offsets[idx2 + 1]):
+                if self.__targets[i] == idx1:
+                    return self.__get_weight(self.__weights[i])
+
+        raise ValueError(f"Edge ({key1}, {key2}) is absent from the graph")
+
+    def get_outgoing_edges(self, key: Any) -> list:
+        return super().get_outgoing_edges(key)
+
+    def get_incoming_edges(self, key: Any) -> list:
+        return super().get_incoming_edges(key)
+
+    def is_edge(self, key1: Any, key2: Any) -> bool:
+        try:
+            self.get_edge_weight(key1, key2)
+        except ValueError:
+            return False
+        return True
+
+    def depth_first_traversal(self, key: Any) -> Generator:
+        offsets, targets, keys = self.__offsets, self.__targets, self._keys
+        start = self.__get_id(key)
+        visited = bytearray(len(keys))
+        visited[start] = 1
+        steps = 1
+        stack = [[start, offsets[start]]]
+
+        yield key, steps
+
+        while len(stack) > 0:
+            frame = stack[-1]
+            i, position = frame
+            end = offsets[i + 1]
+
+            while position < end and visited[targets[position]]:
+                position += 1
+
+            if position < end:
+                frame[1] = position + 1
+                j = targets[position]
+                visited[j] = 1
+                steps += 1
+                stack.append([j, offsets[j]])
+
+                yield keys[j], steps
+            else:
+                steps += 1
+                stack.pop()
+
+    def breadth_first_traversal(self, key: Any) -> Generator:
+        offsets, targets, keys = self.__offsets, self.__targets, self._keys
+        start = self.__get_id(key)
+        visited = bytearray(len(keys))
+        visited[start] = 1
+        steps = 1
+        helper_queue = collections.deque([(start, steps)])
+
+        while len(helper_queue) > 0:
+            i, visit = helper_queue.popleft()
+
+            yield keys[i], visit
+
+            for position in range(offsets[i], offsets[i + 1]):
+                j = targets[position]
+                if not visited[j]:
+                    visited[j] = 1
+                    steps += 1
+                    helper_queue.append((j, steps))
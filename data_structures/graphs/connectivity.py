@@ -0,0 +1,140 @@
+from typing import Any
+
+from graph import Graph
+
+from data_structures.disjoint_sets import DictDisjointSet
+
+
+class ConnectivityIndex:
+    """A connectivity index answers whether vertices of a graph are connected, treating directed edges as undirected,
+    without traversing the graph. It keeps a disjoint set of the vertices, with a set per connected component, and
+    observes the graph to keep it up to date: added vertices and edges are merged into the disjoint set as they're
+    added, in O(α(n)) amortized time, whereas removing a vertex or an edge may split a component, so the disjoint set
+    is rebuilt from the graph in O(V + E) time by the next query instead. Any number of removals between two queries
+    thus cost a single rebuild, and queries take O(α(n)) amortized time otherwise.
+
+    Attach a connectivity index to a graph
+
+        >>> from adjacency_list_graph import AdjacencyListGraph
+        >>> a_graph = AdjacencyListGraph(directed=False)
+        >>> for key in [1, 2, 3, 4, 5]:
+        ...     a_graph.add_vertex(key)
+        >>> a_graph.add_edge(1, 2)
+        >>> a_graph.add_edge(2, 3)
+        >>> index = ConnectivityIndex(a_graph)
+
+    Check if a pair of vertices is connected
+
+        >>> index.connected(1, 3)
+        True
+        >>> index.connected(1, 4)
+        False
+
+    The index follows changes to the graph
+
+        >>> a_graph.add_edge(3, 4)
+        >>> index.connected(1, 4)
+        True
+        >>> a_graph.remove_edge(2, 3)
+        >>> index.connected(1, 4)
+        False
+
+    Get the number of vertices in the component of some vertex, and the number of components
+
+        >>> index.component_size(3)
+        2
+        >>> index.get_component_count()
+        3
+
+    Stop following changes to the graph
+
+        >>> index.detach()
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        :param graph: the graph to index
+        """
+        self.__graph = graph
+        self.__disjoint_set = None
+        graph.add_observer(self.__on_change)
+
+    def __on_change(self, event: str, *keys: Any) -> None:
+        """Helper function to update the disjoint set when the graph is modified, or to discard it if a component may
+        have been split
+
+        :param event: the name of the method modifying the graph
+        :param keys: the key of the vertex or the keys of the edge being modified
+        """
+        if self.__disjoint_set is None:
+            return
+
+        if event == "add_vertex":
+            self.__disjoint_set.make_set(keys[0])
+        elif event == "add_edge":
+            self.__disjoint_set.union(keys[0], keys[1])
+        else:
+            self.__disjoint_set = None
+
+    def __get_disjoint_set(self) -> DictDisjointSet:
+        """Helper function to get the disjoint set of the vertices, building it from the graph if it was discarded.
+        Time complexity: O(V + E) if it's built, else O(1).
+
+        :returns: the disjoint set
+        """
+        if self.__disjoint_set is None:
+            graph = self.__graph
+            disjoint_set = DictDisjointSet(graph.get_vertices())
+
+            for key1 in graph.get_vertices():
+                for key2, _ in graph._get_next_vertices(key1):
+                    if key2 in disjoint_set:
+                        disjoint_set.union(key1, key2)
+
+            self.__disjoint_set = disjoint_set
+
+        return self.__disjoint_set
+
+    def __check_vertex(self, key: Any) -> None:
+        """Helper function to raise a KeyError if a vertex doesn't exist in the graph
+
+        :param key: the key of the vertex
+        """
+        if key not in self.__graph:
+            raise KeyError(f"{key} is absent from the graph")
+
+    def connected(self, key1: Any, key2: Any) -> bool:
+        """Check if there's a path between a pair of vertices, ignoring the direction of the edges. Time complexity:
+        O(α(n)) amortized, or O(V + E) after a removal.
+
+        :param key1: the key of the first vertex
+        :param key2: the key of the second vertex
+        :returns: True if the vertices are connected, else False
+        """
+        self.__check_vertex(key1)
+        self.__check_vertex(key2)
+
+        return self.__get_disjoint_set().is_connected(key1, key2)
+
+    def component_size(self, key: Any) -> int:
+        """Get the number of vertices in the connected component of a vertex. Time complexity: O(α(n)) amortized, or
+        O(V + E) after a removal.
+
+        :param key: the key of the vertex
+        :returns: the number of vertices connected to the vertex, including itself
+        """
+        self.__check_vertex(key)
+
+        return self.__get_disjoint_set().get_set_size(key)
+
+    def get_component_count(self) -> int:
+        """Get the number of connected components of the graph. Time complexity: O(1), or O(V + E) after a removal.
+
+        :returns: the number of connected components
+        """
+        return self.__get_disjoint_set().get_set_count()
+
+    def detach(self) -> None:
+        """Stop following changes to the graph. The index can't be used afterwards."""
+        self.__graph.remove_observer(self.__on_change)
+        self.__disjoint_set = None
@@ -0,0 +1,270 @@
+import collections
+import heapq
+from typing import Any, Callable, Tuple, Union
+
+from adjacency_list_graph import AdjacencyListGraph
+from graph import Graph
+
+
+class CycleError(Exception):
+    def __init__(self, message: str, cycle: list):
+        super().__init__(message)
+        self.cycle = cycle
+
+
+def _get_next_vertices_function(graph: Graph) -> Callable[[Any], list]:
+    """Helper function to get a function returning the (key, weight) pairs of the vertices that can be reached from
+    some vertex by following a single edge. The outgoing edges of a vertex of a directed graph are looked up directly,
+    while the edges of an undirected graph are gathered for all the vertices in a single pass, since some graphs can
+    only find all the edges of a vertex by scanning every edge.
+
+    :param graph: the graph to traverse
+    :returns: a function that takes the key of a vertex and returns a list of (key, weight) pairs
+    """
+    if graph.is_directed():
+        return graph._get_next_vertices
+
+    return graph._get_adjacency_lists().__getitem__
+
+
+def strongly_connected_components(graph: Graph) -> list:
+    """A strongly connected component of a directed graph is a maximal set of vertices in which every vertex can be
+    reached from every other vertex. Tarjan's algorithm finds all of them with a single depth first traversal, which
+    is run with an explicit stack so that deep graphs don't exceed the recursion limit. The components are returned in
+    topological order, such that no edge leads from a component to an earlier one. In an undirected graph, the
+    components are the connected components. Time complexity: O(V + E).
+
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4, 5]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2 in [(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 4)]:
+    ...     a_graph.add_edge(key1, key2)
+    >>> strongly_connected_components(a_graph)
+    [[1, 2, 3], [4, 5]]
+
+    :param graph: the graph whose components are being sought
+    :returns: a list of components, each a list of vertex keys
+    """
+    indices = {}
+    low_links = {}
+    on_stack = set()
+    stack = []
+    components = []
+    get_next_vertices = _get_next_vertices_function(graph)
+
+    for root in graph.get_vertices():
+        if root in indices:
+            continue
+
+        indices[root] = low_links[root] = len(indices)
+        stack.append(root)
+        on_stack.add(root)
+        work_stack = [(root, iter(get_next_vertices(root)))]
+
+        while len(work_stack) > 0:
+            key, next_vertices = work_stack[-1]
+
+            for next_key, _ in next_vertices:
+                if next_key not in indices:
+                    indices[next_key] = low_links[next_key] = len(indices)
+                    stack.append(next_key)
+                    on_stack.add(next_key)
+                    work_stack.append((next_key, iter(get_next_vertices(next_key))))
+                    break
+                if next_key in on_stack:
+                    low_links[key] = min(low_links[key], indices[next_key])
+            else:
+                work_stack.pop()
+
+                if len(work_stack) > 0:
+                    parent_key = work_stack[-1][0]
+                    low_links[parent_key] = min(low_links[parent_key], low_links[key])
+
+                if low_links[key] == indices[key]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == key:
+                            break
+                    component.reverse()
+                    components.append(component)
+
+    components.reverse()
+
+    return components
+
+
+def condensation(graph: Graph) -> Tuple[AdjacencyListGraph, dict]:
+    """The condensation of a directed graph is the directed acyclic graph obtained by contracting each strongly
+    connected component into a single vertex. The vertices of the condensation are keyed by the position of their
+    component in topological order, and store the list of keys of the vertices of the component. An edge connects two
+    components if any edge of the graph leads from one to the other. Time complexity: O(V + E).
+
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4, 5]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2 in [(1, 2), (2, 1), (2, 3), (1, 3), (4, 3), (3, 5), (5, 3)]:
+    ...     a_graph.add_edge(key1, key2)
+    >>> dag, components = condensation(a_graph)
+    >>> [(key, dag.get_vertex_value(key)) for key in dag.get_vertices()]
+    [(0, [4]), (1, [1, 2]), (2, [3, 5])]
+    >>> dag.get_edges()
+    [(0, 2, None), (1, 2, None)]
+    >>> components[5]
+    2
+
+    :param graph: the graph to condense
+    :returns: the condensation, and a mapping of the keys of the vertices of the graph to their components' keys
+    """
+    components = strongly_connected_components(graph)
+    component_of = {}
+    dag = AdjacencyListGraph(directed=True)
+    get_next_vertices = _get_next_vertices_function(graph)
+
+    for i, component in enumerate(components):
+        dag.add_vertex(i, component)
+        for key in component:
+            component_of[key] = i
+
+    for i, component in enumerate(components):
+        next_components = set()
+        for key in component:
+            for next_key, _ in get_next_vertices(key):
+                j = component_of[next_key]
+                if j != i and j not in next_components:
+                    next_components.add(j)
+                    dag.add_edge(i, j)
+
+    return dag, component_of
+
+
+def find_cycle(graph: Graph) -> Union[list, None]:
+    """Find some cycle in a graph using an iterative depth first traversal. In a directed graph, a cycle is found once
+    an edge leads back to a vertex whose traversal hasn't finished. In an undirected graph, a cycle is found once an
+    edge leads to a visited vertex other than the one the traversal came from. Time complexity: O(V + E).
+
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2 in [(1, 2), (2, 3), (1, 3), (3, 4)]:
+    ...     a_graph.add_edge(key1, key2)
+    >>> find_cycle(a_graph) is None
+    True
+    >>> a_graph.add_edge(4, 2)
+    >>> find_cycle(a_graph)
+    [2, 3, 4, 2]
+
+    :param graph: the graph to search
+    :returns: the keys of the vertices of a cycle, starting and ending with the same key, or None if there's no cycle
+    """
+    finished = set()
+    parents = {}
+    get_next_vertices = _get_next_vertices_function(graph)
+
+    for root in graph.get_vertices():
+        if root in parents:
+            continue
+
+        parents[root] = None
+        path = [root]
+        positions = {root: 0}
+        work_stack = [iter(get_next_vertices(root))]
+
+        while len(work_stack) > 0:
+            key = path[-1]
+
+            for next_key, _ in work_stack[-1]:
+                if next_key in positions:
+                    if graph.is_directed() or next_key != parents[key]:
+                        return path[positions[next_key] :] + [next_key]
+                    continue
+                if next_key not in finished:
+                    parents[next_key] = key
+                    positions[next_key] = len(path)
+                    path.append(next_key)
+                    work_stack.append(iter(get_next_vertices(next_key)))
+                    break
+            else:
+                work_stack.pop()
+                del positions[path.pop()]
+                finished.add(key)
+
+    return None
+
+
+def topological_sort(graph: Graph, stable: bool = False) -> list:
+    """A topological ordering of a directed acyclic graph is an ordering of its vertices such that every edge leads
+    from a vertex to a later one. Kahn's algorithm repeatedly removes a vertex with no incoming edges from the graph
+    and appends it to the ordering. Vertices that become free of incoming edges are removed in the order in which they
+    become free, in time O(V + E). If stable is True, the free vertex that was added to the graph first is always
+    removed first instead, which gives the same ordering regardless of the order of the edges, in time
+    O(V + ElogV).
+
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in ["wake", "shower", "dress", "eat", "leave"]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2 in [("wake", "eat"), ("wake", "shower"), ("shower", "dress"), ("dress", "leave"), \
+("eat", "leave")]:
+    ...     a_graph.add_edge(key1, key2)
+    >>> topological_sort(a_graph)
+    ['wake', 'eat', 'shower', 'dress', 'leave']
+    >>> topological_sort(a_graph, stable=True)
+    ['wake', 'shower', 'dress', 'eat', 'leave']
+    >>> a_graph.add_edge("leave", "wake")
+    >>> topological_sort(a_graph)
+    Traceback (most recent call last):
+    ...
+    directed_graph_algorithms.CycleError: Graph contains cycle ['wake', 'eat', 'leave', 'wake']
+
+    :param graph: the directed graph to sort
+    :param stable: True to order free vertices by the order in which they were added to the graph, else False
+    :returns: a list of vertex keys in topological order
+    :raises CycleError: if the graph contains a cycle, with the keys of the vertices of a cycle attached
+    """
+    if not graph.is_directed():
+        raise ValueError("Topological sorting requires a directed graph")
+
+    vertices = graph.get_vertices()
+    in_degrees = {key: 0 for key in vertices}
+
+    for key in vertices:
+        for next_key, _ in graph._get_next_vertices(key):
+            in_degrees[next_key] += 1
+
+    if stable:
+        positions = {key: i for i, key in enumerate(vertices)}
+        free_vertices = [
+            (positions[key], key) for key in vertices if in_degrees[key] == 0
+        ]
+
+        def get_free_vertex():
+            return heapq.heappop(free_vertices)[1]
+
+        def add_free_vertex(key):
+            heapq.heappush(free_vertices, (positions[key], key))
+
+    else:
+        free_vertices = collections.deque(
+            key for key in vertices if in_degrees[key] == 0
+        )
+        get_free_vertex = free_vertices.popleft
+        add_free_vertex = free_vertices.append
+
+    ordering = []
+
+    while len(free_vertices) > 0:
+        key = get_free_vertex()
+        ordering.append(key)
+
+        for next_key, _ in graph._get_next_vertices(key):
+            in_degrees[next_key] -= 1
+            if in_degrees[next_key] == 0:
+                add_free_vertex(next_key)
+
+    if len(ordering) < len(vertices):
+        cycle = find_cycle(graph)
+        raise CycleError(f"Graph contains cycle {cycle}", cycle)
+
+    return ordering
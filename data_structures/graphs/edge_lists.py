@@ -0,0 +1,168 @@
+import csv
+import struct
+from typing import Any, Callable, Generator, Iterable, Tuple, Union
+
+_BINARY_HEADER = struct.Struct("<4sB3x")
+_BINARY_MAGIC = b"EDGE"
+_WEIGHTED_RECORD = struct.Struct("<qqd")
+_UNWEIGHTED_RECORD = struct.Struct("<qq")
+
+
+def read_edge_list(
+    path: str,
+    delimiter: Union[str, None] = None,
+    key_type: Callable[[str], Any] = str,
+    weight_type: Callable[[str], Any] = float,
+    comment: str = "#",
+) -> Generator:
+    """Read the edges of a graph from a text file with an edge on each line, formed of the keys of its vertices,
+    optionally followed by its weight. Columns are separated by whitespace, or read as CSV if a delimiter is passed.
+    Blank lines and lines starting with the comment prefix are skipped. The edges are read lazily, a line at a time, so
+    the generator can be passed to Graph.from_edges() without holding the file in memory. Each distinct key is
+    converted once and the same object is reused for all its occurrences. Time complexity: O(E).
+
+    >>> import os
+    >>> import tempfile
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, "edges.txt")
+    ...     with open(path, "w") as file:
+    ...         _ = file.write("# source target weight\\n1 2 0.5\\n2 3\\n\\n3 1 2\\n")
+    ...     a_graph = AdjacencyListGraph.from_edges(read_edge_list(path, key_type=int), directed=True)
+    >>> a_graph.get_edges()
+    [(1, 2, 0.5), (2, 3, None), (3, 1, 2.0)]
+
+    :param path: the path of the file
+    :param delimiter: the delimiter of a CSV file, or None for columns separated by whitespace
+    :param key_type: function converting a column to the key of a vertex
+    :param weight_type: function converting a column to the weight of an edge
+    :param comment: prefix of the lines to skip
+    :returns: a generator of (key1, key2, weight) triples, with a weight of None for edges without a weight
+    """
+    keys = {}
+
+    with open(path, newline="") as file:
+        if delimiter is None:
+            rows = (line.split() for line in file)
+        else:
+            rows = csv.reader(file, delimiter=delimiter)
+
+        for row in rows:
+            if len(row) == 0 or row[0].startswith(comment):
+                continue
+            if len(row) not in (2, 3):
+                raise ValueError(f"Expected 2 or 3 columns, got {len(row)}: {row}")
+
+            key1 = keys.get(row[0])
+            if key1 is None:
+                key1 = keys[row[0]] = key_type(row[0])
+
+            key2 = keys.get(row[1])
+            if key2 is None:
+                key2 = keys[row[1]] = key_type(row[1])
+
+            yield key1, key2, weight_type(row[2]) if len(row) == 3 else None
+
+
+def write_edge_list(
+    path: str,
+    edges: Iterable[Tuple[Any, Any, Union[float, None]]],
+    delimiter: Union[str, None] = None,
+) -> None:
+    """Write the edges of a graph to a text file that read_edge_list() can read, an edge on each line. Edges without a
+    weight are written without the weight column. Time complexity: O(E).
+
+    :param path: the path of the file
+    :param edges: iterable of (key1, key2, weight) triples, such as the result of get_edges()
+    :param delimiter: the delimiter of a CSV file, or None for columns separated by spaces
+    """
+    with open(path, "w", newline="") as file:
+        if delimiter is None:
+            for key1, key2, weight in edges:
+                if weight is None:
+                    file.write(f"{key1} {key2}\n")
+                else:
+                    file.write(f"{key1} {key2} {weight}\n")
+        else:
+            writer = csv.writer(file, delimiter=delimiter)
+            writer.writerows(
+                (key1, key2) if weight is None else (key1, key2, weight)
+                for key1, key2, weight in edges
+            )
+
+
+def write_binary_edge_list(
+    path: str,
+    edges: Iterable[Tuple[int, int, Union[float, None]]],
+    weighted: bool = True,
+) -> None:
+    """Write the edges of a graph whose keys are integers to a compact binary file. The file starts with an 8 byte
+    header, followed by a fixed size record per edge: the keys as little-endian 64 bit integers, then the weight as a
+    64 bit float if the edges are weighted. Edges without a weight are written with a weight of NaN. Time complexity:
+    O(E).
+
+    :param path: the path of the file
+    :param edges: iterable of (key1, key2, weight) triples
+    :param weighted: True to write the weights of the edges, else False
+    """
+    nan = float("nan")
+
+    with open(path, "wb") as file:
+        file.write(_BINARY_HEADER.pack(_BINARY_MAGIC, weighted))
+
+        if weighted:
+            pack = _WEIGHTED_RECORD.pack
+            for key1, key2, weight in edges:
+                file.write(pack(key1, key2, nan if weight is None else weight))
+        else:
+            pack = _UNWEIGHTED_RECORD.pack
+            for key1, key2, _ in edges:
+                file.write(pack(key1, key2))
+
+
+def read_binary_edge_list(path: str, chunk_size: int = 65536) -> Generator:
+    """Read the edges of a graph from a binary file written by write_binary_edge_list(). The file is read a chunk of
+    records at a time, and each chunk is decoded in a single call, so the edges are streamed without holding the file in
+    memory. Time complexity: O(E).
+
+    >>> import os
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, "edges.bin")
+    ...     write_binary_edge_list(path, [(1, 2, 0.5), (2, 3, None), (3, 1, 2)])
+    ...     edges = list(read_binary_edge_list(path, chunk_size=2))
+    ...     write_binary_edge_list(path, edges, weighted=False)
+    ...     unweighted_edges = list(read_binary_edge_list(path))
+    >>> edges
+    [(1, 2, 0.5), (2, 3, None), (3, 1, 2.0)]
+    >>> unweighted_edges
+    [(1, 2, None), (2, 3, None), (3, 1, None)]
+
+    :param path: the path of the file
+    :param chunk_size: the number of records read at a time
+    :returns: a generator of (key1, key2, weight) triples, with a weight of None for edges without a weight
+    """
+    with open(path, "rb") as file:
+        header = file.read(_BINARY_HEADER.size)
+        if len(header) < _BINARY_HEADER.size:
+            raise ValueError(f"{path} is not a binary edge list")
+
+        magic, weighted = _BINARY_HEADER.unpack(header)
+        if magic != _BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary edge list")
+
+        record = _WEIGHTED_RECORD if weighted else _UNWEIGHTED_RECORD
+
+        while True:
+            chunk = file.read(record.size * chunk_size)
+            if len(chunk) == 0:
+                break
+            if len(chunk) % record.size != 0:
+                raise ValueError(f"{path} ends with an incomplete edge")
+
+            if weighted:
+                for key1, key2, weight in record.iter_unpack(chunk):
+                    yield key1, key2, None if weight != weight else weight
+            else:
+                for key1, key2 in record.iter_unpack(chunk):
+                    yield key1, key2, None
@@ -1,5 +1,6 @@
+import collections
 from abc import ABC, abstractmethod
-from typing import Any, Generator
+from typing import Any, Callable, Generator, Iterable, Tuple, Union
 
 
 class Graph(ABC):
@@ -35,6 +36,76 @@ class Graph(ABC):
         self._directed = directed
         self._keys = []
         self._vertices = []
+        self._indices = {}
+        self._observers = []
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Any, Any, Union[float, None]]],
+        directed: bool,
+        vertices: Iterable[Tuple[Any, Any]] = (),
+    ) -> "Graph":
+        """Create a graph from an iterable of edges, such as a generator that reads them from a file. Vertices that
+        only appear in the edges are added with a value of None, in the order in which they first appear. Time
+        complexity: O(V + E) for adjacency list graphs, O(V^2 + E) for adjacency matrix graphs.
+
+        :param edges: iterable of (key1, key2, weight) triples
+        :param directed: True if the graph is directed, else False
+        :param vertices: iterable of (key, value) pairs, for vertices with values or without edges
+        :returns: the graph
+        """
+        graph = cls(directed)
+        graph._load_edges(vertices, edges)
+
+        return graph
+
+    def _load_edges(
+        self,
+        vertices: Iterable[Tuple[Any, Any]],
+        edges: Iterable[Tuple[Any, Any, Union[float, None]]],
+    ) -> None:
+        """Add vertices and edges to the graph in bulk, adding the vertices of the edges that don't exist yet.
+        Subclasses override this to build their storage in one pass instead of an insertion at a time.
+
+        :param vertices: iterable of (key, value) pairs
+        :param edges: iterable of (key1, key2, weight) triples
+        """
+        for key, value in vertices:
+            self.add_vertex(key, value)
+
+        for key1, key2, weight in edges:
+            if key1 not in self:
+                self.add_vertex(key1)
+            if key2 not in self:
+                self.add_vertex(key2)
+            self.add_edge(key1, key2, weight)
+
+    def add_observer(self, observer: Callable[..., None]) -> None:
+        """Register a function to be called whenever a vertex or an edge is added or removed, such as an index that
+        has to be kept up to date with the graph. The function is called with the name of the method, i.e. add_vertex,
+        remove_vertex, add_edge or remove_edge, followed by the key of the vertex or the keys of the edge, once the
+        arguments of the method have been checked.
+
+        :param observer: the function to call
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: Callable[..., None]) -> None:
+        """Stop calling a function registered with add_observer()
+
+        :param observer: the function to stop calling
+        """
+        self._observers.remove(observer)
+
+    def _notify_observers(self, event: str, *keys: Any) -> None:
+        """Helper function to call the registered observers
+
+        :param event: the name of the method modifying the graph
+        :param keys: the key of the vertex or the keys of the edge being modified
+        """
+        for observer in self._observers:
+            observer(event, *keys)
 
     @abstractmethod
     def __repr__(self) -> str:
@@ -50,7 +121,7 @@ class Graph(ABC):
         :param key: the key to check
         :returns: True if the key is contained in some vertex of the graph, else False
         """
-        return key in self._keys
+        return key in self._indices
 
     @abstractmethod
     def _get_next_vertices(self, key):
@@ -62,6 +133,28 @@ class Graph(ABC):
         if key not in self:
             raise KeyError(f"{key} is absent from the graph")
 
+    def _get_adjacency_lists(self, reverse: bool = False) -> dict:
+        """Return a snapshot of the outgoing, or incoming, adjacent vertices of every vertex, built from the stored
+        edges in a single pass. Algorithms that visit the neighbours of many vertices use it, since getting the
+        adjacent vertices of a single vertex of an undirected graph can take O(V + E) time. Edges of an undirected
+        graph are listed from both of their vertices. Time complexity: O(V + E).
+
+        :param reverse: True to list the vertices that each vertex's incoming edges come from, else False to list the
+            vertices that its outgoing edges lead to
+        :returns: mapping of vertex keys to lists of (key, weight) tuples
+        """
+        directed = self.is_directed()
+        adjacency_lists = {key: [] for key in self.get_vertices()}
+
+        for key1 in adjacency_lists:
+            for key2, weight in self._get_next_vertices(key1):
+                if not directed or not reverse:
+                    adjacency_lists[key1].append((key2, weight))
+                if not directed or reverse:
+                    adjacency_lists[key2].append((key1, weight))
+
+        return adjacency_lists
+
     def is_directed(self) -> bool:
         """Check if the graph is directed
 
@@ -85,8 +178,7 @@ class Graph(ABC):
         if key not in self:
             raise KeyError(f"{key} is absent from the graph")
 
-        idx = self._keys.index(key)
-        return self._vertices[idx].value
+        return self._vertices[self._indices[key]].value
 
     @abstractmethod
     def add_vertex(self, key: Any, value: Any = None) -> None:
@@ -98,8 +190,10 @@ class Graph(ABC):
         if key in self:
             raise KeyError(f"{key} already exists in the graph")
 
+        self._indices[key] = len(self._keys)
         self._keys.append(key)
         self._vertices.append(Graph._Vertex(key, value))
+        self._notify_observers("add_vertex", key)
 
     @abstractmethod
     def remove_vertex(self, key: Any) -> None:
@@ -110,11 +204,16 @@ class Graph(ABC):
         if key not in self:
             raise KeyError(f"{key} is absent from the graph")
 
-        idx = self._keys.index(key)
+        idx = self._indices.pop(key)
 
         del self._keys[idx]
         del self._vertices[idx]
 
+        for i in range(idx, len(self._keys)):
+            self._indices[self._keys[i]] = i
+
+        self._notify_observers("remove_vertex", key)
+
     @abstractmethod
     def add_edge(self, key1: Any, key2: Any, weight: float = None) -> None:
         """Connect the vertices associated to the passed keys with a new edge
@@ -128,6 +227,8 @@ class Graph(ABC):
         if key2 not in self:
             raise KeyError(f"{key2} is absent from the graph")
 
+        self._notify_observers("add_edge", key1, key2)
+
     @abstractmethod
     def remove_edge(self, key1: Any, key2: Any) -> None:
         """Delete the edge connecting the vertices associated with the passed keys
@@ -140,6 +241,8 @@ class Graph(ABC):
         if key2 not in self:
             raise KeyError(f"{key2} is absent from the graph")
 
+        self._notify_observers("remove_edge", key1, key2)
+
     @abstractmethod
     def get_edges(self) -> list:
         """Return a list of all the edges in the graph
@@ -259,22 +362,45 @@ class Graph(ABC):
         :param key: the key where the traversal begins from
         :returns: a generator of vertex keys
         """
-        visited = {"__steps": 0}
+        for event, vertex_key, step in self.depth_first_events(key):
+            if event == "discover":
+                yield vertex_key, step
+
+    def depth_first_events(self, key: Any) -> Generator:
+        """Return a generator that yields the events of a depth first traversal from some vertex. A "discover" event is
+        yielded when a vertex is first visited, and a "finish" event once every vertex reachable from it has been
+        visited. Each event is a tuple of the event name, the key of the vertex and the step at which the event
+        occurred, with the steps counting both kinds of events. The traversal uses an explicit stack instead of
+        recursion, so it isn't limited by the depth of the graph.
+
+        :param key: the key where the traversal begins from
+        :returns: a generator of (event, key, step) tuples
+        """
+        if key not in self:
+            raise KeyError(f"{key} is absent from the graph")
+
+        step = 1
+        visited = {key}
+        stack = [(key, iter(self._get_next_vertices(key)))]
 
-        def helper(vertex_key):
-            visited["__steps"] += 1
-            visited[vertex_key] = {"first_visit": visited["__steps"]}
+        yield "discover", key, step
 
-            yield vertex_key, visited["__steps"]
+        while len(stack) > 0:
+            vertex_key, next_vertices = stack[-1]
 
-            for k, _ in self._get_next_vertices(vertex_key):
-                if k not in visited.keys():
-                    yield from helper(k)
+            for k, _ in next_vertices:
+                if k not in visited:
+                    step += 1
+                    visited.add(k)
+                    stack.append((k, iter(self._get_next_vertices(k))))
 
-            visited["__steps"] += 1
-            visited[vertex_key] = {"last_visit": visited["__steps"]}
+                    yield "discover", k, step
+                    break
+            else:
+                step += 1
+                stack.pop()
 
-        yield from helper(key)
+                yield "finish", vertex_key, step
 
     @abstractmethod
     def breadth_first_traversal(self, key: Any) -> Generator:
@@ -283,16 +409,61 @@ class Graph(ABC):
         :param key: the key where the traversal begins from
         :returns: a generator of vertex keys
         """
-        visited = {"__steps": 1, key: {"visit": 1}}
-        helper_queue = [key]
+        if key not in self:
+            raise KeyError(f"{key} is absent from the graph")
+
+        step = 1
+        steps = {key: step}
+        helper_queue = collections.deque([key])
 
         while len(helper_queue) > 0:
-            current_key = helper_queue.pop(0)
+            current_key = helper_queue.popleft()
 
-            yield current_key, visited[current_key]["visit"]
+            yield current_key, steps[current_key]
 
             for k, _ in self._get_next_vertices(current_key):
-                if k not in visited.keys():
-                    visited["__steps"] += 1
-                    visited[k] = {"visit": visited["__steps"]}
+                if k not in steps:
+                    step += 1
+                    steps[k] = step
                     helper_queue.append(k)
+
+    def breadth_first_levels(
+        self, keys: Iterable, max_depth: Union[int, None] = None
+    ) -> Generator:
+        """Return a generator that yields the vertices of the graph a level at a time, when traversed breadth first
+        from several vertices at once. The first level is a list of the keys of the starting vertices, and each
+        following level is a list of the keys of the unvisited vertices that can be reached from the previous level
+        through one edge. Time complexity: O(V + E).
+
+        :param keys: the keys where the traversal begins from
+        :param max_depth: the number of levels to traverse after the first, None for no limit
+        :returns: a generator of lists of vertex keys
+        """
+        visited = set()
+        frontier = []
+
+        for key in keys:
+            if key not in self:
+                raise KeyError(f"{key} is absent from the graph")
+            if key not in visited:
+                visited.add(key)
+                frontier.append(key)
+
+        depth = 0
+
+        while len(frontier) > 0:
+            yield frontier
+
+            if max_depth is not None and depth >= max_depth:
+                break
+
+            depth += 1
+            next_frontier = []
+
+            for current_key in frontier:
+                for k, _ in self._get_next_vertices(current_key):
+                    if k not in visited:
+                        visited.add(k)
+                        next_frontier.append(k)
+
+            frontier = next_frontier
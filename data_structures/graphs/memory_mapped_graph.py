@@ -0,0 +1,576 @@
+import collections
+import json
+import mmap
+import os
+import pickle
+import sys
+from array import array
+from typing import Any, Generator, Union
+
+from compressed_sparse_row_graph import CompressedSparseRowGraph
+from graph import Graph
+
+_ARRAY_TYPECODES = {
+    "offsets": "q",
+    "targets": "q",
+    "weights": "d",
+    "incoming_offsets": "q",
+    "sources": "q",
+    "incoming_weights": "d",
+    "keys": "q",
+    "key_offsets": "q",
+    "key_index": "q",
+}
+
+
+def _get_key_type(keys: list) -> str:
+    """Helper function to get the name of the type of the keys of a graph, raising a TypeError if the keys aren't all
+    integers or all strings
+
+    :param keys: the keys of the vertices
+    :returns: "int" or "str"
+    """
+    if all(type(key) is int for key in keys):
+        return "int"
+    if all(type(key) is str for key in keys):
+        return "str"
+    raise TypeError("Memory-mapped graphs require all keys to be integers or strings")
+
+
+def _get_weight(weight: float) -> Union[float, None]:
+    """Helper function to get the weight of an edge as stored in the weights arrays, where NaN stands for an edge
+    without a weight
+
+    :param weight: the stored weight
+    :returns: the weight of the edge, None if the edge has no weight
+    """
+    return None if weight != weight else weight
+
+
+def _group_by_target(offsets: array, targets: array, weights: array) -> tuple:
+    """Helper function to group the edges of a CSR graph by their target vertex using a counting sort, ordering the
+    edges entering each vertex by the ids of their source vertices
+
+    :param offsets: the offsets of the edges leaving each vertex
+    :param targets: the ids of the target vertices of the edges
+    :param weights: the weights of the edges
+    :returns: a tuple of the incoming offsets, sources and incoming weights arrays
+    """
+    n = len(offsets) - 1
+    incoming_offsets = array("q", bytes(8 * (n + 1)))
+
+    for j in targets:
+        incoming_offsets[j + 1] += 1
+    for j in range(n):
+        incoming_offsets[j + 1] += incoming_offsets[j]
+
+    positions = incoming_offsets[:-1]
+    sources = array("q", bytes(8 * len(targets)))
+    incoming_weights = array("d", bytes(8 * len(weights)))
+
+    for i in range(n):
+        for position in range(offsets[i], offsets[i + 1]):
+            j = targets[position]
+            sources[positions[j]] = i
+            incoming_weights[positions[j]] = weights[position]
+            positions[j] += 1
+
+    return incoming_offsets, sources, incoming_weights
+
+
+def write_memory_mapped_graph(graph: Graph, directory: str) -> None:
+    """Write a graph to a directory of flat binary arrays that MemoryMappedGraph can map into memory. The edges are
+    stored in compressed sparse row form, grouped both by their source and by their target vertex, along with the keys
+    of the vertices and an index of the keys sorted for binary search. Keys must be all integers or all strings.
+    Vertex values other than None are pickled into a separate file. Time complexity: O(V + E + VlogV).
+
+    :param graph: the graph to write
+    :param directory: the path of the directory, which is created if it doesn't exist
+    """
+    if not isinstance(graph, CompressedSparseRowGraph):
+        graph = CompressedSparseRowGraph.from_graph(graph)
+
+    keys = graph.get_vertices()
+    key_type = _get_key_type(keys)
+    offsets, targets, weights = graph.get_arrays()
+    arrays = {"offsets": offsets, "targets": targets, "weights": weights}
+    (
+        arrays["incoming_offsets"],
+        arrays["sources"],
+        arrays["incoming_weights"],
+    ) = _group_by_target(offsets, targets, weights)
+
+    if key_type == "int":
+        arrays["keys"] = array("q", keys)
+        arrays["key_index"] = array("q", sorted(range(len(keys)), key=keys.__getitem__))
+        key_bytes = None
+    else:
+        encoded_keys = [key.encode() for key in keys]
+        arrays["key_offsets"] = array("q", [0])
+        for encoded_key in encoded_keys:
+            arrays["key_offsets"].append(arrays["key_offsets"][-1] + len(encoded_key))
+        arrays["key_index"] = array(
+            "q", sorted(range(len(keys)), key=encoded_keys.__getitem__)
+        )
+        key_bytes = b"".join(encoded_keys)
+
+    os.makedirs(directory, exist_ok=True)
+
+    for name, values in arrays.items():
+        with open(os.path.join(directory, f"{name}.bin"), "wb") as file:
+            values.tofile(file)
+
+    if key_bytes is not None:
+        with open(os.path.join(directory, "keys.bin"), "wb") as file:
+            file.write(key_bytes)
+
+    values = [graph.get_vertex_value(key) for key in keys]
+    has_values = any(value is not None for value in values)
+    if has_values:
+        with open(os.path.join(directory, "values.pickle"), "wb") as file:
+            pickle.dump(values, file)
+
+    with open(os.path.join(directory, "metadata.json"), "w") as file:
+        json.dump(
+            {
+                "directed": graph.is_directed(),
+                "vertex_count": len(keys),
+                "edge_count": len(targets),
+                "key_type": key_type,
+                "byteorder": sys.byteorder,
+                "has_values": has_values,
+            },
+            file,
+        )
+
+
+class MemoryMappedGraph(Graph):
+    """A memory-mapped graph is a read-only compressed sparse row graph whose arrays are files written by
+    write_memory_mapped_graph(), mapped into memory rather than read. Opening the graph only reads a small metadata
+    file, and the operating system loads the pages of the arrays as they are touched, so graphs larger than the
+    available memory can be queried and traversed. Vertices are looked up by binary search over a sorted index of their
+    keys, which must be all integers or all strings.
+
+    Edges without a weight are stored with a weight of NaN and returned with a weight of None, as in the source graph,
+    while all other weights are returned as floats. Vertex values are loaded from their own file the first time one is
+    requested.
+
+    Write a graph to a directory and map it into memory
+
+        >>> import tempfile
+        >>> from adjacency_list_graph import AdjacencyListGraph
+        >>> a_graph = AdjacencyListGraph(directed=True)
+        >>> for key in ["a", "b", "c", "d", "e"]:
+        ...     a_graph.add_vertex(key)
+        >>> for key1, key2, weight in [("a", "b", 1), ("a", "c", 2), ("b", "c", 3), ("c", "e", 4), ("d", "e", 5)]:
+        ...     a_graph.add_edge(key1, key2, weight)
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> write_memory_mapped_graph(a_graph, directory.name)
+        >>> mapped_graph = MemoryMappedGraph(directory.name)
+
+    Check if a graph is directed
+
+        >>> mapped_graph.is_directed()
+        True
+
+    Get keys of all the vertices in a graph
+
+        >>> mapped_graph.get_vertices()
+        ['a', 'b', 'c', 'd', 'e']
+
+    Check if a vertex corresponding to some key is contained in the graph
+
+        >>> "a" in mapped_graph
+        True
+        >>> "z" in mapped_graph
+        False
+
+    Get all the edges in a graph
+
+        >>> mapped_graph.get_edges()
+        [('a', 'b', 1.0), ('a', 'c', 2.0), ('b', 'c', 3.0), ('c', 'e', 4.0), ('d', 'e', 5.0)]
+
+    Check if a pair of vertices form an edge, and get its weight
+
+        >>> mapped_graph.is_edge("a", "c")
+        True
+        >>> mapped_graph.is_edge("c", "a")
+        False
+        >>> mapped_graph.get_edge_weight("b", "c")
+        3.0
+
+    Get adjacent vertices relative to some vertex
+
+        >>> mapped_graph.get_adjacent_vertices("c")
+        [('a', 2.0), ('b', 3.0), ('e', 4.0)]
+        >>> mapped_graph.get_incoming_adjacent_vertices("c")
+        [('a', 2.0), ('b', 3.0)]
+        >>> mapped_graph.get_outgoing_adjacent_vertices("c")
+        [('e', 4.0)]
+
+    Get incoming and outgoing edges of a vertex
+
+        >>> mapped_graph.get_incoming_edges("e")
+        [('c', 'e', 4.0), ('d', 'e', 5.0)]
+        >>> mapped_graph.get_outgoing_edges("a")
+        [('a', 'b', 1.0), ('a', 'c', 2.0)]
+
+    Depth-first traversal of a graph
+
+        >>> [i for i in mapped_graph.depth_first_traversal("a")]
+        [('a', 1), ('b', 2), ('c', 3), ('e', 4)]
+
+    Breadth-first traversal of a graph
+
+        >>> [i for i in mapped_graph.breadth_first_traversal("a")]
+        [('a', 1), ('b', 2), ('c', 3), ('e', 4)]
+
+    Edges without a weight keep no weight
+
+        >>> unweighted_graph = AdjacencyListGraph(directed=False)
+        >>> for key in [1, 2, 3]:
+        ...     unweighted_graph.add_vertex(key)
+        >>> unweighted_graph.add_edge(1, 2)
+        >>> unweighted_graph.add_edge(3, 2, 0.5)
+        >>> other_directory = tempfile.TemporaryDirectory()
+        >>> write_memory_mapped_graph(unweighted_graph, other_directory.name)
+        >>> with MemoryMappedGraph(other_directory.name) as other_mapped_graph:
+        ...     other_mapped_graph.get_edges() == unweighted_graph.get_edges()
+        ...     other_mapped_graph.get_edge_weight(2, 1) is None
+        ...     other_mapped_graph.get_adjacent_vertices(2)
+        True
+        True
+        [(1, None), (3, 0.5)]
+        >>> other_directory.cleanup()
+
+    The graph can't be modified
+
+        >>> mapped_graph.add_vertex("f")
+        Traceback (most recent call last):
+        ...
+        TypeError: Memory-mapped graphs are read-only
+
+    Unmap the files
+
+        >>> mapped_graph.close()
+        >>> directory.cleanup()
+    """
+
+    def __init__(self, directory: str):
+        """Map the arrays of a graph written by write_memory_mapped_graph() into memory. Time complexity: O(1).
+
+        :param directory: the path of the directory
+        """
+        with open(os.path.join(directory, "metadata.json")) as file:
+            metadata = json.load(file)
+
+        if metadata["byteorder"] != sys.byteorder:
+            raise ValueError(
+                f"The graph was written on a {metadata['byteorder']} endian machine"
+            )
+
+        super().__init__(metadata["directed"])
+        self.__directory = directory
+        self.__vertex_count = metadata["vertex_count"]
+        self.__key_type = metadata["key_type"]
+        self.__has_values = metadata["has_values"]
+        self.__values = None
+        self.__maps = []
+
+        self.__offsets = self.__map("offsets")
+        self.__targets = self.__map("targets")
+        self.__weights = self.__map("weights")
+        self.__incoming_offsets = self.__map("incoming_offsets")
+        self.__sources = self.__map("sources")
+        self.__incoming_weights = self.__map("incoming_weights")
+        self.__key_index = self.__map("key_index")
+
+        if self.__key_type == "int":
+            self.__keys = self.__map("keys")
+        else:
+            self.__keys = self.__map("keys", None)
+            self.__key_offsets = self.__map("key_offsets")
+
+    def __enter__(self) -> "MemoryMappedGraph":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __map(self, name: str, typecode: Union[str, None] = "") -> memoryview:
+        """Helper function to map the file of an array into memory
+
+        :param name: the name of the array
+        :param typecode: the type code of the array's items, an empty string for the array's default, or None for bytes
+        :returns: a read-only memoryview of the array
+        """
+        if typecode == "":
+            typecode = _ARRAY_TYPECODES[name]
+
+        with open(os.path.join(self.__directory, f"{name}.bin"), "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                view = memoryview(b"")
+            else:
+                mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.__maps.append(mapped_file)
+                view = memoryview(mapped_file)
+
+        return view if typecode is None else view.cast(typecode)
+
+    def __get_key(self, idx: int) -> Any:
+        """Helper function to get the key of the vertex with the passed id
+
+        :param idx: the id of the vertex
+        :returns: the key of the vertex
+        """
+        if self.__key_type == "int":
+            return self.__keys[idx]
+
+        start, end = self.__key_offsets[idx], self.__key_offsets[idx + 1]
+        return bytes(self.__keys[start:end]).decode()
+
+    def __find_id(self, key: Any) -> Union[int, None]:
+        """Helper function to find the id of the vertex with the passed key by binary search over the sorted index of
+        the keys. Time complexity: O(logV).
+
+        :param key: the key of the vertex
+        :returns: the id of the vertex, or None if the vertex doesn't exist
+        """
+        if self.__key_type == "int":
+            if type(key) is not int:
+                return None
+            get_key = self.__keys.__getitem__
+        else:
+            if type(key) is not str:
+                return None
+            key = key.encode()
+            keys, key_offsets = self.__keys, self.__key_offsets
+
+            def get_key(i):
+                return bytes(keys[key_offsets[i] : key_offsets[i + 1]])
+
+        key_index = self.__key_index
+        low, high = 0, len(key_index)
+
+        while low < high:
+            mid = (low + high) // 2
+            if get_key(key_index[mid]) < key:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low < len(key_index) and get_key(key_index[low]) == key:
+            return key_index[low]
+        return None
+
+    def __get_id(self, key: Any) -> int:
+        """Helper function to get the id of a vertex, raising a KeyError if the vertex doesn't exist
+
+        :param key: the key of the vertex
+        :returns: the id of the vertex
+        """
+        idx = self.__find_id(key)
+        if idx is None:
+            raise KeyError(f"{key} is absent from the graph")
+        return idx
+
+    def __get_outgoing(self, idx: int) -> list:
+        """Helper function to get the (key, weight) pairs of the edges leaving the vertex of the passed id
+
+        :param idx: the id of the vertex
+        :returns: list of (key, weight) pairs
+        """
+        start, end = self.__offsets[idx], self.__offsets[idx + 1]
+
+        return [
+            (self.__get_key(j), _get_weight(weight))
+            for j, weight in zip(self.__targets[start:end], self.__weights[start:end])
+        ]
+
+    def __get_incoming(self, idx: int, before: Union[bool, None]) -> list:
+        """Helper function to get the (key, weight) pairs of the edges entering the vertex of the passed id, ordered by
+        the ids of their source vertices and excluding self-loops
+
+        :param idx: the id of the vertex
+        :param before: True to only include sources with smaller ids than the vertex, False to only include sources
+            with larger ids, None to include both
+        :returns: list of (key, weight) pairs
+        """
+        start, end = self.__incoming_offsets[idx], self.__incoming_offsets[idx + 1]
+        vertices = []
+
+        for j, weight in zip(
+            self.__sources[start:end], self.__incoming_weights[start:end]
+        ):
+            if (
+                j == idx
+                or (before is True and j > idx)
+                or (before is False and j < idx)
+            ):
+                continue
+            vertices.append((self.__get_key(j), _get_weight(weight)))
+
+        return vertices
+
+    def __repr__(self) -> str:
+        s = "{\n"
+        for i in range(self.__vertex_count):
+            s += f"\t{self.__get_key(i)}: {self.__get_outgoing(i)}\n"
+        s += "}"
+
+        return s
+
+    def __contains__(self, key: Any) -> bool:
+        return self.__find_id(key) is not None
+
+    def close(self) -> None:
+        """Unmap the files of the graph. The graph can't be used afterwards."""
+        views = [
+            self.__offsets,
+            self.__targets,
+            self.__weights,
+            self.__incoming_offsets,
+            self.__sources,
+            self.__incoming_weights,
+            self.__key_index,
+            self.__keys,
+        ]
+        if self.__key_type == "str":
+            views.append(self.__key_offsets)
+
+        for view in views:
+            view.release()
+        for mapped_file in self.__maps:
+            mapped_file.close()
+        self.__maps = []
+
+    def _get_next_vertices(self, key):
+        return self.__get_outgoing(self.__get_id(key))
+
+    def get_vertices(self) -> list:
+        return [self.__get_key(i) for i in range(self.__vertex_count)]
+
+    def get_vertex_value(self, key: Any) -> Any:
+        idx = self.__get_id(key)
+        if not self.__has_values:
+            return None
+
+        if self.__values is None:
+            with open(os.path.join(self.__directory, "values.pickle"), "rb") as file:
+                self.__values = pickle.load(file)
+
+        return self.__values[idx]
+
+    def add_vertex(self, key: Any, value: Any = None) -> None:
+        raise TypeError("Memory-mapped graphs are read-only")
+
+    def remove_vertex(self, key: Any) -> None:
+        raise TypeError("Memory-mapped graphs are read-only")
+
+    def add_edge(self, key1: Any, key2: Any, weight: float = None) -> None:
+        raise TypeError("Memory-mapped graphs are read-only")
+
+    def remove_edge(self, key1: Any, key2: Any) -> None:
+        raise TypeError("Memory-mapped graphs are read-only")
+
+    def get_edges(self) -> list:
+        return super().get_edges()
+
+    def get_adjacent_vertices(self, key: Any) -> list:
+        idx = self.__get_id(key)
+
+        return (
+            self.__get_incoming(idx, True)
+            + self.__get_outgoing(idx)
+            + self.__get_incoming(idx, False)
+        )
+
+    def get_incoming_adjacent_vertices(self, key: Any) -> list:
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        return self.__get_incoming(self.__get_id(key), None)
+
+    def get_outgoing_adjacent_vertices(self, key: Any) -> list:
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        return self.__get_outgoing(self.__get_id(key))
+
+    def get_edge_weight(self, key1: Any, key2: Any) -> float:
+        idx1 = self.__get_id(key1)
+        idx2 = self.__get_id(key2)
+
+        for i in range(self.__offsets[idx1], self.__offsets[idx1 + 1]):
+            if self.__targets[i] == idx2:
+                return _get_weight(self.__weights[i])
+
+        if not self.is_directed():
+            for i in range(self.__offsets[idx2], self.__offsets[idx2 + 1]):
+                if self.__targets[i] == idx1:
+                    return _get_weight(self.__weights[i])
+
+        raise ValueError(f"Edge ({key1}, {key2}) is absent from the graph")
+
+    def get_outgoing_edges(self, key: Any) -> list:
+        return super().get_outgoing_edges(key)
+
+    def get_incoming_edges(self, key: Any) -> list:
+        return super().get_incoming_edges(key)
+
+    def is_edge(self, key1: Any, key2: Any) -> bool:
+        try:
+            self.get_edge_weight(key1, key2)
+        except ValueError:
+            return False
+        return True
+
+    def depth_first_traversal(self, key: Any) -> Generator:
+        offsets, targets = self.__offsets, self.__targets
+        start = self.__get_id(key)
+        visited = bytearray(self.__vertex_count)
+        visited[start] = 1
+        steps = 1
+        stack = [[start, offsets[start]]]
+
+        yield key, steps
+
+        while len(stack) > 0:
+            frame = stack[-1]
+            i, position = frame
+            end = offsets[i + 1]
+
+            while position < end and visited[targets[position]]:
+                position += 1
+
+            if position < end:
+                frame[1] = position + 1
+                j = targets[position]
+                visited[j] = 1
+                steps += 1
+                stack.append([j, offsets[j]])
+
+                yield self.__get_key(j), steps
+            else:
+                steps += 1
+                stack.pop()
+
+    def breadth_first_traversal(self, key: Any) -> Generator:
+        offsets, targets = self.__offsets, self.__targets
+        start = self.__get_id(key)
+        visited = bytearray(self.__vertex_count)
+        visited[start] = 1
+        steps = 1
+        helper_queue = collections.deque([(start, steps)])
+
+        while len(helper_queue) > 0:
+            i, visit = helper_queue.popleft()
+
+            yield self.__get_key(i), visit
+
+            for position in range(offsets[i], offsets[i + 1]):
+                j = targets[position]
+                if not visited[j]:
+                    visited[j] = 1
+                    steps += 1
+                    helper_queue.append((j, steps))
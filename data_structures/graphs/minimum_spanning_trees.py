@@ -0,0 +1,122 @@
+import heapq
+
+from graph import Graph
+
+from data_structures.disjoint_sets import ArrayDisjointSet
+
+
+def _check_undirected(graph: Graph) -> None:
+    """Helper function to raise a ValueError if a graph is directed
+
+    :param graph: the graph to check
+    """
+    if graph.is_directed():
+        raise ValueError("Minimum spanning trees require an undirected graph")
+
+
+def kruskal(graph: Graph) -> list:
+    """Kruskal's algorithm finds a minimum spanning forest of an undirected graph, which is a minimum spanning tree of
+    each of its connected components. It goes through the edges from the lightest to the heaviest, and adds each edge
+    that connects two vertices that aren't yet connected, which is checked using a disjoint set of the vertices. The
+    edges are read from the graph in a single pass over the stored edges. Edges without a weight weigh 1. Time
+    complexity: O(ElogE).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=False)
+    >>> for key in ["a", "b", "c", "d"]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [("a", "b", 4), ("a", "c", 1), ("b", "c", 2), ("b", "d", 5), ("c", "d", 8)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> kruskal(a_graph)
+    [('a', 'c', 1), ('b', 'c', 2), ('b', 'd', 5)]
+
+    :param graph: the undirected graph to span
+    :returns: a list of the edges of the minimum spanning forest, ordered by weight
+    """
+    _check_undirected(graph)
+
+    vertices = graph.get_vertices()
+    positions = {key: i for i, key in enumerate(vertices)}
+    edges = sorted(
+        (
+            (key1, key2, weight)
+            for key1 in vertices
+            for key2, weight in graph._get_next_vertices(key1)
+        ),
+        key=lambda edge: 1 if edge[2] is None else edge[2],
+    )
+    disjoint_set = ArrayDisjointSet(len(vertices))
+    tree_edges = []
+
+    for key1, key2, weight in edges:
+        if disjoint_set.union(positions[key1], positions[key2]):
+            tree_edges.append((key1, key2, weight))
+            if len(tree_edges) == len(vertices) - 1:
+                break
+
+    return tree_edges
+
+
+def prim(graph: Graph) -> list:
+    """Prim's algorithm finds a minimum spanning forest of an undirected graph, which is a minimum spanning tree of
+    each of its connected components. It grows each tree from a vertex by repeatedly adding the lightest edge that
+    connects the tree to a vertex outside it, taken from a binary heap of the edges leaving the tree. The edges of all
+    the vertices are read from the graph once, before the trees are grown. Edges without a weight weigh 1. Time
+    complexity: O(ElogE).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=False)
+    >>> for key in ["a", "b", "c", "d"]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [("a", "b", 4), ("a", "c", 1), ("b", "c", 2), ("b", "d", 5), ("c", "d", 8)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> prim(a_graph)
+    [('a', 'c', 1), ('c', 'b', 2), ('b', 'd', 5)]
+
+    :param graph: the undirected graph to span
+    :returns: a list of the edges of the minimum spanning forest, in the order in which they were added, each leading
+        from a vertex in a tree to the vertex it added to the tree
+    """
+    _check_undirected(graph)
+
+    adjacency_lists = graph._get_adjacency_lists()
+    visited = set()
+    tree_edges = []
+    counter = 0
+
+    for root in graph.get_vertices():
+        if root in visited:
+            continue
+
+        visited.add(root)
+        heap = []
+
+        for key2, weight in adjacency_lists[root]:
+            heapq.heappush(
+                heap, (1 if weight is None else weight, counter, root, key2, weight)
+            )
+            counter += 1
+
+        while len(heap) > 0:
+            _, _, key1, key2, weight = heapq.heappop(heap)
+            if key2 in visited:
+                continue
+
+            visited.add(key2)
+            tree_edges.append((key1, key2, weight))
+
+            for next_key, next_weight in adjacency_lists[key2]:
+                if next_key not in visited:
+                    heapq.heappush(
+                        heap,
+                        (
+                            1 if next_weight is None else next_weight,
+                            counter,
+                            key2,
+                            next_key,
+                            next_weight,
+                        ),
+                    )
+                    counter += 1
+
+    return tree_edges
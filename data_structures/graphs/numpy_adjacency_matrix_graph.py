@@ -0,0 +1,428 @@
+from typing import Any, Generator, Union
+
+from graph import Graph
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+class NumpyAdjacencyMatrixGraph(Graph):
+    """A NumPy adjacency matrix graph is an adjacency matrix graph whose matrix is a 2-dimensional NumPy array of
+    floats, with NaN marking that the corresponding vertices are not connected. The array is allocated with spare
+    capacity, which doubles whenever it's exhausted, so adding a vertex doesn't reallocate the matrix every time. Whole
+    rows and columns of the matrix can be queried at once, which allows vectorized degree, neighbour, transpose and
+    reachability queries. Requires NumPy.
+
+    Edges added without a weight are given a weight of 1, and all weights are returned as floats.
+
+    Instantiate a NumPy adjacency matrix graph object
+
+        >>> directed_graph = NumpyAdjacencyMatrixGraph(directed=True)
+        >>> undirected_graph = NumpyAdjacencyMatrixGraph(directed=False)
+
+    Add vertices and edges to a graph
+
+        >>> for key in [1, 2, 3, 4, 5]:
+        ...     directed_graph.add_vertex(key, key * 1000)
+        ...     undirected_graph.add_vertex(key, key * 1000)
+        >>> edges = [(1, 2, 100), (1, 3, 200), (1, 4, 300), (2, 3, 400), (2, 5, 500), (3, 5, 600), (4, 5, 700)]
+        >>> for key1, key2, weight in edges:
+        ...     directed_graph.add_edge(key1, key2, weight)
+        ...     undirected_graph.add_edge(key1, key2, weight)
+
+    Get keys of all the vertices in a graph
+
+        >>> directed_graph.get_vertices()
+        [1, 2, 3, 4, 5]
+
+    Get all the edges in a graph
+
+        >>> directed_graph.get_edges()
+        [(1, 2, 100.0), (1, 3, 200.0), (1, 4, 300.0), (2, 3, 400.0), (2, 5, 500.0), (3, 5, 600.0), (4, 5, 700.0)]
+
+    Check if a pair of vertices form an edge
+
+        >>> directed_graph.is_edge(2, 1)
+        False
+        >>> undirected_graph.is_edge(2, 1)
+        True
+
+    Get the weight of some edge
+
+        >>> undirected_graph.get_edge_weight(2, 1)
+        100.0
+
+    Get adjacent vertices relative to some vertex
+
+        >>> directed_graph.get_adjacent_vertices(2)
+        [(1, 100.0), (3, 400.0), (5, 500.0)]
+        >>> directed_graph.get_incoming_adjacent_vertices(2)
+        [(1, 100.0)]
+        >>> directed_graph.get_outgoing_adjacent_vertices(2)
+        [(3, 400.0), (5, 500.0)]
+        >>> undirected_graph.get_outgoing_adjacent_vertices(2)
+        [(1, 100.0), (3, 400.0), (5, 500.0)]
+
+    Get the degrees of all the vertices, in the order of get_vertices()
+
+        >>> directed_graph.get_out_degrees().tolist()
+        [3, 2, 1, 1, 0]
+        >>> directed_graph.get_in_degrees().tolist()
+        [0, 1, 2, 1, 3]
+        >>> undirected_graph.get_out_degrees().tolist()
+        [3, 3, 3, 2, 3]
+
+    Get a boolean matrix of the vertices connected by an edge
+
+        >>> directed_graph.get_adjacency_mask().astype(int).tolist()[0]
+        [0, 1, 1, 1, 0]
+
+    Get the transpose of a graph, whose edges are reversed
+
+        >>> directed_graph.transpose().get_outgoing_adjacent_vertices(5)
+        [(2, 500.0), (3, 600.0), (4, 700.0)]
+
+    Get a boolean matrix of the vertices reachable from each vertex
+
+        >>> directed_graph.get_reachability().astype(int).tolist()[1]
+        [0, 1, 1, 0, 1]
+        >>> directed_graph.get_reachability(max_steps=1).astype(int).tolist()[0]
+        [1, 1, 1, 1, 0]
+        >>> directed_graph.is_reachable(1, 5)
+        True
+        >>> directed_graph.is_reachable(5, 1)
+        False
+
+    String representation of a graph
+
+        >>> str(directed_graph)
+        '[-, 100.0, 200.0, 300.0, -]\\n[-, -, 400.0, -, 500.0]\\n[-, -, -, -, 600.0]\\n[-, -, -, -, 700.0]\\n\
+[-, -, -, -, -]'
+
+    Depth-first traversal of a graph
+
+        >>> [i for i in directed_graph.depth_first_traversal(1)]
+        [(1, 1), (2, 2), (3, 3), (5, 4), (4, 8)]
+
+    Breadth-first traversal of a graph
+
+        >>> [i for i in undirected_graph.breadth_first_traversal(1)]
+        [(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)]
+
+    Delete an edge
+
+        >>> directed_graph.remove_edge(1, 2)
+        >>> directed_graph.is_edge(1, 2)
+        False
+
+    Delete a vertex
+
+        >>> directed_graph.remove_vertex(1)
+        >>> directed_graph.get_vertices()
+        [2, 3, 4, 5]
+        >>> directed_graph.get_in_degrees().tolist()
+        [0, 1, 0, 3]
+    """
+
+    def __init__(self, directed: bool, capacity: int = 8, dtype: Any = None):
+        """
+        :param directed: True if the graph is directed, else False
+        :param capacity: number of vertices to allocate space for up front
+        :param dtype: NumPy floating point type of the matrix, float64 by default
+        """
+        if np is None:
+            raise ImportError("NumPy adjacency matrix graphs require numpy")
+        if capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+
+        super().__init__(directed)
+        self.__dtype = np.float64 if dtype is None else dtype
+        self.__adjacency_matrix = np.full((capacity, capacity), np.nan, self.__dtype)
+
+    def __get_matrix(self) -> "np.ndarray":
+        """Helper function to get the part of the matrix that holds the vertices of the graph, without spare capacity
+
+        :returns: a view of the matrix
+        """
+        n = len(self._keys)
+        return self.__adjacency_matrix[:n, :n]
+
+    def __get_index(self, key: Any) -> int:
+        """Helper function to get the row and column of a vertex, raising a KeyError if the vertex doesn't exist
+
+        :param key: the key of the vertex
+        :returns: the index of the vertex
+        """
+        if key not in self:
+            raise KeyError(f"{key} is absent from the graph")
+        return self._indices[key]
+
+    def __to_vertices(self, indices: "np.ndarray", weights: "np.ndarray") -> list:
+        """Helper function to convert arrays of vertex indices and weights to a list of (key, weight) pairs
+
+        :param indices: indices of the vertices
+        :param weights: weights of the edges
+        :returns: list of (key, weight) pairs
+        """
+        return [(self._keys[i], w) for i, w in zip(indices.tolist(), weights.tolist())]
+
+    def __get_row(self, idx: int) -> list:
+        """Helper function to get the (key, weight) pairs of the edges stored in the row of a vertex
+
+        :param idx: the index of the vertex
+        :returns: list of (key, weight) pairs
+        """
+        row = self.__get_matrix()[idx]
+        indices = np.flatnonzero(~np.isnan(row))
+        return self.__to_vertices(indices, row[indices])
+
+    def __get_column(self, idx: int, start: int, end: int) -> list:
+        """Helper function to get the (key, weight) pairs of the edges stored in the column of a vertex, within a
+        range of rows and excluding self-loops
+
+        :param idx: the index of the vertex
+        :param start: first row to include
+        :param end: row after the last row to include
+        :returns: list of (key, weight) pairs
+        """
+        column = self.__get_matrix()[start:end, idx]
+        indices = np.flatnonzero(~np.isnan(column)) + start
+        indices = indices[indices != idx]
+        return self.__to_vertices(indices, self.__get_matrix()[indices, idx])
+
+    def __repr__(self) -> str:
+        return "\n".join(
+            "[" + ", ".join("-" if np.isnan(w) else str(w) for w in row) + "]"
+            for row in self.__get_matrix().tolist()
+        )
+
+    def _get_next_vertices(self, key):
+        return self.__get_row(self.__get_index(key))
+
+    def __reserve(self, n: int) -> None:
+        """Helper function to double the capacity of the matrix until it can hold the passed number of vertices
+
+        :param n: the number of vertices
+        """
+        old_capacity = capacity = self.__adjacency_matrix.shape[0]
+
+        while n > capacity:
+            capacity *= 2
+
+        if capacity > old_capacity:
+            matrix = np.full((capacity, capacity), np.nan, self.__dtype)
+            matrix[:old_capacity, :old_capacity] = self.__adjacency_matrix
+            self.__adjacency_matrix = matrix
+
+    def _load_edges(self, vertices, edges):
+        for key, value in vertices:
+            super().add_vertex(key, value)
+
+        rows = []
+        columns = []
+        weights = []
+
+        for key1, key2, weight in edges:
+            if key1 not in self:
+                super().add_vertex(key1)
+            if key2 not in self:
+                super().add_vertex(key2)
+
+            rows.append(self._indices[key1])
+            columns.append(self._indices[key2])
+            weights.append(1 if weight is None else weight)
+
+        self.__reserve(len(self._keys))
+        self.__adjacency_matrix[rows, columns] = weights
+
+    def add_vertex(self, key: Any, value: Any = None) -> None:
+        super().add_vertex(key, value)
+        self.__reserve(len(self._keys))
+
+    def remove_vertex(self, key: Any) -> None:
+        idx = self.__get_index(key)
+        n = len(self._keys)
+        matrix = self.__adjacency_matrix
+
+        super().remove_vertex(key)
+
+        matrix[idx : n - 1, :n] = matrix[idx + 1 : n, :n]
+        matrix[: n - 1, idx : n - 1] = matrix[: n - 1, idx + 1 : n]
+        matrix[n - 1, :n] = np.nan
+        matrix[:n, n - 1] = np.nan
+
+    def add_edge(self, key1: Any, key2: Any, weight: float = None) -> None:
+        super().add_edge(key1, key2, weight)
+        self.__adjacency_matrix[self._indices[key1], self._indices[key2]] = (
+            1 if weight is None else weight
+        )
+
+    def remove_edge(self, key1: Any, key2: Any) -> None:
+        super().remove_edge(key1, key2)
+
+        idx1 = self._indices[key1]
+        idx2 = self._indices[key2]
+        matrix = self.__adjacency_matrix
+
+        if not np.isnan(matrix[idx1, idx2]):
+            matrix[idx1, idx2] = np.nan
+        elif not self.is_directed() and not np.isnan(matrix[idx2, idx1]):
+            matrix[idx2, idx1] = np.nan
+        else:
+            raise ValueError(f"Edge ({key1}, {key2}) is absent from the graph")
+
+    def get_edges(self) -> list:
+        return super().get_edges()
+
+    def get_adjacent_vertices(self, key: Any) -> list:
+        idx = self.__get_index(key)
+
+        return (
+            self.__get_column(idx, 0, idx)
+            + self.__get_row(idx)
+            + self.__get_column(idx, idx + 1, len(self._keys))
+        )
+
+    def get_incoming_adjacent_vertices(self, key: Any) -> list:
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        return self.__get_column(self.__get_index(key), 0, len(self._keys))
+
+    def get_outgoing_adjacent_vertices(self, key: Any) -> list:
+        if not self.is_directed():
+            return self.get_adjacent_vertices(key)
+
+        return self.__get_row(self.__get_index(key))
+
+    def get_edge_weight(self, key1: Any, key2: Any) -> float:
+        idx1 = self.__get_index(key1)
+        idx2 = self.__get_index(key2)
+        matrix = self.__adjacency_matrix
+
+        if not np.isnan(matrix[idx1, idx2]):
+            return float(matrix[idx1, idx2])
+        if not self.is_directed() and not np.isnan(matrix[idx2, idx1]):
+            return float(matrix[idx2, idx1])
+
+        raise ValueError(f"Edge ({key1}, {key2}) is absent from the graph")
+
+    def get_outgoing_edges(self, key: Any) -> list:
+        return super().get_outgoing_edges(key)
+
+    def get_incoming_edges(self, key: Any) -> list:
+        return super().get_incoming_edges(key)
+
+    def is_edge(self, key1: Any, key2: Any) -> bool:
+        try:
+            self.get_edge_weight(key1, key2)
+        except ValueError:
+            return False
+        return True
+
+    def depth_first_traversal(self, key: Any) -> Generator:
+        yield from super().depth_first_traversal(key)
+
+    def breadth_first_traversal(self, key: Any) -> Generator:
+        yield from super().breadth_first_traversal(key)
+
+    def get_adjacency_mask(self) -> "np.ndarray":
+        """Return a boolean matrix whose entry at row i and column j is True if the vertex at index i of
+        get_vertices() has an outgoing edge to the vertex at index j. The matrix is symmetric if the graph is
+        undirected. Time complexity: O(V^2), vectorized.
+
+        :returns: a V by V boolean array
+        """
+        mask = ~np.isnan(self.__get_matrix())
+
+        if not self.is_directed():
+            mask |= mask.T
+
+        return mask
+
+    def get_out_degrees(self) -> "np.ndarray":
+        """Return the number of outgoing edges of every vertex, in the order of get_vertices(). In an undirected graph,
+        this is the number of edges connected to each vertex. Time complexity: O(V^2), vectorized.
+
+        :returns: an array of V integers
+        """
+        return self.get_adjacency_mask().sum(axis=1)
+
+    def get_in_degrees(self) -> "np.ndarray":
+        """Return the number of incoming edges of every vertex, in the order of get_vertices(). In an undirected graph,
+        this is the number of edges connected to each vertex. Time complexity: O(V^2), vectorized.
+
+        :returns: an array of V integers
+        """
+        return self.get_adjacency_mask().sum(axis=0)
+
+    def transpose(self) -> "NumpyAdjacencyMatrixGraph":
+        """Return a new graph with the same vertices as this graph and all its edges reversed. Time complexity: O(V^2),
+        vectorized.
+
+        :returns: the transposed graph
+        """
+        n = len(self._keys)
+        graph = NumpyAdjacencyMatrixGraph(
+            self.is_directed(), self.__adjacency_matrix.shape[0], self.__dtype
+        )
+
+        for vertex in self._vertices:
+            Graph.add_vertex(graph, vertex.key, vertex.value)
+
+        graph.__adjacency_matrix[:n, :n] = self.__get_matrix().T
+
+        return graph
+
+    def get_reachability(self, max_steps: Union[int, None] = None) -> "np.ndarray":
+        """Return a boolean matrix whose entry at row i and column j is True if the vertex at index j of
+        get_vertices() can be reached from the vertex at index i by following at most max_steps edges. Every vertex
+        can reach itself. The matrix is computed by repeatedly squaring the adjacency matrix. Time complexity:
+        O(V^3 log V), vectorized.
+
+        :param max_steps: the maximum number of edges to follow, None for no limit
+        :returns: a V by V boolean array
+        """
+        n = len(self._keys)
+        step = self.get_adjacency_mask().astype(np.float32)
+        step[np.diag_indices(n)] = 1
+        reachable = np.eye(n, dtype=np.float32)
+        remaining = n if max_steps is None else max_steps
+
+        while remaining > 0:
+            if remaining % 2 == 1:
+                reachable = np.minimum(reachable @ step, 1)
+            remaining //= 2
+            if remaining > 0:
+                squared = np.minimum(step @ step, 1)
+                if max_steps is None and np.array_equal(squared, step):
+                    reachable = np.minimum(reachable @ step, 1)
+                    break
+                step = squared
+
+        return reachable > 0
+
+    def is_reachable(self, key1: Any, key2: Any) -> bool:
+        """Check if the vertex associated with key2 can be reached from the vertex associated with key1 by following
+        edges. The vertices reached so far are expanded a level at a time, by combining the rows of the adjacency mask
+        of the latest level, so each row is read at most once. Time complexity: O(V^2), vectorized.
+
+        :param key1: the key of the vertex to start from
+        :param key2: the key of the vertex to reach
+        :returns: True if key2 can be reached from key1, else False
+        """
+        idx1 = self.__get_index(key1)
+        idx2 = self.__get_index(key2)
+        mask = self.get_adjacency_mask()
+        reached = np.zeros(len(self._keys), dtype=bool)
+        reached[idx1] = True
+        frontier = np.array([idx1])
+
+        while not reached[idx2] and len(frontier) > 0:
+            next_level = mask[frontier].any(axis=0) & ~reached
+            reached |= next_level
+            frontier = np.flatnonzero(next_level)
+
+        return bool(reached[idx2])
@@ -0,0 +1,268 @@
+import collections
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Generator, Iterable, Union
+
+from compressed_sparse_row_graph import CompressedSparseRowGraph
+from graph import Graph
+
+_snapshot = None
+
+
+def _initialize_worker(keys: list, offsets: array, targets: array) -> None:
+    """Helper function to store the snapshot of the graph in a worker process, once per process
+
+    :param keys: the keys of the vertices, indexed by vertex id
+    :param offsets: the offsets of the edges leaving each vertex within the targets array
+    :param targets: the ids of the vertices the edges lead to
+    """
+    global _snapshot
+    _snapshot = (keys, offsets, targets)
+
+
+def _run_with_snapshot(snapshot: tuple, function: Callable, *args: Any) -> Any:
+    """Helper function to store the passed snapshot of the graph in a worker process before running a traversal, for
+    python versions whose worker processes can't be initialized when they start
+
+    :param snapshot: the keys, offsets and targets of the snapshot
+    :param function: the traversal to run
+    :param args: the arguments of the traversal
+    :returns: the result of the traversal
+    """
+    _initialize_worker(*snapshot)
+    return function(*args)
+
+
+def _breadth_first_search(source: int, max_depth: Union[int, None]) -> tuple:
+    """Helper function to run a breadth first search on the snapshot of the graph, within a worker process
+
+    :param source: the id of the vertex where the search begins
+    :param max_depth: the maximum depth of the search, None for no limit
+    :returns: the key of the source, and a mapping of the keys of the reached vertices to their depths
+    """
+    keys, offsets, targets = _snapshot
+    depths = {source: 0}
+    helper_queue = collections.deque([source])
+
+    while len(helper_queue) > 0:
+        i = helper_queue.popleft()
+        depth = depths[i] + 1
+        if max_depth is not None and depth > max_depth:
+            continue
+
+        for position in range(offsets[i], offsets[i + 1]):
+            j = targets[position]
+            if j not in depths:
+                depths[j] = depth
+                helper_queue.append(j)
+
+    return keys[source], {keys[i]: depth for i, depth in depths.items()}
+
+
+def _personalized_pagerank(
+    seed: int, damping: float, tolerance: float, max_iterations: int
+) -> tuple:
+    """Helper function to compute the personalized PageRank of a seed vertex on the snapshot of the graph, within a
+    worker process
+
+    :param seed: the id of the seed vertex
+    :param damping: the probability of following an edge rather than jumping back to the seed
+    :param tolerance: the total change in scores below which the scores are considered converged
+    :param max_iterations: the maximum number of iterations
+    :returns: the key of the seed, and a mapping of the keys of the vertices with non-zero scores to their scores
+    """
+    keys, offsets, targets = _snapshot
+    scores = {seed: 1.0}
+
+    for _ in range(max_iterations):
+        next_scores = collections.defaultdict(float)
+        lost_score = 1 - damping
+
+        for i, score in scores.items():
+            start, end = offsets[i], offsets[i + 1]
+            if start == end:
+                lost_score += damping * score
+                continue
+
+            share = damping * score / (end - start)
+            for position in range(start, end):
+                next_scores[targets[position]] += share
+
+        next_scores[seed] += lost_score
+        change = sum(
+            abs(score - scores.get(i, 0.0)) for i, score in next_scores.items()
+        )
+        change += sum(score for i, score in scores.items() if i not in next_scores)
+        scores = next_scores
+
+        if change < tolerance:
+            break
+
+    return keys[seed], {keys[i]: score for i, score in scores.items()}
+
+
+class ParallelGraphAnalytics:
+    """Parallel graph analytics run independent traversals of a graph, one per source vertex, across a pool of worker
+    processes. A snapshot of the graph is taken when the analytics are created, as arrays of integer vertex ids in
+    compressed sparse row form, and handed to each worker process once, when the process starts. Worker processes
+    created by forking inherit the snapshot without copying it. Results are yielded as soon as each traversal finishes,
+    so they may arrive in any order. Later changes to the graph don't affect the snapshot. On python 3.6, whose worker
+    processes can't be initialized, the snapshot is sent along with every traversal instead, and mp_context is
+    ignored.
+
+    Edges are followed in the direction of get_outgoing_adjacent_vertices(), so both ways in an undirected graph.
+
+    Instantiate parallel analytics of a graph
+
+        >>> from adjacency_list_graph import AdjacencyListGraph
+        >>> a_graph = AdjacencyListGraph(directed=True)
+        >>> for key in [1, 2, 3, 4]:
+        ...     a_graph.add_vertex(key)
+        >>> for key1, key2 in [(1, 2), (2, 3), (3, 1), (3, 4)]:
+        ...     a_graph.add_edge(key1, key2)
+        >>> analytics = ParallelGraphAnalytics(a_graph, max_workers=2)
+
+    Run breadth first searches from several vertices, up to some depth
+
+        >>> sorted(analytics.breadth_first_search([1, 4], max_depth=2))
+        [(1, {1: 0, 2: 1, 3: 2}), (4, {4: 0})]
+
+    Compute the personalized PageRank of several seed vertices
+
+        >>> for seed, scores in sorted(analytics.personalized_pagerank([1, 4])):
+        ...     print(seed, {key: round(score, 3) for key, score in sorted(scores.items())})
+        1 {1: 0.347, 2: 0.295, 3: 0.251, 4: 0.107}
+        4 {4: 1.0}
+
+    Shut down the worker processes
+
+        >>> analytics.close()
+    """
+
+    def __init__(
+        self, graph: Graph, max_workers: Union[int, None] = None, mp_context: Any = None
+    ):
+        """
+        :param graph: the graph to take a snapshot of
+        :param max_workers: the number of worker processes, None for the number of processors
+        :param mp_context: the multiprocessing context used to start the worker processes, None for the default
+        """
+        if graph.is_directed():
+            compressed_graph = CompressedSparseRowGraph.from_graph(graph)
+        else:
+            # The stored edges of an undirected graph are mirrored, so that the directed snapshot follows them both ways
+            edges = [
+                (key1, key2, weight)
+                for key1 in graph.get_vertices()
+                for key2, weight in graph._get_next_vertices(key1)
+            ]
+            edges += [
+                (key2, key1, weight) for key1, key2, weight in edges if key1 != key2
+            ]
+            compressed_graph = CompressedSparseRowGraph(
+                True, ((key, None) for key in graph.get_vertices()), edges
+            )
+
+        keys = compressed_graph.get_vertices()
+        offsets, targets, _ = compressed_graph.get_arrays()
+        self.__indices = {key: i for i, key in enumerate(keys)}
+
+        if sys.version_info >= (3, 7):
+            self.__snapshot = None
+            self.__executor = ProcessPoolExecutor(
+                max_workers,
+                mp_context,
+                initializer=_initialize_worker,
+                initargs=(keys, offsets, targets),
+            )
+        else:  # pragma: no cover - python 3.6
+            self.__snapshot = (keys, offsets, targets)
+            self.__executor = ProcessPoolExecutor(max_workers)
+
+    def __enter__(self) -> "ParallelGraphAnalytics":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __submit(self, function: Callable, *args: Any) -> Any:
+        """Helper function to schedule a traversal of the snapshot on the worker processes
+
+        :param function: the traversal to run
+        :param args: the arguments of the traversal
+        :returns: a future of the result of the traversal
+        """
+        if self.__snapshot is None:
+            return self.__executor.submit(function, *args)
+
+        return self.__executor.submit(
+            _run_with_snapshot, self.__snapshot, function, *args
+        )
+
+    def __get_ids(self, keys: Iterable) -> list:
+        """Helper function to get the ids of vertices, raising a KeyError if any of the vertices doesn't exist
+
+        :param keys: the keys of the vertices
+        :returns: the ids of the vertices
+        """
+        ids = []
+
+        for key in keys:
+            if key not in self.__indices:
+                raise KeyError(f"{key} is absent from the graph")
+            ids.append(self.__indices[key])
+
+        return ids
+
+    def breadth_first_search(
+        self, sources: Iterable, max_depth: Union[int, None] = None
+    ) -> Generator:
+        """Run a breadth first search from each of the passed vertices in parallel, and yield the results as they
+        finish. Time complexity: O(V + E) per source.
+
+        :param sources: the keys of the vertices where the searches begin
+        :param max_depth: the maximum depth of the searches, None for no limit
+        :returns: a generator of (source, depths) pairs, where depths maps the keys of the vertices reached from the
+            source to their depths
+        """
+        futures = [
+            self.__submit(_breadth_first_search, i, max_depth)
+            for i in self.__get_ids(sources)
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+    def personalized_pagerank(
+        self,
+        seeds: Iterable,
+        damping: float = 0.85,
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+    ) -> Generator:
+        """Compute the personalized PageRank of each of the passed vertices in parallel, and yield the results as they
+        finish. The personalized PageRank of a seed vertex is the probability of being at each vertex during a random
+        walk that follows a random edge with probability damping, and otherwise jumps back to the seed. Walks that
+        reach a vertex without edges jump back to the seed. Time complexity: O(V + E) per iteration per seed.
+
+        :param seeds: the keys of the seed vertices
+        :param damping: the probability of following an edge rather than jumping back to the seed
+        :param tolerance: the total change in scores below which the scores are considered converged
+        :param max_iterations: the maximum number of iterations
+        :returns: a generator of (seed, scores) pairs, where scores maps the keys of the vertices with non-zero scores
+            to their scores
+        """
+        futures = [
+            self.__submit(_personalized_pagerank, i, damping, tolerance, max_iterations)
+            for i in self.__get_ids(seeds)
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+    def close(self) -> None:
+        """Shut down the worker processes, once the running traversals finish. The analytics can't be used
+        afterwards.
+        """
+        self.__executor.shutdown()
@@ -0,0 +1,527 @@
+import heapq
+import math
+from typing import Any, Callable, Union
+
+from graph import Graph
+
+
+class NegativeCycle(Exception):
+    def __init__(self, message: str, cycle: list):
+        super().__init__(message)
+        self.cycle = cycle
+
+
+class ShortestPaths:
+    """The result of a shortest path search from some source vertex. It stores the distance of every vertex reached by
+    the search and the vertex that precedes it on its shortest path. A path is only reconstructed, by following the
+    preceding vertices back to the source, when it's requested.
+
+    Find the shortest paths from some vertex
+
+        >>> from adjacency_list_graph import AdjacencyListGraph
+        >>> a_graph = AdjacencyListGraph(directed=True)
+        >>> for key in ["a", "b", "c", "d"]:
+        ...     a_graph.add_vertex(key)
+        >>> for key1, key2, weight in [("a", "b", 4), ("a", "c", 1), ("c", "b", 2), ("b", "d", 5)]:
+        ...     a_graph.add_edge(key1, key2, weight)
+        >>> shortest_paths = dijkstra(a_graph, "a")
+
+    Get the source of the paths
+
+        >>> shortest_paths.get_source()
+        'a'
+
+    Get the distance and the path to some vertex
+
+        >>> shortest_paths.get_distance("d")
+        8
+        >>> shortest_paths.get_path("d")
+        ['a', 'c', 'b', 'd']
+
+    Get the distances to all the reached vertices
+
+        >>> shortest_paths.get_distances()
+        {'a': 0, 'c': 1, 'b': 3, 'd': 8}
+
+    Check if there's a path to some vertex
+
+        >>> a_graph.add_vertex("e")
+        >>> dijkstra(a_graph, "a").has_path_to("e")
+        False
+        >>> dijkstra(a_graph, "a").get_distance("e")
+        inf
+    """
+
+    def __init__(self, source: Any, distances: dict, predecessors: dict):
+        """
+        :param source: the key of the vertex where the paths begin
+        :param distances: mapping of the keys of the reached vertices to their distances from the source
+        :param predecessors: mapping of the keys of the reached vertices, except the source, to the keys of the
+            vertices preceding them on their shortest paths
+        """
+        self.__source = source
+        self.__distances = distances
+        self.__predecessors = predecessors
+
+    def get_source(self) -> Any:
+        """Return the key of the vertex where the paths begin
+
+        :returns: the key of the source vertex
+        """
+        return self.__source
+
+    def get_distances(self) -> dict:
+        """Return the distances of all the vertices reached by the search, in the order in which they were reached
+
+        :returns: mapping of vertex keys to distances from the source
+        """
+        return self.__distances
+
+    def get_distance(self, key: Any) -> Union[int, float]:
+        """Return the length of the shortest path from the source to the vertex associated with the passed key
+
+        :param key: the key of the vertex whose distance is being sought
+        :returns: the distance of the vertex from the source, infinity if the vertex wasn't reached
+        """
+        return self.__distances.get(key, math.inf)
+
+    def has_path_to(self, key: Any) -> bool:
+        """Check if the search found a path from the source to the vertex associated with the passed key
+
+        :param key: the key of the vertex to check
+        :returns: True if there's a path to the vertex, else False
+        """
+        return key in self.__distances
+
+    def get_path(self, key: Any) -> list:
+        """Return the keys of the vertices on the shortest path from the source to the vertex associated with the
+        passed key. Time complexity: O(length of the path).
+
+        :param key: the key of the vertex where the path ends
+        :returns: a list of vertex keys, starting with the source and ending with the passed key
+        """
+        if key not in self.__distances:
+            raise ValueError(f"{key} is unreachable from {self.__source}")
+
+        path = [key]
+        while key != self.__source:
+            key = self.__predecessors[key]
+            path.append(key)
+        path.reverse()
+
+        return path
+
+
+def _get_weight(weight: Union[int, float, None]) -> Union[int, float]:
+    """Helper function to get the cost of traversing an edge, where an edge without a weight costs 1
+
+    :param weight: the weight of the edge
+    :returns: the cost of traversing the edge
+    """
+    return 1 if weight is None else weight
+
+
+def _check_vertices(graph: Graph, *keys: Any) -> None:
+    """Helper function to raise a KeyError if any of the passed keys is absent from the graph
+
+    :param graph: the graph to check
+    :param keys: the keys to check
+    """
+    for key in keys:
+        if key not in graph:
+            raise KeyError(f"{key} is absent from the graph")
+
+
+def _is_incoming_edges_indexed(graph: Graph) -> bool:
+    """Helper function to check whether the edges entering a vertex of a graph can be looked up without scanning every
+    edge, which only adjacency list graphs that don't index incoming edges can't do
+
+    :param graph: the graph to check
+    :returns: True if the edges entering a vertex can be looked up directly, else False
+    """
+    is_incoming_edges_indexed = getattr(graph, "is_incoming_edges_indexed", None)
+    return is_incoming_edges_indexed is None or is_incoming_edges_indexed()
+
+
+def _get_next_vertices_function(
+    graph: Graph, reverse: bool = False
+) -> Callable[[Any], list]:
+    """Helper function to get a function returning the (key, weight) pairs of the vertices that a search can move to
+    from some vertex, by following edges forwards, or backwards if reverse is True. Edges of an undirected graph are
+    followed both ways. The vertices are looked up as each vertex is settled, so a search only reads the part of the
+    graph it explores. An adjacency list graph that doesn't index incoming edges can only find the edges entering a
+    vertex by scanning every edge, so for such a graph they're gathered for all the vertices in a single pass instead.
+
+    :param graph: the graph to search
+    :param reverse: True to follow edges backwards, else False
+    :returns: a function that takes the key of a vertex and returns a list of (key, weight) pairs
+    """
+    if graph.is_directed() and not reverse:
+        return graph._get_next_vertices
+
+    if not _is_incoming_edges_indexed(graph):
+        return graph._get_adjacency_lists(reverse).__getitem__
+
+    if reverse:
+        return graph.get_incoming_adjacent_vertices
+    return graph.get_outgoing_adjacent_vertices
+
+
+def dijkstra(graph: Graph, source: Any, target: Any = None) -> ShortestPaths:
+    """Dijkstra's algorithm finds the shortest paths from a source vertex to all the vertices reachable from it, in a
+    graph whose edge weights are non-negative. It repeatedly settles the closest unsettled vertex, taken from a binary
+    heap, and relaxes its outgoing edges. If a target vertex is passed, the search stops once the target is settled.
+    The outgoing edges of a vertex are only looked up once it's settled, so a search that stops early doesn't read the
+    rest of the graph, unless the graph is an undirected adjacency list graph that doesn't index incoming edges. Edges
+    without a weight cost 1 to traverse. Time complexity: O((V + E)logV).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=False)
+    >>> for key in [1, 2, 3, 4]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [(1, 2, 7), (1, 3, 2), (3, 2, 3), (2, 4, 1)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> dijkstra(a_graph, 1).get_distances()
+    {1: 0, 3: 2, 2: 5, 4: 6}
+    >>> dijkstra(a_graph, 1, target=2).get_path(2)
+    [1, 3, 2]
+
+    A search for a nearby target only looks up the edges of the vertices it settles, however large the graph is
+
+    >>> class CountingGraph(AdjacencyListGraph):
+    ...     lookups = 0
+    ...     def _get_next_vertices(self, key):
+    ...         CountingGraph.lookups += 1
+    ...         return super()._get_next_vertices(key)
+    >>> large_graph = CountingGraph(directed=True)
+    >>> for key in range(100000):
+    ...     large_graph.add_vertex(key)
+    >>> for key in range(99999):
+    ...     large_graph.add_edge(key, key + 1)
+    >>> dijkstra(large_graph, 0, target=2).get_distance(2)
+    2
+    >>> CountingGraph.lookups
+    2
+
+    :param graph: the graph to search
+    :param source: the key of the vertex where the paths begin
+    :param target: the key of the vertex where the search can stop, None to find paths to all reachable vertices
+    :returns: the shortest paths from the source
+    """
+    _check_vertices(graph, source)
+
+    get_next_vertices = _get_next_vertices_function(graph)
+    distances = {}
+    tentative_distances = {source: 0}
+    predecessors = {}
+    heap = [(0, 0, source)]
+    counter = 1
+
+    while len(heap) > 0:
+        distance, _, key = heapq.heappop(heap)
+        if key in distances:
+            continue
+
+        distances[key] = distance
+        if key == target:
+            break
+
+        for next_key, weight in get_next_vertices(key):
+            weight = _get_weight(weight)
+            if weight < 0:
+                raise ValueError(
+                    "Dijkstra's algorithm requires non-negative edge weights"
+                )
+
+            next_distance = distance + weight
+            if next_key not in distances and next_distance < tentative_distances.get(
+                next_key, math.inf
+            ):
+                tentative_distances[next_key] = next_distance
+                predecessors[next_key] = key
+                heapq.heappush(heap, (next_distance, counter, next_key))
+                counter += 1
+
+    return ShortestPaths(source, distances, predecessors)
+
+
+def a_star(
+    graph: Graph,
+    source: Any,
+    target: Any,
+    heuristic: Union[Callable[[Any, Any], Union[int, float]], None] = None,
+) -> ShortestPaths:
+    """A* search finds the shortest path from a source vertex to a target vertex, in a graph whose edge weights are
+    non-negative. It's Dijkstra's algorithm guided by a heuristic, which estimates the distance from each vertex to the
+    target, so that vertices that appear to lead towards the target are explored first. The path is the shortest one
+    as long as the heuristic never overestimates the distance. Without a heuristic, it behaves like Dijkstra's
+    algorithm. As in Dijkstra's algorithm, the outgoing edges of a vertex are only looked up once it's settled. Edges
+    without a weight cost 1 to traverse. Time complexity: O((V + E)logV).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=False)
+    >>> for x in range(3):
+    ...     for y in range(3):
+    ...         a_graph.add_vertex((x, y))
+    >>> for x in range(3):
+    ...     for y in range(3):
+    ...         if x < 2:
+    ...             a_graph.add_edge((x, y), (x + 1, y), 1)
+    ...         if y < 2:
+    ...             a_graph.add_edge((x, y), (x, y + 1), 1)
+    >>> def manhattan_distance(key1, key2):
+    ...     return abs(key1[0] - key2[0]) + abs(key1[1] - key2[1])
+    >>> shortest_paths = a_star(a_graph, (0, 0), (2, 2), manhattan_distance)
+    >>> shortest_paths.get_distance((2, 2))
+    4
+    >>> len(shortest_paths.get_path((2, 2)))
+    5
+
+    :param graph: the graph to search
+    :param source: the key of the vertex where the path begins
+    :param target: the key of the vertex where the path ends
+    :param heuristic: a function that takes the keys of two vertices and estimates the distance between them
+    :returns: the paths from the source, of which only the path to the target is guaranteed to be the shortest
+    """
+    _check_vertices(graph, source, target)
+
+    if heuristic is None:
+        return dijkstra(graph, source, target)
+
+    get_next_vertices = _get_next_vertices_function(graph)
+    distances = {source: 0}
+    predecessors = {}
+    heap = [(heuristic(source, target), 0, 0, source)]
+    counter = 1
+
+    while len(heap) > 0:
+        _, _, distance, key = heapq.heappop(heap)
+        if distance > distances[key]:
+            continue
+        if key == target:
+            break
+
+        for next_key, weight in get_next_vertices(key):
+            weight = _get_weight(weight)
+            if weight < 0:
+                raise ValueError("A* search requires non-negative edge weights")
+
+            next_distance = distance + weight
+            if next_distance < distances.get(next_key, math.inf):
+                distances[next_key] = next_distance
+                predecessors[next_key] = key
+                estimate = next_distance + heuristic(next_key, target)
+                heapq.heappush(heap, (estimate, counter, next_distance, next_key))
+                counter += 1
+
+    return ShortestPaths(source, distances, predecessors)
+
+
+def bellman_ford(graph: Graph, source: Any) -> ShortestPaths:
+    """The Bellman-Ford algorithm finds the shortest paths from a source vertex to all the vertices reachable from it,
+    in a graph whose edge weights may be negative. It relaxes every edge in the graph in rounds, until a round changes
+    no distance. If distances still change after V - 1 rounds, some cycle of negative total weight can be reached from
+    the source, and shortest paths don't exist. Edges without a weight cost 1 to traverse. Time complexity: O(VE).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [(1, 2, 4), (1, 3, 5), (3, 2, -3), (2, 4, 2)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> bellman_ford(a_graph, 1).get_path(4)
+    [1, 3, 2, 4]
+    >>> bellman_ford(a_graph, 1).get_distance(4)
+    4
+    >>> a_graph.add_edge(4, 3, -1)
+    >>> bellman_ford(a_graph, 1)
+    Traceback (most recent call last):
+    ...
+    shortest_paths.NegativeCycle: Negative cycle [4, 3, 2, 4] is reachable from 1
+
+    :param graph: the graph to search
+    :param source: the key of the vertex where the paths begin
+    :returns: the shortest paths from the source
+    :raises NegativeCycle: if a negative cycle is reachable from the source, with the keys of its vertices attached
+    """
+    _check_vertices(graph, source)
+
+    edges = [
+        (key1, key2, _get_weight(weight))
+        for key1 in graph.get_vertices()
+        for key2, weight in graph._get_next_vertices(key1)
+    ]
+    if not graph.is_directed():
+        edges += [(key2, key1, weight) for key1, key2, weight in edges]
+    distances = {source: 0}
+    predecessors = {}
+
+    for _ in range(len(graph.get_vertices())):
+        changed_key = None
+
+        for key1, key2, weight in edges:
+            if key1 in distances and distances[key1] + weight < distances.get(
+                key2, math.inf
+            ):
+                distances[key2] = distances[key1] + weight
+                predecessors[key2] = key1
+                changed_key = key2
+
+        if changed_key is None:
+            return ShortestPaths(source, distances, predecessors)
+
+    # A distance changed in round V, so following the predecessors back V times from the changed vertex ends up
+    # within the negative cycle
+    key = changed_key
+    for _ in range(len(graph.get_vertices())):
+        key = predecessors[key]
+
+    cycle = [key]
+    next_key = predecessors[key]
+    while next_key != key:
+        cycle.append(next_key)
+        next_key = predecessors[next_key]
+    cycle.append(key)
+    cycle.reverse()
+
+    raise NegativeCycle(f"Negative cycle {cycle} is reachable from {source}", cycle)
+
+
+def bidirectional_dijkstra(graph: Graph, source: Any, target: Any) -> ShortestPaths:
+    """Bidirectional Dijkstra's algorithm finds the shortest path from a source vertex to a target vertex, in a graph
+    whose edge weights are non-negative. It runs Dijkstra's algorithm forwards from the source and backwards from the
+    target, expanding whichever search has the closer frontier, and stops once the two frontiers can't improve on the
+    shortest path found where they meet. This usually settles far fewer vertices than a search from the source alone.
+    The edges of a vertex are only looked up once one of the searches settles it. The backward search follows the edges
+    entering each vertex, so on a directed adjacency list graph that doesn't index incoming edges, only the forward
+    search is run, stopping once it settles the target. The returned shortest paths only contain the vertices on the
+    path from the source to the target. Edges without a weight cost 1 to traverse. Time complexity: O((V + E)logV).
+
+    >>> from adjacency_list_graph import AdjacencyListGraph
+    >>> a_graph = AdjacencyListGraph(directed=True, index_incoming_edges=True)
+    >>> for key in [1, 2, 3, 4, 5]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [(1, 2, 1), (2, 3, 1), (3, 5, 1), (1, 4, 1), (4, 5, 5)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> shortest_paths = bidirectional_dijkstra(a_graph, 1, 5)
+    >>> shortest_paths.get_distance(5)
+    3
+    >>> shortest_paths.get_path(5)
+    [1, 2, 3, 5]
+    >>> shortest_paths.get_distances()
+    {1: 0, 2: 1, 3: 2, 5: 3}
+    >>> a_graph = AdjacencyListGraph(directed=True)
+    >>> for key in [1, 2, 3, 4, 5]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [(1, 2, 1), (2, 3, 1), (3, 5, 1), (1, 4, 1), (4, 5, 5)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> bidirectional_dijkstra(a_graph, 1, 5).get_distances()
+    {1: 0, 2: 1, 3: 2, 5: 3}
+
+    The searches can meet at a vertex before the shortest path is found
+
+    >>> a_graph = AdjacencyListGraph(directed=False)
+    >>> for key in ["s", "a", "t"]:
+    ...     a_graph.add_vertex(key)
+    >>> for key1, key2, weight in [("s", "t", 9), ("s", "a", 1), ("a", "t", 1)]:
+    ...     a_graph.add_edge(key1, key2, weight)
+    >>> bidirectional_dijkstra(a_graph, "s", "t").get_distances()
+    {'s': 0, 'a': 1, 't': 2}
+
+    :param graph: the graph to search
+    :param source: the key of the vertex where the path begins
+    :param target: the key of the vertex where the path ends
+    :returns: the shortest paths from the source, which only include the path to the target if it's reachable
+    """
+    _check_vertices(graph, source, target)
+
+    if source == target:
+        return ShortestPaths(source, {source: 0}, {})
+
+    if graph.is_directed() and not _is_incoming_edges_indexed(graph):
+        shortest_paths = dijkstra(graph, source, target=target)
+        if not shortest_paths.has_path_to(target):
+            return ShortestPaths(source, {source: 0}, {})
+
+        path = shortest_paths.get_path(target)
+        distances = {key: shortest_paths.get_distance(key) for key in path}
+        predecessors = {path[i + 1]: path[i] for i in range(len(path) - 1)}
+        return ShortestPaths(source, distances, predecessors)
+
+    searches = [
+        (
+            _get_next_vertices_function(graph),
+            {source: 0},
+            {},
+            set(),
+            [(0, 0, source)],
+        ),
+        (
+            _get_next_vertices_function(graph, reverse=True),
+            {target: 0},
+            {},
+            set(),
+            [(0, 0, target)],
+        ),
+    ]
+    (_, forward_distances, forward_predecessors, _, forward_heap) = searches[0]
+    (_, backward_distances, backward_successors, _, backward_heap) = searches[1]
+    best_distance = math.inf
+    meeting_key = None
+    counter = 1
+
+    while len(forward_heap) > 0 and len(backward_heap) > 0:
+        if forward_heap[0][0] + backward_heap[0][0] >= best_distance:
+            break
+
+        if forward_heap[0][0] <= backward_heap[0][0]:
+            get_next_vertices, distances, predecessors, settled, heap = searches[0]
+            other_distances = backward_distances
+        else:
+            get_next_vertices, distances, predecessors, settled, heap = searches[1]
+            other_distances = forward_distances
+
+        distance, _, key = heapq.heappop(heap)
+        if key in settled:
+            continue
+        settled.add(key)
+
+        for next_key, weight in get_next_vertices(key):
+            weight = _get_weight(weight)
+            if weight < 0:
+                raise ValueError(
+                    "Dijkstra's algorithm requires non-negative edge weights"
+                )
+
+            next_distance = distance + weight
+            if next_key not in settled and next_distance < distances.get(
+                next_key, math.inf
+            ):
+                distances[next_key] = next_distance
+                predecessors[next_key] = key
+                heapq.heappush(heap, (next_distance, counter, next_key))
+                counter += 1
+
+            if next_key in other_distances:
+                path_distance = distances[next_key] + other_distances[next_key]
+                if path_distance < best_distance:
+                    best_distance = path_distance
+                    meeting_key = next_key
+
+    if meeting_key is None:
+        return ShortestPaths(source, {source: 0}, {})
+
+    path = [meeting_key]
+    while path[-1] != source:
+        path.append(forward_predecessors[path[-1]])
+    path.reverse()
+
+    # The vertices up to the meeting vertex were reached by the forward search, and the ones after it by the backward
+    # search, which measured their distances to the target
+    distances = {key: forward_distances[key] for key in path}
+    while path[-1] != target:
+        path.append(backward_successors[path[-1]])
+        distances[path[-1]] = best_distance - backward_distances[path[-1]]
+    predecessors = {path[i + 1]: path[i] for i in range(len(path) - 1)}
+
+    return ShortestPaths(source, distances, predecessors)
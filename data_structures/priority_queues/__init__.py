@@ -1,3 +1,6 @@
-from priority_queue import Empty
+from adaptable_heap_priority_queue import AdaptableHeapPriorityQueue
+from async_priority_queue import AsyncPriorityQueue
+from binary_heap_priority_queue import BinaryHeapPriorityQueue
+from priority_queue import Closed, Empty
 from sorted_list_priority_queue import SortedListPriorityQueue
 from unsorted_list_priority_queue import UnsortedListPriorityQueue
@@ -0,0 +1,310 @@
+from typing import Any, Union
+
+from priority_queue import Empty, PriorityQueue
+
+
+class AdaptableHeapPriorityQueue(PriorityQueue):
+    """
+    An adaptable heap priority queue is a binary heap priority queue whose elements can be located after they have
+    been enqueued. Enqueueing an element returns a locator, which can later be used to update the priority of the
+    element or to remove it from the queue, without searching for it. Elements of equal priority are dequeued in the
+    order in which they were enqueued.
+
+    Instantiate an adaptable heap priority queue object
+
+        >>> a_queue = AdaptableHeapPriorityQueue()
+
+    Enqueue elements, keeping their locators
+
+        >>> locator_a = a_queue.enqueue("a", 5)
+        >>> locator_b = a_queue.enqueue("b", 3)
+        >>> locator_c = a_queue.enqueue("c", 4)
+        >>> locator_a.get_data()
+        ('a', 5)
+
+    Update the priority of an element
+
+        >>> a_queue.update_priority(locator_a, 1)
+        >>> a_queue.get_first()
+        ('a', 1)
+
+    Remove an element
+
+        >>> a_queue.remove(locator_b)
+        ('b', 3)
+        >>> len(a_queue)
+        2
+
+    Dequeue elements
+
+        >>> a_queue.dequeue()
+        ('a', 1)
+        >>> a_queue.dequeue()
+        ('c', 4)
+
+    Locators of elements no longer in the queue can't be used
+
+        >>> locator_a.is_owned_by(a_queue)
+        False
+        >>> a_queue.remove(locator_a)
+        Traceback (most recent call last):
+        ...
+        ValueError: Locator doesn't belong to this queue
+    """
+
+    class _Locator:
+        """A representation of the location of an element within a priority queue"""
+
+        def __init__(self, belongs_to, x, priority, counter, idx):
+            self.__variables = {"belongs_to": belongs_to}
+            self._x = x
+            self._priority = priority
+            self._counter = counter
+            self._idx = idx
+
+        def is_owned_by(self, owner):
+            """Check whether locator belongs to the queue, owner. Time complexity: O(1).
+
+            :param owner: object to check whether it's the owner of this locator
+            :returns: True of the locator is owned by the object passed, else False
+            """
+            return owner is self.__variables["belongs_to"]
+
+        def invalidate(self, owner):
+            """Revoke the ownership of this locator. Only the owner queue can call this method. Time complexity: O(1).
+
+            :param owner: queue object that owns this locator
+            """
+            if not self.is_owned_by(owner):
+                raise ValueError("Locator doesn't belong to the passed owner")
+            self.__variables["belongs_to"] = None
+
+        def get_data(self):
+            """Return the element and priority held by this locator. Time complexity: O(1).
+
+            :returns: a tuple of the element and its priority
+            """
+            return self._x, self._priority
+
+    def __init__(self, minimum_priority_queue: bool = True):
+        super().__init__(minimum_priority_queue)
+        self.__data_store = []
+        self.__counter = 0
+
+    def __has_precedence(self, locator1: _Locator, locator2: _Locator) -> bool:
+        """Helper function to check whether the element of the first locator should be dequeued before the element of
+        the second one
+
+        :param locator1: the first locator
+        :param locator2: the second locator
+        :returns: True if locator1 takes precedence over locator2, else False
+        """
+        if locator1._priority == locator2._priority:
+            return locator1._counter < locator2._counter
+        if self._minimum_priority_queue:
+            return locator1._priority < locator2._priority
+        return locator1._priority > locator2._priority
+
+    def __sift_up(self, idx: int) -> None:
+        """Helper function to move the locator at the passed index towards the root until the heap order is restored.
+        Time complexity: O(logn).
+
+        :param idx: index of the locator to move
+        """
+        data_store = self.__data_store
+        locator = data_store[idx]
+
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent = data_store[parent_idx]
+            if not self.__has_precedence(locator, parent):
+                break
+            data_store[idx] = parent
+            parent._idx = idx
+            idx = parent_idx
+
+        data_store[idx] = locator
+        locator._idx = idx
+
+    def __sift_down(self, idx: int) -> None:
+        """Helper function to move the locator at the passed index towards the leaves until the heap order is
+        restored. Time complexity: O(logn).
+
+        :param idx: index of the locator to move
+        """
+        data_store = self.__data_store
+        length = len(data_store)
+        locator = data_store[idx]
+
+        while True:
+            child_idx = 2 * idx + 1
+            if child_idx >= length:
+                break
+            right_idx = child_idx + 1
+            if right_idx < length and self.__has_precedence(
+                data_store[right_idx], data_store[child_idx]
+            ):
+                child_idx = right_idx
+            child = data_store[child_idx]
+            if not self.__has_precedence(child, locator):
+                break
+            data_store[idx] = child
+            child._idx = idx
+            idx = child_idx
+
+        data_store[idx] = locator
+        locator._idx = idx
+
+    def __restore(self, idx: int) -> None:
+        """Helper function to restore the heap order after the priority of the locator at the passed index changes.
+        Time complexity: O(logn).
+
+        :param idx: index of the locator whose priority changed
+        """
+        if idx > 0 and self.__has_precedence(
+            self.__data_store[idx], self.__data_store[(idx - 1) // 2]
+        ):
+            self.__sift_up(idx)
+        else:
+            self.__sift_down(idx)
+
+    def __validate_locator(self, locator: _Locator) -> None:
+        """Helper function to check that the passed locator belongs to this queue
+
+        :param locator: the locator to validate
+        """
+        if not isinstance(
+            locator, AdaptableHeapPriorityQueue._Locator
+        ) or not locator.is_owned_by(self):
+            raise ValueError("Locator doesn't belong to this queue")
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the queue
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> _ = a_queue.enqueue(1, 2)
+            >>> len(a_queue)
+            1
+
+        :returns: count of elements in queue
+        """
+        return len(self.__data_store)
+
+    def is_empty(self) -> bool:
+        """Check if queue contains no elements
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> a_queue.is_empty()
+            True
+            >>> _ = a_queue.enqueue(1, 2)
+            >>> a_queue.is_empty()
+            False
+
+        :return: True if queue is empty, else False
+        """
+        return len(self.__data_store) == 0
+
+    def enqueue(self, x: Any, priority: Union[int, float]) -> _Locator:
+        """Insert an element to the end of the queue. Time complexity: O(logn).
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> locator = a_queue.enqueue(1, 2)
+            >>> locator.get_data()
+            (1, 2)
+
+        :param x: element to add to the queue
+        :param priority: value that determines precedence of x in relation to the rest of the elements in the queue
+        :returns: the locator of the added element
+        """
+        locator = AdaptableHeapPriorityQueue._Locator(
+            self, x, priority, self.__counter, len(self.__data_store)
+        )
+        self.__counter += 1
+        self.__data_store.append(locator)
+        self.__sift_up(locator._idx)
+
+        return locator
+
+    def dequeue(self) -> Any:
+        """Remove first element of the queue and return it. Time complexity: O(logn).
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> _ = a_queue.enqueue(1, 2)
+            >>> _ = a_queue.enqueue(3, 1)
+            >>> a_queue.dequeue()
+            (3, 1)
+
+            >>> a_queue = AdaptableHeapPriorityQueue(minimum_priority_queue=False)
+            >>> _ = a_queue.enqueue(1, 2)
+            >>> _ = a_queue.enqueue(3, 1)
+            >>> a_queue.dequeue()
+            (1, 2)
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+
+        return self.remove(self.__data_store[0])
+
+    def get_first(self) -> Any:
+        """Return first element of the queue without removing it. Time complexity: O(1).
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> _ = a_queue.enqueue(1, 2)
+            >>> a_queue.get_first()
+            (1, 2)
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+
+        return self.__data_store[0].get_data()
+
+    def update_priority(self, locator: _Locator, priority: Union[int, float]) -> None:
+        """Change the priority of the element held by the passed locator. Time complexity: O(logn).
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> locator = a_queue.enqueue(1, 2)
+            >>> _ = a_queue.enqueue(3, 1)
+            >>> a_queue.update_priority(locator, 0)
+            >>> a_queue.get_first()
+            (1, 0)
+
+        :param locator: locator of the element whose priority is to be changed
+        :param priority: the new priority of the element
+        """
+        self.__validate_locator(locator)
+
+        locator._priority = priority
+        self.__restore(locator._idx)
+
+    def remove(self, locator: _Locator) -> Any:
+        """Remove the element held by the passed locator from the queue and return it. Time complexity: O(logn).
+
+            >>> a_queue = AdaptableHeapPriorityQueue()
+            >>> locator = a_queue.enqueue(1, 2)
+            >>> _ = a_queue.enqueue(3, 1)
+            >>> a_queue.remove(locator)
+            (1, 2)
+            >>> len(a_queue)
+            1
+
+        :param locator: locator of the element to be removed
+        :returns: the removed element and its priority
+        """
+        self.__validate_locator(locator)
+
+        data_store = self.__data_store
+        idx = locator._idx
+        last_locator = data_store.pop()
+
+        if last_locator is not locator:
+            data_store[idx] = last_locator
+            last_locator._idx = idx
+            self.__restore(idx)
+
+        locator.invalidate(self)
+
+        return locator.get_data()
@@ -0,0 +1,202 @@
+from typing import Any, Iterable, Tuple, Union
+
+from priority_queue import Empty, PriorityQueue
+
+
+class BinaryHeapPriorityQueue(PriorityQueue):
+    """
+    A binary heap priority queue is a priority queue implemented using an array based complete binary tree, stored in
+    python's list data structure, such that the priority of every element takes precedence over the priorities of its
+    children. Elements of equal priority are dequeued in the order in which they were enqueued.
+    """
+
+    def __init__(self, minimum_priority_queue: bool = True):
+        super().__init__(minimum_priority_queue)
+        self.__data_store = []
+        self.__counter = 0
+
+    @classmethod
+    def heapify(
+        cls,
+        elements: Iterable[Tuple[Any, Union[int, float]]],
+        minimum_priority_queue: bool = True,
+    ) -> "BinaryHeapPriorityQueue":
+        """Create a queue from an iterable of (element, priority) pairs using bottom-up heap construction. Time
+        complexity: O(n).
+
+            >>> a_queue = BinaryHeapPriorityQueue.heapify([("a", 3), ("b", 1), ("c", 2)])
+            >>> len(a_queue)
+            3
+            >>> a_queue.dequeue()
+            ('b', 1)
+            >>> a_queue = BinaryHeapPriorityQueue.heapify(
+            ...     [("a", 3), ("b", 1), ("c", 2)], minimum_priority_queue=False
+            ... )
+            >>> a_queue.dequeue()
+            ('a', 3)
+
+        :param elements: iterable of (element, priority) pairs
+        :param minimum_priority_queue: True if elements of lower priority values take precedence, else False
+        :returns: a queue containing all the passed elements
+        """
+        queue = cls(minimum_priority_queue)
+        data_store = queue.__data_store
+
+        for x, priority in elements:
+            data_store.append((priority, queue.__counter, x))
+            queue.__counter += 1
+
+        for i in range(len(data_store) // 2 - 1, -1, -1):
+            queue.__sift_down(i)
+
+        return queue
+
+    def __has_precedence(self, entry1, entry2) -> bool:
+        """Helper function to check whether the first heap entry should be dequeued before the second one
+
+        :param entry1: the first heap entry
+        :param entry2: the second heap entry
+        :returns: True if entry1 takes precedence over entry2, else False
+        """
+        if entry1[0] == entry2[0]:
+            return entry1[1] < entry2[1]
+        if self._minimum_priority_queue:
+            return entry1[0] < entry2[0]
+        return entry1[0] > entry2[0]
+
+    def __sift_up(self, idx: int) -> None:
+        """Helper function to move the entry at the passed index towards the root until the heap order is restored.
+        Time complexity: O(logn).
+
+        :param idx: index of the entry to move
+        """
+        data_store = self.__data_store
+        entry = data_store[idx]
+
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent = data_store[parent_idx]
+            if not self.__has_precedence(entry, parent):
+                break
+            data_store[idx] = parent
+            idx = parent_idx
+
+        data_store[idx] = entry
+
+    def __sift_down(self, idx: int) -> None:
+        """Helper function to move the entry at the passed index towards the leaves until the heap order is restored.
+        Time complexity: O(logn).
+
+        :param idx: index of the entry to move
+        """
+        data_store = self.__data_store
+        length = len(data_store)
+        entry = data_store[idx]
+
+        while True:
+            child_idx = 2 * idx + 1
+            if child_idx >= length:
+                break
+            right_idx = child_idx + 1
+            if right_idx < length and self.__has_precedence(
+                data_store[right_idx], data_store[child_idx]
+            ):
+                child_idx = right_idx
+            if not self.__has_precedence(data_store[child_idx], entry):
+                break
+            data_store[idx] = data_store[child_idx]
+            idx = child_idx
+
+        data_store[idx] = entry
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the queue
+
+            >>> a_queue = BinaryHeapPriorityQueue()
+            >>> a_queue.enqueue(1, 2)
+            >>> len(a_queue)
+            1
+
+        :returns: count of elements in queue
+        """
+        return len(self.__data_store)
+
+    def is_empty(self) -> bool:
+        """Check if queue contains no elements
+
+            >>> a_queue = BinaryHeapPriorityQueue()
+            >>> a_queue.is_empty()
+            True
+            >>> a_queue.enqueue(1, 2)
+            >>> a_queue.is_empty()
+            False
+
+        :return: True if queue is empty, else False
+        """
+        return len(self.__data_store) == 0
+
+    def enqueue(self, x: Any, priority: Union[int, float]) -> None:
+        """Insert an element to the end of the queue. Time complexity: O(logn).
+
+            >>> a_queue = BinaryHeapPriorityQueue()
+            >>> a_queue.enqueue(1, 2)
+
+        :param x: element to add to the queue
+        :param priority: value that determines precedence of x in relation to the rest of the elements in the queue
+        """
+        self.__data_store.append((priority, self.__counter, x))
+        self.__counter += 1
+        self.__sift_up(len(self.__data_store) - 1)
+
+    def dequeue(self) -> Any:
+        """Remove first element of the queue and return it. Time complexity: O(logn).
+
+            >>> a_queue = BinaryHeapPriorityQueue()
+            >>> a_queue.enqueue(1, 2)
+            >>> a_queue.enqueue(3, 1)
+            >>> a_queue.enqueue(4, 2)
+            >>> a_queue.dequeue()
+            (3, 1)
+            >>> a_queue.dequeue()
+            (1, 2)
+            >>> a_queue.dequeue()
+            (4, 2)
+
+            >>> a_queue = BinaryHeapPriorityQueue(minimum_priority_queue=False)
+            >>> a_queue.enqueue(1, 2)
+            >>> a_queue.enqueue(3, 1)
+            >>> a_queue.dequeue()
+            (1, 2)
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+
+        data_store = self.__data_store
+        last_entry = data_store.pop()
+
+        if len(data_store) == 0:
+            return last_entry[2], last_entry[0]
+
+        first_entry = data_store[0]
+        data_store[0] = last_entry
+        self.__sift_down(0)
+
+        return first_entry[2], first_entry[0]
+
+    def get_first(self) -> Any:
+        """Return first element of the queue without removing it. Time complexity: O(1).
+
+            >>> a_queue = BinaryHeapPriorityQueue()
+            >>> a_queue.enqueue(1, 2)
+            >>> a_queue.get_first()
+            (1, 2)
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+
+        first_entry = self.__data_store[0]
+        return first_entry[2], first_entry[0]
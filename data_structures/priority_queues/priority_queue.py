@@ -6,6 +6,10 @@ class Empty(Exception):
     pass
 
 
+class Closed(Exception):
+    pass
+
+
 class PriorityQueue(ABC):
     """A priority queue is a queue ADT that supports insertion (enqueueing) of elements at one end and removal
     (dequeueing) of elements from the opposite end, with the extra attribute of priority of each element it contains,
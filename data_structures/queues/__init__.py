@@ -1,2 +1,6 @@
+from async_queue import AsyncQueue
+from blocking_queue import BlockingQueue
 from list_queue import ListQueue
-from queue_custom import Empty
+from offset_list_queue import OffsetListQueue
+from queue_custom import Closed, Empty, Full
+from shared_memory_queue import SharedMemoryQueue
@@ -0,0 +1,244 @@
+import asyncio
+import collections
+from typing import Any, Union
+
+from offset_list_queue import OffsetListQueue
+from queue_custom import Closed, Empty, Queue
+
+
+class _Waiters:
+    """Helper class holding the coroutines that are suspended until the queue may have changed, which are resumed in the
+    order in which they started waiting. A resumed coroutine has to check the queue again, and one that's cancelled
+    after being resumed passes its turn on to the next one.
+    """
+
+    def __init__(self):
+        self.__futures = collections.deque()
+
+    def wake_next(self) -> None:
+        """Resume the coroutine that has been waiting the longest, if any"""
+        while len(self.__futures) > 0:
+            future = self.__futures.popleft()
+            if not future.done():
+                future.set_result(None)
+                break
+
+    def wake_all(self) -> None:
+        """Resume all the waiting coroutines"""
+        while len(self.__futures) > 0:
+            future = self.__futures.popleft()
+            if not future.done():
+                future.set_result(None)
+
+    async def wait(self) -> None:
+        """Suspend the calling coroutine until it's resumed"""
+        future = asyncio.get_event_loop().create_future()
+        self.__futures.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.wake_next()
+            else:
+                future.cancel()
+                try:
+                    self.__futures.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+
+class AsyncQueue(Queue):
+    """
+    An async queue is a queue for coroutines running on an asyncio event loop. Enqueueing to a full queue or
+    dequeueing from an empty one suspends the calling coroutine until the operation can proceed. Suspended
+    coroutines are woken in the order in which they started waiting, but a woken coroutine doesn't reserve the
+    element or the space it was woken for, so it may be overtaken by another coroutine and have to wait again. The
+    elements are stored in an offset list queue.
+
+    Instantiate an async queue object that holds at most two elements
+
+        >>> loop = asyncio.new_event_loop()
+        >>> a_queue = AsyncQueue(capacity=2)
+
+    Enqueue and dequeue elements concurrently
+
+        >>> async def produce(n):
+        ...     for i in range(n):
+        ...         await a_queue.enqueue(i)
+        >>> async def consume(n):
+        ...     return [await a_queue.dequeue() for _ in range(n)]
+        >>> async def produce_and_consume(n):
+        ...     _, elements = await asyncio.gather(produce(n), consume(n))
+        ...     return elements
+        >>> loop.run_until_complete(produce_and_consume(5))
+        [0, 1, 2, 3, 4]
+
+    Close the queue, waiting for the remaining elements to be dequeued
+
+        >>> async def close_and_consume():
+        ...     _, elements = await asyncio.gather(a_queue.aclose(), consume(1))
+        ...     return elements
+        >>> loop.run_until_complete(a_queue.enqueue(5))
+        >>> loop.run_until_complete(close_and_consume())
+        [5]
+        >>> loop.run_until_complete(a_queue.dequeue())
+        Traceback (most recent call last):
+        ...
+        queue_custom.Closed: Queue is closed
+        >>> loop.close()
+    """
+
+    def __init__(self, capacity: Union[int, None] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+
+        self.__capacity = capacity
+        self.__data_store = OffsetListQueue()
+        self.__closed = False
+        self.__getters = _Waiters()
+        self.__putters = _Waiters()
+        self.__drainers = _Waiters()
+
+    def __is_full(self) -> bool:
+        """Helper function to check if the queue holds as many elements as its capacity
+
+        :returns: True if queue is full, else False
+        """
+        return self.__capacity is not None and len(self.__data_store) >= self.__capacity
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the queue
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_queue = AsyncQueue()
+            >>> loop.run_until_complete(a_queue.enqueue(1))
+            >>> len(a_queue)
+            1
+            >>> loop.close()
+
+        :returns: count of elements in queue
+        """
+        return len(self.__data_store)
+
+    def get_capacity(self) -> Union[int, None]:
+        """Return the maximum number of elements the queue can hold, None if the queue is unbounded
+
+            >>> AsyncQueue(capacity=2).get_capacity()
+            2
+
+        :returns: capacity of the queue
+        """
+        return self.__capacity
+
+    def is_closed(self) -> bool:
+        """Check if the queue has been closed
+
+            >>> AsyncQueue().is_closed()
+            False
+
+        :returns: True if queue is closed, else False
+        """
+        return self.__closed
+
+    def is_empty(self) -> bool:
+        """Check if queue contains no elements
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_queue = AsyncQueue()
+            >>> a_queue.is_empty()
+            True
+            >>> loop.run_until_complete(a_queue.enqueue(1))
+            >>> a_queue.is_empty()
+            False
+            >>> loop.close()
+
+        :return: True if queue is empty, else False
+        """
+        return self.__data_store.is_empty()
+
+    async def enqueue(self, x: Any) -> None:
+        """Insert an element to the end of the queue, waiting for space to become available if the queue is full
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_queue = AsyncQueue()
+            >>> loop.run_until_complete(a_queue.enqueue(1))
+            >>> loop.close()
+
+        :param x: element to add to the queue
+        :raises Closed: if the queue is closed
+        """
+        while True:
+            if self.__closed:
+                raise Closed("Queue is closed")
+            if not self.__is_full():
+                break
+            await self.__putters.wait()
+
+        self.__data_store.enqueue(x)
+        self.__getters.wake_next()
+
+    async def dequeue(self) -> Any:
+        """Remove first element of the queue and return it, waiting for an element to become available if the queue is
+        empty
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_queue = AsyncQueue()
+            >>> loop.run_until_complete(a_queue.enqueue(1))
+            >>> loop.run_until_complete(a_queue.dequeue())
+            1
+            >>> loop.close()
+
+        :return: first element of queue
+        :raises Closed: if the queue is closed and empty
+        """
+        while self.__data_store.is_empty():
+            if self.__closed:
+                raise Closed("Queue is closed")
+            await self.__getters.wait()
+
+        x = self.__data_store.dequeue()
+        self.__putters.wake_next()
+
+        if self.__data_store.is_empty():
+            self.__drainers.wake_all()
+
+        return x
+
+    def get_first(self) -> Any:
+        """Return first element of the queue without removing it
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_queue = AsyncQueue()
+            >>> loop.run_until_complete(a_queue.enqueue(1))
+            >>> a_queue.get_first()
+            1
+            >>> loop.close()
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+        return self.__data_store.get_first()
+
+    async def aclose(self) -> None:
+        """Close the queue and wait until all its elements have been dequeued. Coroutines waiting to enqueue, and
+        coroutines that wait to dequeue once the queue is drained, raise Closed.
+
+            >>> loop = asyncio.new_event_loop()
+            >>> a_queue = AsyncQueue()
+            >>> loop.run_until_complete(a_queue.aclose())
+            >>> loop.run_until_complete(a_queue.enqueue(1))
+            Traceback (most recent call last):
+            ...
+            queue_custom.Closed: Queue is closed
+            >>> loop.close()
+        """
+        self.__closed = True
+        self.__putters.wake_all()
+
+        while not self.__data_store.is_empty():
+            await self.__drainers.wait()
+
+        self.__getters.wake_all()
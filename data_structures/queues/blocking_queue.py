@@ -0,0 +1,242 @@
+import threading
+from typing import Any, List, Tuple, Union
+
+from offset_list_queue import OffsetListQueue
+from queue_custom import Empty, Full, Queue
+
+
+class BlockingQueue(Queue):
+    """
+    A blocking queue is a queue that can be shared between threads. All operations are guarded by a single lock, and
+    threads wait on condition variables when dequeueing from an empty queue or enqueueing to a full one. The
+    elements are stored in an offset list queue.
+
+    Instantiate a blocking queue object that holds at most two elements
+
+        >>> a_queue = BlockingQueue(capacity=2)
+
+    Enqueue elements without blocking
+
+        >>> a_queue.try_enqueue(1)
+        True
+        >>> a_queue.try_enqueue(2)
+        True
+        >>> a_queue.try_enqueue(3)
+        False
+
+    Enqueue an element, waiting for at most a given number of seconds for space to become available
+
+        >>> a_queue.enqueue(3, timeout=0.01)
+        Traceback (most recent call last):
+        ...
+        queue_custom.Full: Queue is full
+
+    Dequeue elements from another thread
+
+        >>> consumer = threading.Thread(target=a_queue.dequeue)
+        >>> consumer.start()
+        >>> a_queue.enqueue(3, timeout=1)
+        >>> consumer.join()
+
+    Dequeue a batch of elements with a single lock acquisition
+
+        >>> a_queue.dequeue_up_to(5)
+        [2, 3]
+        >>> a_queue.dequeue_up_to(5, timeout=0.01)
+        []
+
+    Dequeue elements without blocking
+
+        >>> a_queue.try_dequeue()
+        (False, None)
+    """
+
+    def __init__(self, capacity: Union[int, None] = None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+
+        self.__capacity = capacity
+        self.__data_store = OffsetListQueue()
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+
+    def __is_full(self) -> bool:
+        """Helper function to check if the queue holds as many elements as its capacity. The lock must be held by the
+        caller.
+
+        :returns: True if queue is full, else False
+        """
+        return self.__capacity is not None and len(self.__data_store) >= self.__capacity
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the queue
+
+            >>> a_queue = BlockingQueue()
+            >>> a_queue.enqueue(1)
+            >>> len(a_queue)
+            1
+
+        :returns: count of elements in queue
+        """
+        with self.__lock:
+            return len(self.__data_store)
+
+    def get_capacity(self) -> Union[int, None]:
+        """Return the maximum number of elements the queue can hold, None if the queue is unbounded
+
+            >>> BlockingQueue(capacity=2).get_capacity()
+            2
+
+        :returns: capacity of the queue
+        """
+        return self.__capacity
+
+    def is_empty(self) -> bool:
+        """Check if queue contains no elements
+
+            >>> a_queue = BlockingQueue()
+            >>> a_queue.is_empty()
+            True
+            >>> a_queue.enqueue(1)
+            >>> a_queue.is_empty()
+            False
+
+        :return: True if queue is empty, else False
+        """
+        with self.__lock:
+            return self.__data_store.is_empty()
+
+    def enqueue(
+        self, x: Any, block: bool = True, timeout: Union[float, None] = None
+    ) -> None:
+        """Insert an element to the end of the queue, waiting for space to become available if the queue is full
+
+            >>> a_queue = BlockingQueue(capacity=1)
+            >>> a_queue.enqueue(1)
+            >>> a_queue.enqueue(2, block=False)
+            Traceback (most recent call last):
+            ...
+            queue_custom.Full: Queue is full
+
+        :param x: element to add to the queue
+        :param block: if False, raise Full immediately instead of waiting when the queue is full
+        :param timeout: maximum number of seconds to wait, None to wait indefinitely
+        :raises Full: if the queue is still full after waiting
+        """
+        with self.__not_full:
+            if block:
+                self.__not_full.wait_for(lambda: not self.__is_full(), timeout)
+            if self.__is_full():
+                raise Full("Queue is full")
+
+            self.__data_store.enqueue(x)
+            self.__not_empty.notify()
+
+    def try_enqueue(self, x: Any) -> bool:
+        """Insert an element to the end of the queue if the queue isn't full, without waiting
+
+            >>> a_queue = BlockingQueue(capacity=1)
+            >>> a_queue.try_enqueue(1)
+            True
+            >>> a_queue.try_enqueue(2)
+            False
+
+        :param x: element to add to the queue
+        :returns: True if the element was added, else False
+        """
+        try:
+            self.enqueue(x, block=False)
+        except Full:
+            return False
+        return True
+
+    def dequeue(self, block: bool = True, timeout: Union[float, None] = None) -> Any:
+        """Remove first element of the queue and return it, waiting for an element to become available if the queue is
+        empty
+
+            >>> a_queue = BlockingQueue()
+            >>> a_queue.enqueue(1)
+            >>> a_queue.dequeue()
+            1
+            >>> a_queue.dequeue(timeout=0.01)
+            Traceback (most recent call last):
+            ...
+            queue_custom.Empty: Queue is empty
+
+        :param block: if False, raise Empty immediately instead of waiting when the queue is empty
+        :param timeout: maximum number of seconds to wait, None to wait indefinitely
+        :return: first element of queue
+        :raises Empty: if the queue is still empty after waiting
+        """
+        with self.__not_empty:
+            if block:
+                self.__not_empty.wait_for(
+                    lambda: not self.__data_store.is_empty(), timeout
+                )
+            if self.__data_store.is_empty():
+                raise Empty("Queue is empty")
+
+            x = self.__data_store.dequeue()
+            self.__not_full.notify()
+
+            return x
+
+    def try_dequeue(self) -> Tuple[bool, Any]:
+        """Remove first element of the queue and return it if the queue isn't empty, without waiting
+
+            >>> a_queue = BlockingQueue()
+            >>> a_queue.enqueue(1)
+            >>> a_queue.try_dequeue()
+            (True, 1)
+            >>> a_queue.try_dequeue()
+            (False, None)
+
+        :return: a tuple of True and the first element of queue if the queue isn't empty, else a tuple of False and None
+        """
+        try:
+            return True, self.dequeue(block=False)
+        except Empty:
+            return False, None
+
+    def dequeue_up_to(self, n: int, timeout: Union[float, None] = None) -> List[Any]:
+        """Remove up to n elements from the front of the queue and return them, waiting for at least one element to
+        become available if the queue is empty. The lock is acquired once for the whole batch.
+
+            >>> a_queue = BlockingQueue()
+            >>> a_queue.enqueue(1)
+            >>> a_queue.enqueue(2)
+            >>> a_queue.dequeue_up_to(5)
+            [1, 2]
+            >>> a_queue.dequeue_up_to(5, timeout=0)
+            []
+
+        :param n: maximum number of elements to remove
+        :param timeout: maximum number of seconds to wait, None to wait indefinitely
+        :return: list of the removed elements, in the order in which they were enqueued. Empty if no element became
+            available before the timeout.
+        """
+        if n < 1:
+            raise ValueError("Number of elements must be a positive integer")
+
+        with self.__not_empty:
+            self.__not_empty.wait_for(lambda: not self.__data_store.is_empty(), timeout)
+
+            k = min(n, len(self.__data_store))
+            elements = self.__data_store.dequeue_many(k)
+            self.__not_full.notify(k)
+
+            return elements
+
+    def get_first(self) -> Any:
+        """Return first element of the queue without removing it
+
+            >>> a_queue = BlockingQueue()
+            >>> a_queue.enqueue(1)
+            >>> a_queue.get_first()
+            1
+
+        :return: first element of queue
+        """
+        with self.__lock:
+            return self.__data_store.get_first()
@@ -0,0 +1,142 @@
+from typing import Any, Iterable, List
+
+from queue_custom import Empty, Queue
+
+
+class OffsetListQueue(Queue):
+    """
+    A queue implemented using python's list data structure and an offset marking the front of the queue. Dequeueing an
+    element advances the offset instead of shifting the remaining elements. The dequeued slots at the start of the list
+    are discarded once they make up more than half of the list, so the list never holds more than twice the number of
+    elements in the queue.
+    """
+
+    MINIMUM_COMPACTION_OFFSET = 32
+
+    def __init__(self):
+        self.__data_store = []
+        self.__front = 0
+
+    def __compact(self) -> None:
+        """Helper function to discard the dequeued slots at the start of the list once they make up more than half of
+        it. Time complexity: amortized O(1).
+        """
+        front = self.__front
+        if front >= OffsetListQueue.MINIMUM_COMPACTION_OFFSET and 2 * front > len(
+            self.__data_store
+        ):
+            del self.__data_store[:front]
+            self.__front = 0
+        elif front == len(self.__data_store):
+            self.__data_store.clear()
+            self.__front = 0
+
+    def __len__(self) -> int:
+        """Get the total number of elements stored in the queue
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.enqueue(1)
+            >>> len(a_queue)
+            1
+
+        :returns: count of elements in queue
+        """
+        return len(self.__data_store) - self.__front
+
+    def is_empty(self) -> bool:
+        """Check if queue contains no elements
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.is_empty()
+            True
+            >>> a_queue.enqueue(1)
+            >>> a_queue.is_empty()
+            False
+
+        :return: True if queue is empty, else False
+        """
+        return len(self.__data_store) == self.__front
+
+    def enqueue(self, x: Any) -> None:
+        """Insert an element to the end of the queue. Time complexity: amortized O(1).
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.enqueue(1)
+
+        :param x: element to add to the queue
+        """
+        self.__data_store.append(x)
+
+    def enqueue_many(self, elements: Iterable[Any]) -> None:
+        """Insert elements to the end of the queue, in the order in which they are iterated. Time complexity: O(k).
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.enqueue_many(range(3))
+            >>> len(a_queue)
+            3
+
+        :param elements: iterable of elements to add to the queue
+        """
+        self.__data_store.extend(elements)
+
+    def dequeue(self) -> Any:
+        """Remove first element of the queue and return it. Time complexity: amortized O(1).
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.enqueue(1)
+            >>> a_queue.dequeue()
+            1
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+
+        x = self.__data_store[self.__front]
+        self.__data_store[self.__front] = None
+        self.__front += 1
+        self.__compact()
+
+        return x
+
+    def dequeue_many(self, k: int) -> List[Any]:
+        """Remove the first k elements of the queue and return them. Time complexity: amortized O(k).
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.enqueue_many(range(5))
+            >>> a_queue.dequeue_many(3)
+            [0, 1, 2]
+            >>> a_queue.dequeue_many(3)
+            Traceback (most recent call last):
+            ...
+            queue_custom.Empty: Queue has fewer than 3 elements
+
+        :param k: number of elements to remove
+        :return: list of the first k elements of the queue, in the order in which they were enqueued
+        """
+        if k < 0:
+            raise ValueError("Number of elements must be non-negative")
+        if len(self) < k:
+            raise Empty(f"Queue has fewer than {k} elements")
+
+        front = self.__front
+        elements = self.__data_store[front : front + k]
+        self.__data_store[front : front + k] = [None] * k
+        self.__front += k
+        self.__compact()
+
+        return elements
+
+    def get_first(self) -> Any:
+        """Return first element of the queue without removing it. Time complexity: O(1).
+
+            >>> a_queue = OffsetListQueue()
+            >>> a_queue.enqueue(1)
+            >>> a_queue.get_first()
+            1
+
+        :return: first element of queue
+        """
+        if self.is_empty():
+            raise Empty("Queue is empty")
+        return self.__data_store[self.__front]
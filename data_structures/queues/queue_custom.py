@@ -6,6 +6,14 @@ class Empty(Exception):
     pass
 
 
+class Full(Exception):
+    pass
+
+
+class Closed(Exception):
+    pass
+
+
 class Queue(ABC):
     """A queue is a First-In-First-Out ADT that supports insertion (enqueueing) of elements at one end and removal
     (dequeueing) of elements from the opposite end. The order in which elements are enqueued is maintained when
@@ -0,0 +1,323 @@
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Tuple, Union
+
+from queue_custom import Empty, Full, Queue
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover - python < 3.8
+    SharedMemory = None
+
+
+class _MappedFile:
+    """A block of memory shared between processes by mapping the same temporary file into each of them. It's used in
+    place of multiprocessing.shared_memory.SharedMemory, which requires python 3.8 or later, and has the same
+    interface. The name of the block is the path of the file.
+    """
+
+    def __init__(
+        self, name: Union[str, None] = None, create: bool = False, size: int = 0
+    ):
+        if create:
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            file_descriptor, name = tempfile.mkstemp(prefix="smq_", dir=directory)
+            os.ftruncate(file_descriptor, size)
+        else:
+            file_descriptor = os.open(name, os.O_RDWR)
+            size = os.fstat(file_descriptor).st_size
+
+        try:
+            self.__mmap = mmap.mmap(file_descriptor, size)
+        finally:
+            os.close(file_descriptor)
+
+        self.name = name
+        self.size = size
+        self.buf = memoryview(self.__mmap)
+
+    def close(self) -> None:
+        """Unmap the file from this process"""
+        self.buf.release()
+        self.__mmap.close()
+
+    def unlink(self) -> None:
+        """Delete the file"""
+        os.unlink(self.name)
+
+
+if SharedMemory is None:  # pragma: no cover - python < 3.8
+    SharedMemory = _MappedFile
+
+
+class SharedMemoryQueue(Queue):
+    """
+    A shared memory queue is a queue of fixed-size binary records, stored in a ring buffer within a block of shared
+    memory. Processes that attach to the same block exchange records by packing and unpacking them in place, without
+    pickling. Each record is a tuple of values described by a struct format string, e.g. "if" for an int and a float.
+
+    The shared memory block starts with two unsigned 64-bit counters, the total number of records ever dequeued and
+    the total number of records ever enqueued, followed by the record slots. By default, the queue supports a single
+    producer process and a single consumer process, each of which only writes to its own counter. Passing a lock, such
+    as multiprocessing.Lock(), allows multiple producers and consumers by guarding every operation with the lock.
+
+    The queue can be passed to child processes as an argument, in which case the child attaches to the same shared
+    memory block. Alternatively, other processes can attach using the name of the block. On python versions older than
+    3.8, which lack multiprocessing.shared_memory, the block is a temporary file that each process maps into its memory,
+    and the name of the block is the path of the file.
+
+    Instantiate a shared memory queue that holds at most two records of an int and a float each
+
+        >>> a_queue = SharedMemoryQueue("if", capacity=2)
+
+    Attach to the same queue, such as from another process
+
+        >>> other_queue = SharedMemoryQueue("if", capacity=2, name=a_queue.get_name())
+
+    Enqueue and dequeue records
+
+        >>> a_queue.enqueue((1, 0.5))
+        >>> a_queue.enqueue((2, 1.5))
+        >>> a_queue.enqueue((3, 2.5))
+        Traceback (most recent call last):
+        ...
+        queue_custom.Full: Queue is full
+        >>> other_queue.dequeue()
+        (1, 0.5)
+        >>> len(a_queue)
+        1
+
+    Detach from the shared memory block, and free it once all processes have detached
+
+        >>> other_queue.close()
+        >>> a_queue.close()
+        >>> a_queue.unlink()
+    """
+
+    __HEADER = struct.Struct("QQ")
+    __COUNTER = struct.Struct("Q")
+    __HEAD_OFFSET = 0
+    __TAIL_OFFSET = 8
+
+    def __init__(
+        self,
+        record_format: str,
+        capacity: int,
+        name: Union[str, None] = None,
+        lock: Any = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Capacity must be a positive integer")
+
+        self.__record_format = record_format
+        self.__record = struct.Struct(record_format)
+        self.__capacity = capacity
+        self.__lock = lock
+
+        size = SharedMemoryQueue.__HEADER.size + capacity * self.__record.size
+
+        if name is None:
+            self.__shared_memory = SharedMemory(create=True, size=size)
+            SharedMemoryQueue.__HEADER.pack_into(self.__shared_memory.buf, 0, 0, 0)
+        else:
+            self.__shared_memory = SharedMemory(name=name)
+            if self.__shared_memory.size < size:
+                self.__shared_memory.close()
+                raise ValueError("Shared memory block is too small for the queue")
+
+        self.__buffer = self.__shared_memory.buf
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle when passing the queue to another process, which is enough to attach to the
+        same shared memory block
+
+        :returns: the state of the queue
+        """
+        return {
+            "record_format": self.__record_format,
+            "capacity": self.__capacity,
+            "name": self.__shared_memory.name,
+            "lock": self.__lock,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Attach to the shared memory block described by the unpickled state
+
+        :param state: the state of the queue
+        """
+        self.__init__(**state)
+
+    def __get_counter(self, offset: int) -> int:
+        """Helper function to read one of the counters in the header of the shared memory block
+
+        :param offset: byte offset of the counter
+        :returns: value of the counter
+        """
+        return SharedMemoryQueue.__COUNTER.unpack_from(self.__buffer, offset)[0]
+
+    def __set_counter(self, offset: int, value: int) -> None:
+        """Helper function to write one of the counters in the header of the shared memory block
+
+        :param offset: byte offset of the counter
+        :param value: new value of the counter
+        """
+        SharedMemoryQueue.__COUNTER.pack_into(self.__buffer, offset, value)
+
+    def __get_slot_offset(self, counter: int) -> int:
+        """Helper function to get the byte offset of the slot of the record with the passed counter
+
+        :param counter: total number of records enqueued before the record
+        :returns: byte offset of the slot
+        """
+        return (
+            SharedMemoryQueue.__HEADER.size
+            + (counter % self.__capacity) * self.__record.size
+        )
+
+    def __enqueue(self, x: Tuple) -> None:
+        """Helper function to insert a record without acquiring the lock
+
+        :param x: record to add to the queue
+        """
+        head = self.__get_counter(SharedMemoryQueue.__HEAD_OFFSET)
+        tail = self.__get_counter(SharedMemoryQueue.__TAIL_OFFSET)
+
+        if tail - head >= self.__capacity:
+            raise Full("Queue is full")
+
+        self.__record.pack_into(self.__buffer, self.__get_slot_offset(tail), *x)
+        self.__set_counter(SharedMemoryQueue.__TAIL_OFFSET, tail + 1)
+
+    def __dequeue(self, remove: bool) -> Tuple:
+        """Helper function to read the first record without acquiring the lock
+
+        :param remove: True if the record should be removed from the queue, else False
+        :returns: first record of queue
+        """
+        head = self.__get_counter(SharedMemoryQueue.__HEAD_OFFSET)
+        tail = self.__get_counter(SharedMemoryQueue.__TAIL_OFFSET)
+
+        if head == tail:
+            raise Empty("Queue is empty")
+
+        x = self.__record.unpack_from(self.__buffer, self.__get_slot_offset(head))
+        if remove:
+            self.__set_counter(SharedMemoryQueue.__HEAD_OFFSET, head + 1)
+
+        return x
+
+    def __len__(self) -> int:
+        """Get the total number of records stored in the queue
+
+            >>> a_queue = SharedMemoryQueue("i", capacity=2)
+            >>> a_queue.enqueue((1,))
+            >>> len(a_queue)
+            1
+            >>> a_queue.close()
+            >>> a_queue.unlink()
+
+        :returns: count of records in queue
+        """
+        head = self.__get_counter(SharedMemoryQueue.__HEAD_OFFSET)
+        tail = self.__get_counter(SharedMemoryQueue.__TAIL_OFFSET)
+        return tail - head
+
+    def get_name(self) -> str:
+        """Return the name of the shared memory block, which other processes can use to attach to the queue
+
+        :returns: name of the shared memory block
+        """
+        return self.__shared_memory.name
+
+    def get_capacity(self) -> int:
+        """Return the maximum number of records the queue can hold
+
+            >>> a_queue = SharedMemoryQueue("i", capacity=2)
+            >>> a_queue.get_capacity()
+            2
+            >>> a_queue.close()
+            >>> a_queue.unlink()
+
+        :returns: capacity of the queue
+        """
+        return self.__capacity
+
+    def is_empty(self) -> bool:
+        """Check if queue contains no records
+
+            >>> a_queue = SharedMemoryQueue("i", capacity=2)
+            >>> a_queue.is_empty()
+            True
+            >>> a_queue.enqueue((1,))
+            >>> a_queue.is_empty()
+            False
+            >>> a_queue.close()
+            >>> a_queue.unlink()
+
+        :return: True if queue is empty, else False
+        """
+        return len(self) == 0
+
+    def enqueue(self, x: Tuple) -> None:
+        """Insert a record to the end of the queue. Time complexity: O(1).
+
+            >>> a_queue = SharedMemoryQueue("i", capacity=2)
+            >>> a_queue.enqueue((1,))
+            >>> a_queue.close()
+            >>> a_queue.unlink()
+
+        :param x: record to add to the queue, a tuple of values matching the record format
+        :raises Full: if the queue is full
+        """
+        if self.__lock is None:
+            self.__enqueue(x)
+        else:
+            with self.__lock:
+                self.__enqueue(x)
+
+    def dequeue(self) -> Tuple:
+        """Remove first record of the queue and return it. Time complexity: O(1).
+
+            >>> a_queue = SharedMemoryQueue("i", capacity=2)
+            >>> a_queue.enqueue((1,))
+            >>> a_queue.dequeue()
+            (1,)
+            >>> a_queue.close()
+            >>> a_queue.unlink()
+
+        :return: first record of queue
+        """
+        if self.__lock is None:
+            return self.__dequeue(True)
+        with self.__lock:
+            return self.__dequeue(True)
+
+    def get_first(self) -> Tuple:
+        """Return first record of the queue without removing it. Time complexity: O(1).
+
+            >>> a_queue = SharedMemoryQueue("i", capacity=2)
+            >>> a_queue.enqueue((1,))
+            >>> a_queue.get_first()
+            (1,)
+            >>> a_queue.close()
+            >>> a_queue.unlink()
+
+        :return: first record of queue
+        """
+        if self.__lock is None:
+            return self.__dequeue(False)
+        with self.__lock:
+            return self.__dequeue(False)
+
+    def close(self) -> None:
+        """Detach this process from the shared memory block. The queue can't be used afterwards."""
+        self.__buffer = None
+        self.__shared_memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory block. It should be called once, by one of the processes, when the queue is no longer
+        needed by any process.
+        """
+        self.__shared_memory.unlink()
@@ -1,5 +1,7 @@
 from avl_tree import AVLTree
+from b_plus_tree import BPlusTree
 from binary_expression_tree import BinaryExpressionTree
 from binary_search_tree import BinarySearchTree
+from red_black_tree import RedBlackTree
 from tree import Empty
 from trie import Trie
@@ -6,6 +6,12 @@ class AVLTree(BinarySearchTree):
     """An AVL tree is a binary search tree that is balanced. Whenever an item is inserted or deleted, the tree
     rebalances itself. This ensures an a worst case search time of O(logn).
 
+    Each node caches the height of its subtree. After an insertion or a deletion, only the nodes on the path from the
+    changed node up to the root are updated, and any of them whose subtrees differ in height by more than one is
+    rebalanced with a single or a double rotation, so both operations take O(logn) time. The height of a node is read
+    from its cache in O(1) time. Each node also caches the number of nodes in its subtree, which is kept up to date
+    through rotations, so ranking keys and selecting keys by rank take O(logn) time.
+
     Instantiate an AVL tree object
 
         >>> tree = AVLTree()
@@ -145,93 +151,160 @@ class AVLTree(BinarySearchTree):
 
         >>> next(tree).get_data()
         (4, 400)
+
+    Insertions and deletions in sorted order keep the tree balanced
+
+        >>> sorted_tree = AVLTree()
+        >>> for key in range(1, 8):
+        ...     sorted_tree.insert(key, key * 100)
+        >>> sorted_tree
+        4(2(1, 3), 6(5, 7))
+        >>> for key in [1, 2, 3]:
+        ...     sorted_tree.delete(sorted_tree.search(key))
+        >>> sorted_tree
+        6(4(5), 7)
+        >>> sorted_tree.get_height_of_tree()
+        2
+
+    Get the rank of a key, the key at some rank, and the number of keys within some range
+
+        >>> sorted_tree.rank(6)
+        2
+        >>> sorted_tree.select(0).get_data()
+        (4, 400)
+        >>> sorted_tree.nth_smallest(3).get_data()
+        (6, 600)
+        >>> sorted_tree.count_range(5, 7)
+        2
     """
 
+    class _AVLNode(Tree._Node):
+        def __init__(self, key, value, parent=None):
+            super().__init__(key, value, parent, [None, None])
+            self.height = 1
+            self.size = 1
+
     def __init__(self):
         super().__init__()
 
     @staticmethod
-    def __rotate(node_to_move, root_node, parent, clockwise):
-        node_to_move.parent = parent
-        if parent is not None:
-            is_left_child = root_node.key < parent.key
-            if is_left_child:
-                parent.children[0] = node_to_move
-            else:
-                parent.children[1] = node_to_move
-        if clockwise:
-            node_to_move.children[1] = root_node
-        else:
-            node_to_move.children[0] = root_node
-        root_node.parent = node_to_move
-
-    def __get_balance(self, root_node):
-        if root_node is None:
-            return 0
-        left_height = (
-            0
-            if root_node.children[0] is None
-            else self.get_height_of_node(Tree._Position(self, root_node.children[0]))
+    def __get_height(node) -> int:
+        """Helper function to get the number of nodes on the longest path from a node down to a leaf, as cached in the
+        node. Time complexity: O(1).
+
+        :param node: the node, or None
+        :returns: the cached height of the node, or 0 if the node is None
+        """
+        return 0 if node is None else node.height
+
+    @staticmethod
+    def __get_balance(node) -> int:
+        """Helper function to get the difference between the heights of the left and right subtrees of a node. Time
+        complexity: O(1).
+
+        :param node: the node
+        :returns: the height of the left subtree minus the height of the right subtree
+        """
+        return AVLTree.__get_height(node.children[0]) - AVLTree.__get_height(
+            node.children[1]
         )
-        right_height = (
-            0
-            if root_node.children[1] is None
-            else self.get_height_of_node(Tree._Position(self, root_node.children[1]))
+
+    def __rebalance(self, node) -> None:
+        """Helper function to update the heights of the nodes from the passed node up to the root, and to restore the
+        balance of each of them with a single or a double rotation where the heights of its subtrees differ by more
+        than one. Time complexity: O(logn).
+
+        :param node: the lowest node whose subtree changed, or None
+        """
+        while node is not None:
+            self._update_node(node)
+            balance = AVLTree.__get_balance(node)
+
+            if balance > 1:
+                if AVLTree.__get_balance(node.children[0]) < 0:
+                    self._rotate(node.children[0].children[1])
+                node = node.children[0]
+                self._rotate(node)
+            elif balance < -1:
+                if AVLTree.__get_balance(node.children[1]) > 0:
+                    self._rotate(node.children[1].children[0])
+                node = node.children[1]
+                self._rotate(node)
+
+            node = node.parent
+
+    def _update_node(self, node):
+        node.height = 1 + max(
+            AVLTree.__get_height(node.children[0]),
+            AVLTree.__get_height(node.children[1]),
         )
-        return left_height - right_height
-
-    def __balance_tree(self):
-        def balance_tree(root_node):
-            parent = root_node.parent
-            left_child = root_node.children[0]
-            right_child = root_node.children[1]
-
-            if left_child is not None:
-                balance_tree(left_child)
-
-            if right_child is not None:
-                balance_tree(right_child)
-
-            balance = self.__get_balance(root_node)
-
-            if abs(balance <= 1):
-                return root_node
-
-            if balance > 0:
-                current = root_node.children[0]
-                right = current.children[1]
-                if right is None:
-                    AVLTree.__rotate(current, root_node, parent, clockwise=True)
-                    return current
-                else:
-                    new_node = Tree._Node(
-                        right.key, right.value, parent=parent, children=[current, None]
-                    )
-                    AVLTree.__rotate(new_node, root_node, parent, clockwise=True)
-                    current.parent = new_node
-                    self.delete(Tree._Position(self, right))
-                    return new_node
-            else:
-                current = root_node.children[1]
-                left = current.children[0]
-                if left is None:
-                    AVLTree.__rotate(current, root_node, parent, clockwise=False)
-                    return current
-                else:
-                    new_node = Tree._Node(
-                        left.key, left.value, parent=parent, children=[None, current]
-                    )
-                    AVLTree.__rotate(new_node, root_node, parent, clockwise=False)
-                    current.parent = new_node
-                    self.delete(Tree._Position(self, left))
-                    return new_node
-
-        self.__root = balance_tree(self._root)
+        node.size = (
+            1
+            + self._get_subtree_size(node.children[0])
+            + self._get_subtree_size(node.children[1])
+        )
+
+    def _get_subtree_size(self, node):
+        return 0 if node is None else node.size
+
+    def get_height_of_node(self, position: Tree._Position) -> int:
+        if not position.is_owned_by(self):
+            raise ValueError("Position doesn't belong to this tree")
+
+        return position.manipulate_node(self, "_validate_node").height - 1
 
     def delete(self, position: Tree._Position):
-        super().delete(position)
-        self.__balance_tree()
+        if not position.is_owned_by(self):
+            raise ValueError("Position doesn't belong to this tree")
+
+        node = position.manipulate_node(self, "_validate_node")
+        _ = position.manipulate_variables(self, "_invalidate_position")
+        self._length -= 1
+
+        left_child, right_child = node.children
+
+        if left_child is None or right_child is None:
+            lowest_changed_node = node.parent
+            self._transplant(
+                node, right_child if left_child is None else left_child, node.parent
+            )
+        else:
+            successor = right_child
+            while successor.children[0] is not None:
+                successor = successor.children[0]
+
+            if successor is right_child:
+                lowest_changed_node = successor
+            else:
+                lowest_changed_node = successor.parent
+                self._transplant(successor, successor.children[1], successor.parent)
+                successor.children[1] = right_child
+                right_child.parent = successor
+
+            successor.children[0] = left_child
+            left_child.parent = successor
+            self._transplant(node, successor, node.parent)
+
+        self.__rebalance(lowest_changed_node)
 
     def insert(self, key, value):
-        super().insert(key, value)
-        self.__balance_tree()
+        parent = None
+        current_node = self._root
+
+        while current_node is not None:
+            if key == current_node.key:
+                raise ValueError("Key already exists in tree")
+            parent = current_node
+            current_node = current_node.children[1 if key > current_node.key else 0]
+
+        self._length += 1
+        node = AVLTree._AVLNode(key, value, parent)
+
+        if parent is None:
+            self._root = node
+        elif key > parent.key:
+            parent.children[1] = node
+        else:
+            parent.children[0] = node
+
+        self.__rebalance(parent)
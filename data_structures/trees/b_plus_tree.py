@@ -0,0 +1,469 @@
+import bisect
+from typing import Any, Generator, Iterable, Tuple, Union
+
+
+class BPlusTree:
+    """A B+ tree is a balanced search tree whose nodes each hold a sorted array of keys, rather than a single key. The
+    order of the tree is the maximum number of children of a node. Internal nodes only hold the keys that guide
+    searches, and the items are all stored in the leaves, which are at the same depth and linked together in ascending
+    order of their keys. Every node other than the root is kept at least half full, by splitting nodes that overflow
+    on insertion, and by borrowing from or merging with a sibling when a node underflows on deletion. Searches,
+    insertions and deletions therefore take O(logn) time, while items with keys within some range are found by a single
+    search followed by a walk along the leaves.
+
+    Holding many keys per node makes the tree shallow, with few nodes, which is why B+ trees are used to index large
+    amounts of data.
+
+    Instantiate a B+ tree object, with some order
+
+        >>> tree = BPlusTree(order=4)
+
+    Insert an item to the tree
+
+        >>> for key in [5, 15, 25, 35, 45, 55, 65]:
+        ...     tree.insert(key, key * 10)
+
+    Get the string representation of some tree
+
+        >>> tree
+        [25, 45]([5, 15], [25, 35], [45, 55, 65])
+
+    Get length of some tree
+
+        >>> len(tree)
+        7
+        >>> len(BPlusTree())
+        0
+
+    Check if a tree is empty
+
+        >>> tree.is_empty()
+        False
+        >>> BPlusTree().is_empty()
+        True
+
+    Get the value associated to some key
+
+        >>> tree.search(35)
+        350
+        >>> tree[35]
+        350
+        >>> 40 in tree
+        False
+        >>> tree.search(40)
+        Traceback (most recent call last):
+        ...
+        KeyError: 'key not present in tree'
+
+    Get the items whose keys are within some range, from the lower bound up to but excluding the upper bound
+
+        >>> list(tree.range(15, 45))
+        [(15, 150), (25, 250), (35, 350)]
+        >>> list(tree.range(50, None))
+        [(55, 550), (65, 650)]
+
+    Iterate over the keys in ascending order
+
+        >>> list(tree)
+        [5, 15, 25, 35, 45, 55, 65]
+
+    Delete an item from the tree
+
+        >>> tree.delete(25)
+        >>> del tree[35]
+        >>> tree
+        [55]([5, 15, 45], [55, 65])
+
+    Build a tree from items sorted by key
+
+        >>> BPlusTree.bulk_load([(key, key * 10) for key in range(10)], order=4)
+        [3, 6, 8]([0, 1, 2], [3, 4, 5], [6, 7], [8, 9])
+    """
+
+    class _Leaf:
+        def __init__(self, keys=None, values=None):
+            self.keys = keys if keys is not None else []
+            self.values = values if values is not None else []
+            self.next = None
+
+    class _Internal:
+        def __init__(self, keys, children):
+            self.keys = keys
+            self.children = children
+
+    def __init__(self, order: int = 64):
+        """
+        :param order: the maximum number of children of a node, which must be at least 3. Leaves hold up to one item
+            less than the order.
+        """
+        if order < 3:
+            raise ValueError("The order of a B+ tree must be at least 3")
+
+        self.__order = order
+        self.__root = BPlusTree._Leaf()
+        self.__length = 0
+
+    def __len__(self) -> int:
+        """Return total number of items in tree
+
+        :return: count of items in tree
+        """
+        return self.__length
+
+    def __repr__(self) -> str:
+        """Return a string representation of the tree
+
+        :return: the string representation of the tree
+        """
+
+        def helper(node):
+            if isinstance(node, BPlusTree._Leaf):
+                return str(node.keys)
+            return f"{node.keys}({', '.join(helper(child) for child in node.children)})"
+
+        return helper(self.__root)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if the tree contains an item with the passed key. Time complexity: O(logn).
+
+        :param key: the key to check
+        :returns: True if the key is in the tree, else False
+        """
+        leaf = self.__find_leaf(key)
+        idx = bisect.bisect_left(leaf.keys, key)
+
+        return idx < len(leaf.keys) and leaf.keys[idx] == key
+
+    def __iter__(self) -> Generator:
+        """Iterate over the keys of the tree in ascending order. Time complexity: O(n).
+
+        :returns: a generator of the keys
+        """
+        for key, _ in self.range(None, None):
+            yield key
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.search(key)
+
+    def __delitem__(self, key: Any) -> None:
+        self.delete(key)
+
+    @classmethod
+    def bulk_load(
+        cls, items: Iterable[Tuple[Any, Any]], order: int = 64
+    ) -> "BPlusTree":
+        """Build a tree from items sorted in ascending order of their keys, level by level from the leaves up, with the
+        items spread evenly across full leaves. Time complexity: O(n).
+
+        :param items: iterable of (key, value) pairs, sorted by key, with no duplicate keys
+        :param order: the maximum number of children of a node
+        :returns: the tree
+        """
+        tree = cls(order)
+        keys = []
+        values = []
+
+        for key, value in items:
+            if len(keys) > 0 and not keys[-1] < key:
+                raise ValueError("Items must be sorted by key, with no duplicate keys")
+            keys.append(key)
+            values.append(value)
+
+        if len(keys) == 0:
+            return tree
+
+        leaves = []
+        for start, end in BPlusTree.__get_groups(len(keys), order - 1):
+            leaf = BPlusTree._Leaf(keys[start:end], values[start:end])
+            if len(leaves) > 0:
+                leaves[-1].next = leaf
+            leaves.append(leaf)
+
+        nodes = leaves
+        min_keys = [leaf.keys[0] for leaf in leaves]
+
+        while len(nodes) > 1:
+            parents = []
+            parent_min_keys = []
+
+            for start, end in BPlusTree.__get_groups(len(nodes), order):
+                parents.append(
+                    BPlusTree._Internal(min_keys[start + 1 : end], nodes[start:end])
+                )
+                parent_min_keys.append(min_keys[start])
+
+            nodes = parents
+            min_keys = parent_min_keys
+
+        tree.__root = nodes[0]
+        tree.__length = len(keys)
+
+        return tree
+
+    @staticmethod
+    def __get_groups(n: int, capacity: int) -> Generator:
+        """Helper function to split a sequence into as few contiguous groups as the capacity allows, with sizes that
+        differ by at most one
+
+        :param n: the length of the sequence
+        :param capacity: the maximum size of a group
+        :returns: a generator of the (start, end) indices of the groups
+        """
+        count = -(-n // capacity)
+        size, remainder = divmod(n, count)
+        start = 0
+
+        for i in range(count):
+            end = start + size + (1 if i < remainder else 0)
+            yield start, end
+            start = end
+
+    def __find_leaf(self, key: Any) -> "BPlusTree._Leaf":
+        """Helper function to find the leaf where a key is, or would be, stored. Time complexity: O(logn).
+
+        :param key: the key to search for
+        :returns: the leaf
+        """
+        node = self.__root
+
+        while isinstance(node, BPlusTree._Internal):
+            node = node.children[bisect.bisect_right(node.keys, key)]
+
+        return node
+
+    def __find_path(self, key: Any) -> list:
+        """Helper function to find the nodes on the path from the root to the leaf where a key is, or would be, stored,
+        along with the index of each node within its parent. Time complexity: O(logn).
+
+        :param key: the key to search for
+        :returns: list of (node, index) pairs, from the root, whose index is None, down to the leaf
+        """
+        node = self.__root
+        path = [(node, None)]
+
+        while isinstance(node, BPlusTree._Internal):
+            idx = bisect.bisect_right(node.keys, key)
+            node = node.children[idx]
+            path.append((node, idx))
+
+        return path
+
+    def __split(self, node) -> tuple:
+        """Helper function to move the upper half of an overflowing node to a new node
+
+        :param node: the node to split
+        :returns: the key separating the two nodes, and the new node
+        """
+        if isinstance(node, BPlusTree._Leaf):
+            middle = len(node.keys) // 2
+            new_node = BPlusTree._Leaf(node.keys[middle:], node.values[middle:])
+            del node.keys[middle:]
+            del node.values[middle:]
+            new_node.next = node.next
+            node.next = new_node
+
+            return new_node.keys[0], new_node
+
+        middle = len(node.children) // 2 + len(node.children) % 2
+        separator = node.keys[middle - 1]
+        new_node = BPlusTree._Internal(node.keys[middle:], node.children[middle:])
+        del node.keys[middle - 1 :]
+        del node.children[middle:]
+
+        return separator, new_node
+
+    def __is_underflowing(self, node) -> bool:
+        """Helper function to check if a node other than the root is less than half full
+
+        :param node: the node to check
+        :returns: True if the node has too few keys or children, else False
+        """
+        if isinstance(node, BPlusTree._Leaf):
+            return len(node.keys) < self.__order // 2
+        return len(node.children) < (self.__order + 1) // 2
+
+    def __has_spare(self, node) -> bool:
+        """Helper function to check if a node can lend a key or a child to a sibling without underflowing
+
+        :param node: the node to check
+        :returns: True if the node can lend a key or a child, else False
+        """
+        if isinstance(node, BPlusTree._Leaf):
+            return len(node.keys) > self.__order // 2
+        return len(node.children) > (self.__order + 1) // 2
+
+    def __borrow(self, parent, idx: int, from_left: bool) -> None:
+        """Helper function to move a key or a child into an underflowing node from its left or right sibling, updating
+        the key that separates them in their parent
+
+        :param parent: the parent of the node
+        :param idx: the index of the node within its parent
+        :param from_left: True to borrow from the left sibling, False to borrow from the right sibling
+        """
+        node = parent.children[idx]
+
+        if from_left:
+            sibling = parent.children[idx - 1]
+            if isinstance(node, BPlusTree._Leaf):
+                node.keys.insert(0, sibling.keys.pop())
+                node.values.insert(0, sibling.values.pop())
+                parent.keys[idx - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[idx - 1])
+                node.children.insert(0, sibling.children.pop())
+                parent.keys[idx - 1] = sibling.keys.pop()
+        else:
+            sibling = parent.children[idx + 1]
+            if isinstance(node, BPlusTree._Leaf):
+                node.keys.append(sibling.keys.pop(0))
+                node.values.append(sibling.values.pop(0))
+                parent.keys[idx] = sibling.keys[0]
+            else:
+                node.keys.append(parent.keys[idx])
+                node.children.append(sibling.children.pop(0))
+                parent.keys[idx] = sibling.keys.pop(0)
+
+    def __merge(self, parent, idx: int) -> None:
+        """Helper function to merge a node with its right sibling, removing the key that separates them from their
+        parent
+
+        :param parent: the parent of the nodes
+        :param idx: the index of the left node within its parent
+        """
+        node = parent.children[idx]
+        sibling = parent.children[idx + 1]
+        separator = parent.keys.pop(idx)
+        del parent.children[idx + 1]
+
+        if isinstance(node, BPlusTree._Leaf):
+            node.keys.extend(sibling.keys)
+            node.values.extend(sibling.values)
+            node.next = sibling.next
+        else:
+            node.keys.append(separator)
+            node.keys.extend(sibling.keys)
+            node.children.extend(sibling.children)
+
+    def is_empty(self) -> bool:
+        """Return True if tree is empty, else False. Time complexity: O(1).
+
+        :returns: True if tree is empty, else False
+        """
+        return self.__length == 0
+
+    def search(self, key: Any) -> Any:
+        """Return the value associated to the passed key. Time complexity: O(logn).
+
+        :param key: the key to search
+        :returns: the value associated to the key
+        """
+        leaf = self.__find_leaf(key)
+        idx = bisect.bisect_left(leaf.keys, key)
+
+        if idx == len(leaf.keys) or leaf.keys[idx] != key:
+            raise KeyError("key not present in tree")
+
+        return leaf.values[idx]
+
+    def insert(self, key: Any, value: Any) -> None:
+        """Insert an item into the tree, splitting the nodes that overflow on the path up to the root. Time complexity:
+        O(logn).
+
+        :param key: unique identifier of the item to be added to the tree
+        :param value: item to be added to the tree
+        """
+        path = self.__find_path(key)
+        leaf = path[-1][0]
+        idx = bisect.bisect_left(leaf.keys, key)
+
+        if idx < len(leaf.keys) and leaf.keys[idx] == key:
+            raise ValueError("Key already exists in tree")
+
+        leaf.keys.insert(idx, key)
+        leaf.values.insert(idx, value)
+        self.__length += 1
+
+        for level in range(len(path) - 1, -1, -1):
+            node, idx = path[level]
+            if len(node.keys) < self.__order:
+                break
+
+            separator, new_node = self.__split(node)
+
+            if level == 0:
+                self.__root = BPlusTree._Internal([separator], [node, new_node])
+            else:
+                parent = path[level - 1][0]
+                parent.keys.insert(idx, separator)
+                parent.children.insert(idx + 1, new_node)
+
+    def delete(self, key: Any) -> None:
+        """Delete an item from the tree, fixing the nodes that underflow on the path up to the root by borrowing from
+        or merging with a sibling. Time complexity: O(logn).
+
+        :param key: the key of the item to be removed from the tree
+        """
+        path = self.__find_path(key)
+        leaf = path[-1][0]
+        idx = bisect.bisect_left(leaf.keys, key)
+
+        if idx == len(leaf.keys) or leaf.keys[idx] != key:
+            raise KeyError("key not present in tree")
+
+        del leaf.keys[idx]
+        del leaf.values[idx]
+        self.__length -= 1
+
+        for level in range(len(path) - 1, 0, -1):
+            node, idx = path[level]
+            if not self.__is_underflowing(node):
+                break
+
+            parent = path[level - 1][0]
+
+            if idx > 0 and self.__has_spare(parent.children[idx - 1]):
+                self.__borrow(parent, idx, from_left=True)
+            elif idx < len(parent.children) - 1 and self.__has_spare(
+                parent.children[idx + 1]
+            ):
+                self.__borrow(parent, idx, from_left=False)
+            elif idx > 0:
+                self.__merge(parent, idx - 1)
+            else:
+                self.__merge(parent, idx)
+
+        if isinstance(self.__root, BPlusTree._Internal) and len(self.__root.keys) == 0:
+            self.__root = self.__root.children[0]
+
+    def range(
+        self, low: Union[Any, None] = None, high: Union[Any, None] = None
+    ) -> Generator:
+        """Return a generator of the items whose keys are at least the lower bound and less than the upper bound, in
+        ascending order of their keys. The generator finds the first item with a single search, then walks along the
+        linked leaves. Time complexity: O(logn + k), where k is the number of items yielded.
+
+        :param low: the lower bound, or None for no lower bound
+        :param high: the upper bound, or None for no upper bound
+        :returns: a generator of (key, value) pairs
+        """
+        if low is None:
+            leaf = self.__root
+            while isinstance(leaf, BPlusTree._Internal):
+                leaf = leaf.children[0]
+            idx = 0
+        else:
+            leaf = self.__find_leaf(low)
+            idx = bisect.bisect_left(leaf.keys, low)
+
+        while leaf is not None:
+            keys = leaf.keys
+            end = len(keys) if high is None else bisect.bisect_left(keys, high, idx)
+
+            for i in range(idx, end):
+                yield keys[i], leaf.values[i]
+
+            if end < len(keys):
+                return
+
+            leaf = leaf.next
+            idx = 0
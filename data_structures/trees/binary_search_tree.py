@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Generator, Union
 
 from binary_tree import BinaryTree
 from tree import Empty, Tree
@@ -148,11 +148,109 @@ class BinarySearchTree(BinaryTree):
 
         >>> next(tree).get_data()
         (4, 400)
+
+    Get the rank of a key, and the key at some rank
+
+        >>> tree.rank(6)
+        2
+        >>> tree.select(0).get_data()
+        (4, 400)
+
+    Get the nearest keys to some key
+
+        >>> tree.floor(5.5).get_data()
+        (5, 500)
+        >>> tree.ceiling(5).get_data()
+        (5, 500)
+        >>> tree.predecessor(5).get_data()
+        (4, 400)
+        >>> tree.successor(6) is None
+        True
+
+    Get the positions of the keys within some range, from the lower bound up to but excluding the upper bound
+
+        >>> [i.get_data()[0] for i in tree.range_iter(4, 6)]
+        [4, 5]
+        >>> [i.get_data()[0] for i in tree.range_iter(5, None, reverse=True)]
+        [6, 5]
     """
 
     def __init__(self):
         super().__init__()
 
+    def _update_node(self, node: Tree._Node) -> None:
+        """Helper function to recompute the attributes a node caches about its subtree, such as its height, from the
+        attributes of its children. Called on each node whose children change during a rotation. Time complexity: O(1).
+
+        :param node: the node to update
+        """
+        pass
+
+    def _get_subtree_size(self, node: Union[Tree._Node, None]) -> int:
+        """Helper function to get the number of nodes in the subtree rooted at a node. Time complexity: O(n), or O(1) in
+        trees that cache the sizes of their subtrees.
+
+        :param node: the root of the subtree, or None
+        :returns: the number of nodes in the subtree, or 0 if the node is None
+        """
+        if node is None:
+            return 0
+
+        return (
+            1
+            + self._get_subtree_size(node.children[0])
+            + self._get_subtree_size(node.children[1])
+        )
+
+    def _rotate(self, node: Tree._Node) -> None:
+        """Helper function to rotate a node above its parent, such that the parent becomes its child. The in-order
+        arrangement of the keys is preserved. Time complexity: O(1).
+
+        :param node: the node to rotate, which must have a parent
+        """
+        parent = node.parent
+        grandparent = parent.parent
+
+        if node is parent.children[0]:
+            moved_node = node.children[1]
+            parent.children[0] = moved_node
+            node.children[1] = parent
+        else:
+            moved_node = node.children[0]
+            parent.children[1] = moved_node
+            node.children[0] = parent
+
+        if moved_node is not None:
+            moved_node.parent = parent
+
+        parent.parent = node
+        self._transplant(parent, node, grandparent)
+
+        self._update_node(parent)
+        self._update_node(node)
+
+    def _transplant(
+        self,
+        node: Tree._Node,
+        replacement: Union[Tree._Node, None],
+        parent: Union[Tree._Node, None],
+    ) -> None:
+        """Helper function to put a node, or None, in the place of a child of some parent. Time complexity: O(1).
+
+        :param node: the child to replace, which may already be detached from the parent
+        :param replacement: the node to put in the child's place, or None to remove the child
+        :param parent: the parent of the child, or None if the child is the root
+        """
+        if replacement is not None:
+            replacement.parent = parent
+
+        if parent is None:
+            self._root = replacement
+        elif parent.children[0] is node:
+            parent.children[0] = replacement
+        else:
+            parent.children[1] = replacement
+
     def insert(self, key, value):
         super().insert(key, value)
 
@@ -207,3 +305,174 @@ class BinarySearchTree(BinaryTree):
             return None
         else:
             return Tree._Position(self, current_node)
+
+    def __find_nearest(
+        self, key, below: bool, inclusive: bool
+    ) -> Union[BinaryTree._Position, None]:
+        """Helper function to find the position of the key nearest to the passed key on one side of it, following a
+        single path down from the root
+
+        :param key: the key to compare against, which doesn't need to be in the tree
+        :param below: True to find the largest key less than the passed key, False to find the smallest key greater
+            than it
+        :param inclusive: True to also accept a key equal to the passed key, else False
+        :returns: the position of the nearest key, or None if there's no such key
+        """
+        current_node = self._root
+        nearest_node = None
+
+        while current_node is not None:
+            if inclusive and key == current_node.key:
+                return Tree._Position(self, current_node)
+
+            if (current_node.key < key) if below else (current_node.key > key):
+                nearest_node = current_node
+                current_node = current_node.children[1 if below else 0]
+            else:
+                current_node = current_node.children[0 if below else 1]
+
+        return None if nearest_node is None else Tree._Position(self, nearest_node)
+
+    def floor(self, key) -> Union[BinaryTree._Position, None]:
+        """Return the position of the largest key that's less than or equal to the passed key. Time complexity: O(h),
+        where h is the height of the tree, which is O(logn) in balanced trees.
+
+        :param key: the key to compare against, which doesn't need to be in the tree
+        :returns: the position of the largest key not greater than the passed key, or None if there's no such key
+        """
+        return self.__find_nearest(key, below=True, inclusive=True)
+
+    def ceiling(self, key) -> Union[BinaryTree._Position, None]:
+        """Return the position of the smallest key that's greater than or equal to the passed key. Time complexity:
+        O(h), where h is the height of the tree, which is O(logn) in balanced trees.
+
+        :param key: the key to compare against, which doesn't need to be in the tree
+        :returns: the position of the smallest key not less than the passed key, or None if there's no such key
+        """
+        return self.__find_nearest(key, below=False, inclusive=True)
+
+    def predecessor(self, key) -> Union[BinaryTree._Position, None]:
+        """Return the position of the largest key that's less than the passed key. Time complexity: O(h), where h is
+        the height of the tree, which is O(logn) in balanced trees.
+
+        :param key: the key to compare against, which doesn't need to be in the tree
+        :returns: the position of the largest key less than the passed key, or None if there's no such key
+        """
+        return self.__find_nearest(key, below=True, inclusive=False)
+
+    def successor(self, key) -> Union[BinaryTree._Position, None]:
+        """Return the position of the smallest key that's greater than the passed key. Time complexity: O(h), where h
+        is the height of the tree, which is O(logn) in balanced trees.
+
+        :param key: the key to compare against, which doesn't need to be in the tree
+        :returns: the position of the smallest key greater than the passed key, or None if there's no such key
+        """
+        return self.__find_nearest(key, below=False, inclusive=False)
+
+    def range_iter(self, low=None, high=None, reverse: bool = False) -> Generator:
+        """Lazily in-order traverse the keys that are at least the lower bound and less than the upper bound, and
+        return a generator of their positions. Only the nodes on the paths to the bounds and the nodes within the
+        bounds are visited, using a stack of the nodes whose keys are yet to be yielded. Time complexity: O(h + k),
+        where h is the height of the tree and k is the number of positions yielded.
+
+        :param low: the lower bound, or None for no lower bound
+        :param high: the upper bound, or None for no upper bound
+        :param reverse: True to yield the positions in descending order of their keys, else False
+        :returns: a generator of the positions
+        """
+        near, far = (1, 0) if reverse else (0, 1)
+        stack = []
+        current_node = self._root
+
+        while current_node is not None:
+            if (
+                (high is None or current_node.key < high)
+                if reverse
+                else (low is None or current_node.key >= low)
+            ):
+                stack.append(current_node)
+                current_node = current_node.children[near]
+            else:
+                current_node = current_node.children[far]
+
+        while len(stack) > 0:
+            node = stack.pop()
+
+            if (
+                (low is not None and node.key < low)
+                if reverse
+                else (high is not None and node.key >= high)
+            ):
+                return
+
+            yield Tree._Position(self, node)
+
+            current_node = node.children[far]
+            while current_node is not None:
+                stack.append(current_node)
+                current_node = current_node.children[near]
+
+    def rank(self, key) -> int:
+        """Return the number of keys in the tree that are less than the passed key, which is the index the key has, or
+        would have, in an in-order traversal. Time complexity: O(logn) in trees that are balanced and cache the sizes
+        of their subtrees, such as AVL and red-black trees.
+
+        :param key: the key to rank, which doesn't need to be in the tree
+        :returns: the number of keys less than the key
+        """
+        current_node = self._root
+        count = 0
+
+        while current_node is not None:
+            if key > current_node.key:
+                count += 1 + self._get_subtree_size(current_node.children[0])
+                current_node = current_node.children[1]
+            else:
+                current_node = current_node.children[0]
+
+        return count
+
+    def select(self, index: int) -> BinaryTree._Position:
+        """Return the position of the key at the passed index of an in-order traversal, counting from 0. Time
+        complexity: O(logn) in trees that are balanced and cache the sizes of their subtrees, such as AVL and red-black
+        trees.
+
+        :param index: the index of the key, from 0 up to the length of the tree, exclusive
+        :returns: the position of the key
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range")
+
+        current_node = self._root
+
+        while True:
+            left_size = self._get_subtree_size(current_node.children[0])
+            if index < left_size:
+                current_node = current_node.children[0]
+            elif index > left_size:
+                index -= left_size + 1
+                current_node = current_node.children[1]
+            else:
+                return Tree._Position(self, current_node)
+
+    def nth_smallest(self, n: int) -> BinaryTree._Position:
+        """Return the position of the n-th smallest key, counting from 1. Time complexity: O(logn) in trees that are
+        balanced and cache the sizes of their subtrees, such as AVL and red-black trees.
+
+        :param n: the rank of the key, from 1 up to the length of the tree, inclusive
+        :returns: the position of the key
+        """
+        return self.select(n - 1)
+
+    def count_range(self, low=None, high=None) -> int:
+        """Return the number of keys that are at least the lower bound and less than the upper bound. Time complexity:
+        O(logn) in trees that are balanced and cache the sizes of their subtrees, such as AVL and red-black trees.
+
+        :param low: the lower bound, or None for no lower bound
+        :param high: the upper bound, or None for no upper bound
+        :returns: the number of keys within the bounds
+        """
+        low_rank = 0 if low is None else self.rank(low)
+        high_rank = len(self) if high is None else self.rank(high)
+
+        return max(high_rank - low_rank, 0)
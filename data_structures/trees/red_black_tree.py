@@ -0,0 +1,270 @@
+from binary_search_tree import BinarySearchTree
+from tree import Tree
+
+
+class RedBlackTree(BinarySearchTree):
+    """A red-black tree is a binary search tree that is balanced by colouring each node red or black, such that the
+    root is black, a red node has no red children, and every path from a node down to a missing child passes through
+    the same number of black nodes. The longest path from the root is therefore at most twice as long as the shortest
+    one, which ensures a worst case search time of O(logn).
+
+    Whenever an item is inserted or deleted, the colours of the nodes on the path up to the root are fixed, which
+    takes O(logn) time, using at most two rotations for an insertion and at most three for a deletion. Rebalancing
+    after a deletion is therefore cheaper than in an AVL tree, which may rotate at every level of the path. Each node
+    caches the number of nodes in its subtree, which is kept up to date through rotations, so ranking keys and
+    selecting keys by rank take O(logn) time.
+
+    Instantiate a red-black tree object
+
+        >>> tree = RedBlackTree()
+
+    Insert an item to the tree
+
+        >>> for key in range(1, 8):
+        ...     tree.insert(key, key * 100)
+
+    Check if a tree is empty
+
+        >>> tree.is_empty()
+        False
+        >>> RedBlackTree().is_empty()
+        True
+
+    Get root position
+
+        >>> root = tree.get_root()
+        >>> root.get_data()
+        (2, 200)
+
+    Get children of some position
+
+        >>> [i.get_data() for i in tree.get_children(root)]
+        [(1, 100), (4, 400)]
+
+    Check if a node is red
+
+        >>> tree.is_red(root)
+        False
+        >>> tree.is_red(tree.search(4))
+        True
+
+    Search for a key
+
+        >>> tree.search(5).get_data()
+        (5, 500)
+        >>> tree.search(10) is None
+        True
+
+    In-order traverse the tree
+
+        >>> [i.get_data()[0] for i in tree.traverse_tree_in_order()]
+        [1, 2, 3, 4, 5, 6, 7]
+
+    Delete an item from the tree
+
+        >>> tree.delete(tree.search(1))
+        >>> tree.delete(tree.search(2))
+
+    Get length of tree
+
+        >>> len(tree)
+        5
+
+    Get string reresentation of tree
+
+        >>> tree
+        4(3, 6(5, 7))
+
+    Get the rank of a key, the key at some rank, and the number of keys within some range
+
+        >>> tree.rank(5)
+        2
+        >>> tree.select(4).get_data()
+        (7, 700)
+        >>> tree.nth_smallest(1).get_data()
+        (3, 300)
+        >>> tree.count_range(4, None)
+        4
+    """
+
+    class _RedBlackNode(Tree._Node):
+        def __init__(self, key, value, parent=None):
+            super().__init__(key, value, parent, [None, None])
+            self.red = True
+            self.size = 1
+
+    def __init__(self):
+        super().__init__()
+
+    @staticmethod
+    def __is_red(node) -> bool:
+        """Helper function to check if a node is red, treating missing children as black. Time complexity: O(1).
+
+        :param node: the node, or None
+        :returns: True if the node is red, else False
+        """
+        return node is not None and node.red
+
+    def __fix_insertion(self, node) -> None:
+        """Helper function to restore the colouring rules after inserting a red node, by recolouring its ancestors
+        while its uncle is red, and otherwise rotating. Time complexity: O(logn).
+
+        :param node: the inserted node
+        """
+        while RedBlackTree.__is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+            is_left = parent is grandparent.children[0]
+            uncle = grandparent.children[1 if is_left else 0]
+
+            if RedBlackTree.__is_red(uncle):
+                parent.red = False
+                uncle.red = False
+                grandparent.red = True
+                node = grandparent
+            else:
+                if node is parent.children[1 if is_left else 0]:
+                    self._rotate(node)
+                    parent = node
+
+                self._rotate(parent)
+                parent.red = False
+                grandparent.red = True
+                break
+
+        self._root.red = False
+
+    def __fix_deletion(self, node, parent) -> None:
+        """Helper function to restore the colouring rules after removing a black node, whose place is taken by a node
+        that's short of one black node on its paths. Time complexity: O(logn).
+
+        :param node: the node that took the removed node's place, or None
+        :param parent: the parent of that place
+        """
+        while node is not self._root and not RedBlackTree.__is_red(node):
+            is_left = node is parent.children[0]
+            sibling = parent.children[1 if is_left else 0]
+
+            if sibling.red:
+                sibling.red = False
+                parent.red = True
+                self._rotate(sibling)
+                sibling = parent.children[1 if is_left else 0]
+
+            near_nephew = sibling.children[0 if is_left else 1]
+            far_nephew = sibling.children[1 if is_left else 0]
+
+            if not RedBlackTree.__is_red(near_nephew) and not RedBlackTree.__is_red(
+                far_nephew
+            ):
+                sibling.red = True
+                node = parent
+                parent = node.parent
+            else:
+                if not RedBlackTree.__is_red(far_nephew):
+                    near_nephew.red = False
+                    sibling.red = True
+                    self._rotate(near_nephew)
+                    far_nephew = sibling
+                    sibling = near_nephew
+
+                sibling.red = parent.red
+                parent.red = False
+                far_nephew.red = False
+                self._rotate(sibling)
+                node = self._root
+
+        if node is not None:
+            node.red = False
+
+    def _update_node(self, node):
+        node.size = (
+            1
+            + self._get_subtree_size(node.children[0])
+            + self._get_subtree_size(node.children[1])
+        )
+
+    def _get_subtree_size(self, node):
+        return 0 if node is None else node.size
+
+    def is_red(self, position: Tree._Position) -> bool:
+        """Check if the node contained in the passed position is red. Time complexity: O(1).
+
+        :param position: position containing the node whose colour is being sought
+        :returns: True if the node is red, else False if it's black
+        """
+        if not position.is_owned_by(self):
+            raise ValueError("Position doesn't belong to this tree")
+
+        return position.manipulate_node(self, "_validate_node").red
+
+    def delete(self, position: Tree._Position):
+        if not position.is_owned_by(self):
+            raise ValueError("Position doesn't belong to this tree")
+
+        node = position.manipulate_node(self, "_validate_node")
+        _ = position.manipulate_variables(self, "_invalidate_position")
+        self._length -= 1
+
+        left_child, right_child = node.children
+
+        if left_child is None or right_child is None:
+            removed_red = node.red
+            replacement = right_child if left_child is None else left_child
+            replacement_parent = node.parent
+            self._transplant(node, replacement, node.parent)
+        else:
+            successor = right_child
+            while successor.children[0] is not None:
+                successor = successor.children[0]
+
+            removed_red = successor.red
+            replacement = successor.children[1]
+
+            if successor is right_child:
+                replacement_parent = successor
+            else:
+                replacement_parent = successor.parent
+                self._transplant(successor, replacement, successor.parent)
+                successor.children[1] = right_child
+                right_child.parent = successor
+
+            successor.children[0] = left_child
+            left_child.parent = successor
+            self._transplant(node, successor, node.parent)
+            successor.red = node.red
+
+        ancestor = replacement_parent
+        while ancestor is not None:
+            self._update_node(ancestor)
+            ancestor = ancestor.parent
+
+        if not removed_red:
+            self.__fix_deletion(replacement, replacement_parent)
+
+    def insert(self, key, value):
+        parent = None
+        current_node = self._root
+
+        while current_node is not None:
+            if key == current_node.key:
+                raise ValueError("Key already exists in tree")
+            parent = current_node
+            current_node = current_node.children[1 if key > current_node.key else 0]
+
+        self._length += 1
+        node = RedBlackTree._RedBlackNode(key, value, parent)
+
+        if parent is None:
+            self._root = node
+        elif key > parent.key:
+            parent.children[1] = node
+        else:
+            parent.children[0] = node
+
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
+
+        self.__fix_insertion(node)